@@ -1,5 +1,28 @@
+import gc
+import math
+import multiprocessing
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
 import time
-from typing import Callable
+import tracemalloc
+from contextlib import nullcontext
+from functools import partial
+from multiprocessing.connection import wait
+from typing import Any, Callable, Mapping, Sequence, TypedDict
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - нет на Windows
+    resource = None  # type: ignore[assignment]
+
+from src.data_structures import MinMaxQueue, MonotonicDeque, Queue, Stack, sliding_window_min
+from src.latency import latency_summary
+from src.sequences import factorial, factorial_fast, factorial_prime_swing, factorial_recursive
+from src.sort_cache import caching_disabled
 
 
 def timeit_once(func: Callable, *args, **kwargs) -> float:
@@ -12,13 +35,289 @@ def timeit_once(func: Callable, *args, **kwargs) -> float:
     return end - start
 
 
+def timer_overhead(repeats: int = 1000, clock: Callable[[], float] = time.perf_counter) -> float:
+    """
+    Медианная стоимость пары вызовов clock (по умолчанию perf_counter), вычитается из каждого замера.
+    """
+    deltas = []
+    for repeat in range(repeats):
+        start = clock()
+        deltas.append(clock() - start)
+    return statistics.median(deltas)
+
+
+def _quartiles(sorted_values: list[float]) -> tuple[float, float]:
+    quartiles = statistics.quantiles(sorted_values, n=4, method="inclusive")
+    return quartiles[0], quartiles[2]
+
+
+def summarize(times: list[float], outlier_k: float | None = 1.5) -> dict:
+    """
+    Статистика по замерам: выбросы за границами Тьюки (Q1 - k·IQR, Q3 + k·IQR) отбрасываются.
+    """
+    if not times:
+        raise ValueError("Нет замеров для статистики")
+    kept = sorted(times)
+    if outlier_k is not None and len(kept) >= 4:
+        first, third = _quartiles(kept)
+        spread = third - first
+        kept = [value for value in kept if first - outlier_k * spread <= value <= third + outlier_k * spread]
+    first, third = _quartiles(kept) if len(kept) >= 2 else (kept[0], kept[0])
+    return {
+        "min": kept[0],
+        "median": statistics.median(kept),
+        "mean": statistics.fmean(kept),
+        "iqr": third - first,
+        "stdev": statistics.stdev(kept) if len(kept) >= 2 else 0.0,
+        "samples": len(kept),
+        "outliers": len(times) - len(kept),
+        "times": kept,
+    }
+
+
+def measure(
+    func: Callable[[list], object],
+    data: Sequence,
+    *,
+    runs: int | None = None,
+    samples: int = 7,
+    warmup: int = 1,
+    target_time: float = 0.01,
+    max_loops: int = 1_000_000,
+    gc_control: bool = True,
+    outlier_k: float | None = 1.5,
+    sort_cache: bool = False,
+) -> dict:
+    """
+    Замер времени одного вызова func на копии data. Сначала warmup прогревочных вызовов,
+    затем (если runs не задан) подбирается число вызовов в одном замере так, чтобы замер
+    длился не меньше target_time. Копии входа готовятся заранее, вызовы идут пачкой внутри
+    одного интервала perf_counter, стоимость самого таймера вычитается. Перед замерами
+    выполняется gc.collect, а на время замера сборщик мусора отключается (gc_control). Кэши
+    результатов сортировок (src/sort_cache.py) на время замера выключены, если не передан
+    sort_cache=True. Возвращает summarize(...) плюс число вызовов loops.
+    """
+    if runs is not None and runs < 1:
+        raise ValueError("runs должно быть не меньше 1")
+    if samples < 1:
+        raise ValueError("samples должно быть не меньше 1")
+    overhead = timer_overhead()
+
+    def timed_batch(loops: int) -> float:
+        copies = [list(data) for copy in range(loops)]
+        gc_was_enabled = gc.isenabled()
+        if gc_control:
+            gc.disable()
+        try:
+            start = time.perf_counter()
+            for values in copies:
+                func(values)
+            elapsed = time.perf_counter() - start
+        finally:
+            if gc_control and gc_was_enabled:
+                gc.enable()
+        return max(elapsed - overhead, 0.0)
+
+    with nullcontext() if sort_cache else caching_disabled():
+        for warm in range(warmup):
+            func(list(data))
+
+        loops = runs
+        if loops is None:
+            loops = 1
+            while loops < max_loops and timed_batch(loops) < target_time:
+                loops = min(loops * 2, max_loops)
+
+        if gc_control:
+            gc.collect()
+        times = [timed_batch(loops) / loops for sample in range(samples)]
+        result = summarize(times, outlier_k)
+        result["loops"] = loops
+        return result
+
+
+def measure_memory(func: Callable, values: Sequence) -> dict:
+    """
+    Память одного вызова func(values) по tracemalloc: пик выделенного сверх исходного уровня
+    (peak_bytes), число блоков, оставшихся после вызова вместе с результатом (net_blocks),
+    и пик в пересчете на элемент входа (bytes_per_element).
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func(values)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        if started:
+            tracemalloc.stop()
+    own = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    net_blocks = sum(
+        stat.count_diff for stat in after.filter_traces(own).compare_to(before.filter_traces(own), "filename")
+    )
+    peak_bytes = max(peak - baseline, 0)
+    return {
+        "peak_bytes": peak_bytes,
+        "net_blocks": net_blocks,
+        "bytes_per_element": peak_bytes / len(values) if len(values) else 0.0,
+    }
+
+
+def measure_cell(func: Callable, values: Sequence, *, memory: bool = False, **options: Any) -> dict:
+    """measure и, при memory, отдельный прогон measure_memory: статистика времени и памяти в одном словаре."""
+    stats = measure(func, values, **options)
+    if memory:
+        with nullcontext() if options.get("sort_cache") else caching_disabled():
+            stats.update(measure_memory(func, values))
+    return stats
+
+
+def run_benchmark(
+    arrays: Mapping[str, Sequence],
+    algos: Mapping[str, Callable[..., list]],
+    **options: Any,
+) -> dict[str, dict[str, dict | Exception]]:
+    """
+    Прогоняет measure для каждой пары (набор, алгоритм). Если алгоритм не поддерживает набор,
+    вместо статистики сохраняется исключение. options передаются в measure_cell
+    (memory=True добавляет статистику памяти).
+    """
+    results: dict[str, dict[str, dict | Exception]] = {}
+    for array_name, array_values in arrays.items():
+        results[array_name] = {}
+        for algo_name, algo in algos.items():
+            try:
+                results[array_name][algo_name] = measure_cell(algo, array_values, **options)
+            except Exception as exc:
+                results[array_name][algo_name] = exc
+    return results
+
+
+def _isolated_cell(
+    connection,
+    algo: Callable[[list], list],
+    values: Sequence,
+    cpu: int | None,
+    memory_limit: int | None,
+    options: dict,
+) -> None:
+    """Тело процесса-воркера: ограничения, привязка к ядру, один measure_cell, результат в pipe."""
+    try:
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        if memory_limit is not None:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        outcome: dict | Exception = measure_cell(algo, values, **options)
+    except MemoryError:
+        outcome = MemoryError(f"превышен лимит памяти {memory_limit} байт")
+    except Exception as exc:
+        outcome = exc
+    try:
+        connection.send(outcome)
+    except Exception as exc:
+        connection.send(RuntimeError(f"не удалось передать результат: {exc!r}"))
+    connection.close()
+
+
+def available_cpus() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def run_isolated(
+    arrays: Mapping[str, Sequence],
+    algos: Mapping[str, Callable[..., list]],
+    *,
+    workers: int | None = None,
+    timeout: float | None = None,
+    memory_limit: int | None = None,
+    pin_cpus: bool = False,
+    **options: Any,
+) -> dict[str, dict[str, dict | Exception]]:
+    """
+    То же, что run_benchmark, но каждая пара (набор, алгоритм) замеряется в отдельном свежем
+    процессе, так что GC, фрагментация кучи и кэши одного алгоритма не влияют на другой.
+    Одновременно работает до workers процессов (по умолчанию – число доступных ядер);
+    pin_cpus привязывает каждый процесс к своему ядру. Ячейка, не уложившаяся в timeout
+    секунд, завершается с TimeoutError; memory_limit (байты, RLIMIT_AS) превращает
+    переполнение в MemoryError. Результат имеет ту же структуру, что у run_benchmark.
+    """
+    cpus = available_cpus()
+    if workers is None:
+        workers = len(cpus)
+    if workers < 1:
+        raise ValueError("workers должно быть не меньше 1")
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout должен быть положительным")
+    if memory_limit is not None and (memory_limit < 1 or resource is None):
+        raise ValueError("memory_limit должен быть положительным и поддерживаться платформой")
+    if pin_cpus and not hasattr(os, "sched_setaffinity"):
+        raise ValueError("Привязка к ядрам не поддерживается платформой")
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork") if "fork" in methods else multiprocessing.get_context("spawn")
+    copy_inputs = context.get_start_method() != "fork"
+
+    pending = [(name, algo_name) for name in arrays for algo_name in algos]
+    pending.reverse()
+    results: dict[str, dict[str, dict | Exception]] = {name: {} for name in arrays}
+    free_cpus = list(cpus)
+    running: dict = {}
+    while pending or running:
+        while pending and len(running) < workers:
+            array_name, algo_name = pending.pop()
+            cpu = free_cpus.pop(0) if pin_cpus and free_cpus else None
+            receiver, sender = context.Pipe(duplex=False)
+            values = arrays[array_name]
+            process = context.Process(
+                target=_isolated_cell,
+                args=(sender, algos[algo_name], list(values) if copy_inputs else values, cpu, memory_limit, options),
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            running[receiver] = (array_name, algo_name, process, cpu, deadline)
+
+        deadlines = [entry[4] for entry in running.values() if entry[4] is not None]
+        wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+        ready = wait(list(running), timeout=wait_for)
+        now = time.monotonic()
+        for receiver in list(running):
+            array_name, algo_name, process, cpu, deadline = running[receiver]
+            if receiver in ready:
+                try:
+                    outcome = receiver.recv()
+                except EOFError:
+                    process.join()
+                    outcome = RuntimeError(f"процесс завершился без результата (код {process.exitcode})")
+            elif deadline is not None and now >= deadline:
+                process.kill()
+                outcome = TimeoutError(f"превышено время {timeout} с")
+            else:
+                continue
+            process.join()
+            receiver.close()
+            del running[receiver]
+            if cpu is not None:
+                free_cpus.append(cpu)
+            results[array_name][algo_name] = outcome
+    return {name: {algo_name: results[name][algo_name] for algo_name in algos} for name in arrays}
+
+
 def benchmark_sorts(
-    arrays: dict[str, list],
+    arrays: dict[str, Sequence],
     algos: dict[str, Callable[[list], list]],
     runs: int = 1,
 ) -> dict[str, dict[str, float]]:
     """
-    Бенчмарк выбранных алгоритмов сортировки на наборе входных массивов.
+    Бенчмарк выбранных алгоритмов сортировки на наборе входных массивов:
+    медианное время одного вызова (секунды), runs вызовов в каждом замере.
     """
     if runs < 1:
         raise ValueError("runs должно быть не меньше 1")
@@ -27,9 +326,450 @@ def benchmark_sorts(
     for array_name, array_values in arrays.items():
         results[array_name] = {}
         for algo_name, algo in algos.items():
-            total = 0.0
+            results[array_name][algo_name] = measure(algo, array_values, runs=runs, samples=3)["median"]
+    return results
+
+
+def naive_sliding_window_min(values: list, w: int) -> list:
+    """
+    Наивный минимум по окнам за O(n·w): каждое окно просматривается заново.
+    """
+    return [min(values[start:start + w]) for start in range(len(values) - w + 1)]
+
+
+def benchmark_sliding_window(values: list, w: int, runs: int = 1) -> dict[str, float]:
+    """
+    Сравнивает наивный минимум по окнам с монотонным деком и очередью на двух стеках.
+    Возвращает среднее время одного прогона в секундах.
+    """
+    if runs < 1:
+        raise ValueError("runs должно быть не меньше 1")
+
+    def with_min_max_queue(data: list) -> list:
+        queue = MinMaxQueue()
+        minimums = []
+        for value in data:
+            queue.enqueue(value)
+            if len(queue) > w:
+                queue.dequeue()
+            if len(queue) == w:
+                minimums.append(queue.min())
+        return minimums
+
+    candidates = {
+        "naive": lambda data: naive_sliding_window_min(data, w),
+        "monotonic_deque": lambda data: list(sliding_window_min(data, w)),
+        "min_max_queue": with_min_max_queue,
+    }
+    results = {}
+    for name, func in candidates.items():
+        total = 0.0
+        for run in range(runs):
+            total += timeit_once(func, values)
+        results[name] = total / runs
+    return results
+
+
+def benchmark_factorials(n: int, runs: int = 1, workers: int | None = None) -> dict[str, float | None]:
+    """
+    Сравнивает реализации факториала на одном n. Рекурсивная версия замеряется с холодным кэшем;
+    если она не укладывается в лимит рекурсии, вместо времени возвращается None.
+    """
+    if runs < 1:
+        raise ValueError("runs должно быть не меньше 1")
+
+    candidates: dict[str, Callable[[int], int]] = {
+        "factorial": factorial,
+        "factorial_recursive": factorial_recursive,
+        "factorial_fast": factorial_fast,
+        "factorial_prime_swing": factorial_prime_swing,
+    }
+    if workers is not None and workers > 1:
+        candidates["factorial_fast_parallel"] = partial(factorial_fast, workers=workers)
+
+    results: dict[str, float | None] = {}
+    for name, func in candidates.items():
+        total = 0.0
+        try:
             for run in range(runs):
-                # Копируем вход, чтобы алгоритм не изменил исходные данные.
-                total += timeit_once(algo, array_values.copy())
-            results[array_name][algo_name] = total / runs
+                if func is factorial_recursive:
+                    factorial_recursive.cache_clear()
+                total += timeit_once(func, n)
+        except RecursionError:
+            results[name] = None
+            continue
+        results[name] = total / runs
+    return results
+
+
+# Ожидаемый эмпирический показатель степени t ~ n**k для сортировок без cmp.
+EXPECTED_EXPONENTS = {
+    "bubble": 2.0,
+    "quick": 1.15,
+    "heap": 1.15,
+    "counting": 1.0,
+    "radix": 1.05,
+    "bucket": 1.1,
+}
+
+
+def geometric_sizes(min_exp: int = 4, max_exp: int = 24, base: int = 2) -> list[int]:
+    """Размеры base**min_exp, ..., base**max_exp."""
+    if min_exp < 0 or max_exp < min_exp:
+        raise ValueError("Ошибка: нужно 0 <= min_exp <= max_exp")
+    if base < 2:
+        raise ValueError("Основание должно быть не меньше 2")
+    return [base**exponent for exponent in range(min_exp, max_exp + 1)]
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> tuple[float, float]:
+    """
+    Метод наименьших квадратов в координатах log n / log t: возвращает (показатель, свободный член).
+    """
+    points = [(math.log(size), math.log(seconds)) for size, seconds in zip(sizes, times) if size > 0 and seconds > 0]
+    if len(points) < 2:
+        raise ValueError("Для оценки показателя нужно хотя бы две точки")
+    mean_x = statistics.fmean(x for x, y in points)
+    mean_y = statistics.fmean(y for x, y in points)
+    spread = sum((x - mean_x) ** 2 for x, y in points)
+    if spread == 0:
+        raise ValueError("Для оценки показателя нужны разные размеры")
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+    return slope, mean_y - slope * mean_x
+
+
+class SweepCell(TypedDict):
+    """Ячейка sweep для пары генератор/алгоритм."""
+
+    sizes: list[int]
+    medians: list[float]
+    stopped_at: int | None
+    error: str | None
+    exponent: float | None
+    expected: float | None
+    flagged: bool
+
+
+def sweep(
+    generators: Mapping[str, Callable[[int], Sequence]],
+    algos: Mapping[str, Callable[..., list]],
+    sizes: list[int],
+    *,
+    time_budget: float = 1.0,
+    expected: dict[str, float] | None = None,
+    tolerance: float = 0.3,
+    **options: Any,
+) -> dict[str, dict[str, SweepCell]]:
+    """
+    Прогон по размерам для каждого генератора и алгоритма. Алгоритм выбывает, как только
+    медиана одного вызова превысила time_budget или прогноз по двум последним точкам
+    обещает превышение на следующем размере. По каждой паре считается показатель степени
+    и флаг flagged, если он больше ожидаемого (expected) более чем на tolerance. Ошибка
+    генератора на каком-то размере записывается в error всех еще активных алгоритмов.
+    options передаются в measure.
+    """
+    expected = EXPECTED_EXPONENTS if expected is None else expected
+    results: dict[str, dict[str, SweepCell]] = {}
+    for generator_name, generate in generators.items():
+        active = dict(algos)
+        cells: dict[str, SweepCell] = {
+            name: {
+                "sizes": [],
+                "medians": [],
+                "stopped_at": None,
+                "error": None,
+                "exponent": None,
+                "expected": expected.get(name),
+                "flagged": False,
+            }
+            for name in algos
+        }
+        for size in sizes:
+            if not active:
+                break
+            try:
+                data = generate(size)
+            except Exception as exc:
+                for algo_name in active:
+                    cells[algo_name]["error"] = f"{type(exc).__name__}: {exc}"
+                    cells[algo_name]["stopped_at"] = size
+                break
+            for algo_name, algo in list(active.items()):
+                cell = cells[algo_name]
+                if len(cell["sizes"]) >= 2:
+                    growth = 1.0
+                    if cell["medians"][-2] > 0 and cell["medians"][-1] > 0:
+                        growth = math.log(cell["medians"][-1] / cell["medians"][-2]) / math.log(
+                            cell["sizes"][-1] / cell["sizes"][-2]
+                        )
+                    predicted = cell["medians"][-1] * (size / cell["sizes"][-1]) ** max(growth, 1.0)
+                    if predicted > time_budget:
+                        cell["stopped_at"] = size
+                        del active[algo_name]
+                        continue
+                try:
+                    stats = measure(algo, data, **options)
+                except Exception as exc:
+                    cell["error"] = f"{type(exc).__name__}: {exc}"
+                    cell["stopped_at"] = size
+                    del active[algo_name]
+                    continue
+                cell["sizes"].append(size)
+                cell["medians"].append(stats["median"])
+                if stats["median"] > time_budget:
+                    cell["stopped_at"] = size
+                    del active[algo_name]
+        for cell in cells.values():
+            try:
+                cell["exponent"] = fit_exponent(cell["sizes"], cell["medians"])[0]
+            except ValueError:
+                cell["exponent"] = None
+            exponent, limit = cell["exponent"], cell["expected"]
+            cell["flagged"] = exponent is not None and limit is not None and exponent > limit + tolerance
+        results[generator_name] = cells
+    return results
+
+
+def find_crossovers(cells: Mapping[str, SweepCell]) -> list[tuple[str, str, float]]:
+    """
+    Пары алгоритмов, которые меняются местами по скорости между соседними размерами.
+    Возвращает (быстрый на малых n, быстрый на больших n, оценка n пересечения
+    по линейной интерполяции в log-log координатах).
+    """
+    crossovers = []
+    names = sorted(cells)
+    for position, first in enumerate(names):
+        for second in names[position + 1 :]:
+            first_times = dict(zip(cells[first]["sizes"], cells[first]["medians"]))
+            second_times = dict(zip(cells[second]["sizes"], cells[second]["medians"]))
+            common = sorted(size for size in first_times if size in second_times)
+            for left, right in zip(common, common[1:]):
+                if min(first_times[left], first_times[right], second_times[left], second_times[right]) <= 0:
+                    continue
+                before = math.log(first_times[left] / second_times[left])
+                after = math.log(first_times[right] / second_times[right])
+                if before * after < 0:
+                    share = before / (before - after)
+                    size = math.exp(math.log(left) + share * (math.log(right) - math.log(left)))
+                    winner_small, winner_large = (first, second) if before < 0 else (second, first)
+                    crossovers.append((winner_small, winner_large, size))
+    return sorted(crossovers, key=lambda crossover: crossover[2])
+
+
+# Обобщенные операции трасс и их имена у конкретных структур (None – не поддерживается).
+DS_STRUCTURES: dict[str, tuple[Callable[[], object], dict[str, str | None]]] = {
+    "stack": (Stack, {"push": "push", "pop": "pop", "peek": "peek", "min": "min"}),
+    "queue": (Queue, {"push": "enqueue", "pop": "dequeue", "peek": "front", "min": None}),
+    "minmax_queue": (MinMaxQueue, {"push": "enqueue", "pop": "dequeue", "peek": "front", "min": "min"}),
+    "monotonic_deque": (MonotonicDeque, {"push": "enqueue", "pop": "dequeue", "peek": "front", "min": "min"}),
+}
+DS_TRACES = ("push_heavy", "alternating", "burst_drain", "min_queries")
+
+
+def make_trace(name: str, n: int, *, seed: int = 0, burst: int = 1000) -> list[tuple[str, int | None]]:
+    """
+    Трасса из n обобщенных операций (push с аргументом, pop/peek/min без него), никогда
+    не извлекающая из пустой структуры:
+    push_heavy – 90% push и 10% pop; alternating – push/pop по очереди; burst_drain – пачки
+    по burst push с полным опустошением; min_queries – 40% push, 20% pop, 40% min.
+    """
+    if name not in DS_TRACES:
+        raise ValueError(f"Неизвестная трасса: {name}")
+    if n < 0 or burst < 1:
+        raise ValueError("n должно быть неотрицательным, burst – положительным")
+    generator = random.Random(seed)
+    trace: list[tuple[str, int | None]] = []
+    size = 0
+    while len(trace) < n:
+        if name == "burst_drain":
+            count = min(burst, n - len(trace))
+            trace.extend(("push", generator.randint(-10**6, 10**6)) for _ in range(count))
+            size += count
+            drain = min(size, n - len(trace))
+            trace.extend(("pop", None) for _ in range(drain))
+            size -= drain
+            continue
+        if name == "alternating":
+            op = "push" if size == 0 else "pop"
+        else:
+            roll = generator.random()
+            if name == "push_heavy":
+                op = "push" if roll < 0.9 or size == 0 else "pop"
+            else:
+                op = "push" if roll < 0.4 or size == 0 else ("pop" if roll < 0.6 else "min")
+        if op == "push":
+            trace.append(("push", generator.randint(-10**6, 10**6)))
+            size += 1
+        else:
+            trace.append((op, None))
+            size -= op == "pop"
+    return trace
+
+
+def _bind_trace(structure: object, operations: dict[str, str | None], trace: list) -> list[tuple[Callable, tuple]]:
+    bound = {}
+    for op, method in operations.items():
+        if method is not None:
+            bound[op] = getattr(structure, method)
+    missing = sorted({op for op, _ in trace} - set(bound))
+    if missing:
+        raise ValueError(f"Операции не поддерживаются: {', '.join(missing)}")
+    return [(bound[op], () if value is None else (value,)) for op, value in trace]
+
+
+def run_trace(factory: Callable[[], object], operations: dict[str, str | None], trace: list) -> object:
+    """Выполняет трассу на новой структуре и возвращает ее."""
+    structure = factory()
+    for method, args in _bind_trace(structure, operations, trace):
+        method(*args)
+    return structure
+
+
+def trace_latencies(factory: Callable[[], object], operations: dict[str, str | None], trace: list) -> dict:
+    """
+    Задержка каждой операции трассы отдельно (perf_counter_ns минус стоимость таймера):
+    p50/p90/p99/max в наносекундах по видам операций.
+    """
+    structure = factory()
+    calls = _bind_trace(structure, operations, trace)
+    clock = time.perf_counter_ns
+    overhead = timer_overhead(clock=clock)
+    samples: dict[str, list[float]] = {}
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for (op, _), (method, args) in zip(trace, calls):
+            start = clock()
+            method(*args)
+            samples.setdefault(op, []).append(max(clock() - start - overhead, 0))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {op: latency_summary(values) for op, values in samples.items()}
+
+
+def structure_memory(factory: Callable[[], object], operations: dict[str, str | None], n: int = 10000) -> float:
+    """Байт на элемент (tracemalloc) после n push в новую структуру; сами значения заранее созданы."""
+    values = [10**6 + index for index in range(n)]
+    push = operations["push"]
+    if push is None:
+        raise ValueError("Операции не поддерживаются: push")
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        structure = factory()
+        method = getattr(structure, push)
+        for value in values:
+            method(value)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return (after - before) / n if n else 0.0
+
+
+def benchmark_structures(
+    traces: dict[str, list],
+    structures: dict[str, tuple[Callable[[], object], dict[str, str | None]]] | None = None,
+    *,
+    latencies: bool = True,
+    memory_elements: int = 10000,
+    **options: Any,
+) -> dict[str, dict]:
+    """
+    Бенчмарк структур данных на трассах операций. Для каждой структуры – bytes_per_element
+    и по трассе: ops_per_sec (по медиане measure), median (с на всю трассу) и задержки по
+    видам операций (нс). Неподдерживаемые трассы сохраняются как исключение. options – в measure.
+    """
+    structures = DS_STRUCTURES if structures is None else structures
+    results: dict[str, dict] = {}
+    for name, (factory, operations) in structures.items():
+        cells: dict[str, dict | Exception] = {}
+        for trace_name, trace in traces.items():
+            try:
+                _bind_trace(factory(), operations, trace)
+            except ValueError as exc:
+                cells[trace_name] = exc
+                continue
+            stats = measure(partial(run_trace, factory, operations), trace, **options)
+            cell = {
+                "ops": len(trace),
+                "median": stats["median"],
+                "ops_per_sec": len(trace) / stats["median"] if stats["median"] > 0 else math.inf,
+            }
+            if latencies:
+                cell["latency_ns"] = trace_latencies(factory, operations, trace)
+            cells[trace_name] = cell
+        results[name] = {
+            "bytes_per_element": structure_memory(factory, operations, memory_elements),
+            "traces": cells,
+        }
     return results
+
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """
+    Разбирает вывод python -X importtime: модуль, собственное и накопленное время (мкс)
+    и глубина вложенности (0 – импорт верхнего уровня).
+    """
+    records = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            own, cumulative, indent, module = match.groups()
+            records.append(
+                {"module": module, "self": int(own), "cumulative": int(cumulative), "depth": (len(indent) - 1) // 2}
+            )
+    return records
+
+
+def _importtime_run(command: list[str], cwd: str | None) -> tuple[float, list[dict]]:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *command], capture_output=True, text=True, cwd=cwd
+    )
+    elapsed = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"команда завершилась с кодом {completed.returncode}: {completed.stderr[-500:]}")
+    return elapsed, parse_importtime(completed.stderr)
+
+
+def measure_startup(
+    args: list[str],
+    *,
+    module: str = "src.main",
+    repeats: int = 5,
+    cwd: str | None = None,
+) -> dict:
+    """
+    Стоимость запуска python -m module args: лучшее время запуска процесса (wall, с), импорт
+    верхнего уровня по модулям (imports, мкс – минимум по повторам) без модулей, которые
+    интерпретатор грузит и для пустой программы, их сумма (total_import, мкс) и все
+    загруженные сверх пустой программы модули любой вложенности (modules).
+    """
+    if repeats < 1:
+        raise ValueError("repeats должно быть не меньше 1")
+    _, baseline = _importtime_run(["-c", "pass"], cwd)
+    interpreter_modules = {record["module"] for record in baseline}
+    wall = math.inf
+    imports: dict[str, int] = {}
+    modules: set[str] = set()
+    for _ in range(repeats):
+        elapsed, records = _importtime_run(["-m", module, *args], cwd)
+        wall = min(wall, elapsed)
+        modules.update(record["module"] for record in records if record["module"] not in interpreter_modules)
+        for record in records:
+            if record["depth"] == 0 and record["module"] not in interpreter_modules:
+                previous = imports.get(record["module"])
+                imports[record["module"]] = record["cumulative"] if previous is None else min(previous, record["cumulative"])
+    return {
+        "wall": wall,
+        "imports": dict(sorted(imports.items(), key=lambda item: item[1], reverse=True)),
+        "total_import": sum(imports.values()),
+        "modules": sorted(modules),
+    }
@@ -1,12 +1,23 @@
+import operator
+from collections import deque
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+from src.sorting import compare
+
+T = TypeVar("T")
+
+
 class Node:
     def __init__(self, value, next_node):
         self.value = value
         self.next = next_node
+        self.current_min = value
+        self.current_max = value
 
 
 class Stack:
     """
-    Стек на односвязном списке с поддержкой получения минимума за O(1).
+    Стек на односвязном списке с поддержкой получения минимума и максимума за O(1).
     """
 
     def __init__(self) -> None:
@@ -15,8 +26,10 @@ class Stack:
 
     def push(self, x: int) -> None:
         current_min = x if self.top is None else min(x, self.top.current_min)
+        current_max = x if self.top is None else max(x, self.top.current_max)
         node = Node(x, self.top)
         node.current_min = current_min
+        node.current_max = current_max
         self.top = node
         self.size += 1
 
@@ -38,6 +51,11 @@ class Stack:
             raise IndexError("Ошибка: min из пустого стека")
         return self.top.current_min
 
+    def max(self) -> int:
+        if self.top is None:
+            raise IndexError("Ошибка: max из пустого стека")
+        return self.top.current_max
+
     def is_empty(self) -> bool:
         return self.top is None
 
@@ -85,3 +103,444 @@ class Queue:
 
     def __len__(self) -> int:
         return self.size
+
+
+class MinMaxQueue:
+    """
+    Очередь на двух стеках с минимумом и максимумом: все операции амортизированно O(1).
+    """
+
+    def __init__(self) -> None:
+        self.inbox = Stack()
+        self.outbox = Stack()
+
+    def enqueue(self, x: int) -> None:
+        self.inbox.push(x)
+
+    def _refill(self) -> None:
+        if self.outbox.is_empty():
+            while not self.inbox.is_empty():
+                self.outbox.push(self.inbox.pop())
+
+    def dequeue(self) -> int:
+        if self.is_empty():
+            raise IndexError("Ошибка: dequeue из пустой очереди")
+        self._refill()
+        return self.outbox.pop()
+
+    def front(self) -> int:
+        if self.is_empty():
+            raise IndexError("Ошибка: front из пустой очереди")
+        self._refill()
+        return self.outbox.peek()
+
+    def min(self) -> int:
+        if self.is_empty():
+            raise IndexError("Ошибка: min из пустой очереди")
+        if self.inbox.is_empty():
+            return self.outbox.min()
+        if self.outbox.is_empty():
+            return self.inbox.min()
+        return min(self.inbox.min(), self.outbox.min())
+
+    def max(self) -> int:
+        if self.is_empty():
+            raise IndexError("Ошибка: max из пустой очереди")
+        if self.inbox.is_empty():
+            return self.outbox.max()
+        if self.outbox.is_empty():
+            return self.inbox.max()
+        return max(self.inbox.max(), self.outbox.max())
+
+    def is_empty(self) -> bool:
+        return self.inbox.is_empty() and self.outbox.is_empty()
+
+    def __len__(self) -> int:
+        return len(self.inbox) + len(self.outbox)
+
+
+class MonotonicDeque:
+    """
+    Очередь с минимумом и максимумом на монотонных деках: значения хранятся в обычном деке,
+    а кандидаты в минимум/максимум – в возрастающем/убывающем деках. Операции амортизированно O(1).
+    """
+
+    def __init__(self) -> None:
+        self.values: deque = deque()
+        self.min_candidates: deque = deque()
+        self.max_candidates: deque = deque()
+
+    def enqueue(self, x: int) -> None:
+        self.values.append(x)
+        while self.min_candidates and self.min_candidates[-1] > x:
+            self.min_candidates.pop()
+        self.min_candidates.append(x)
+        while self.max_candidates and self.max_candidates[-1] < x:
+            self.max_candidates.pop()
+        self.max_candidates.append(x)
+
+    def dequeue(self) -> int:
+        if not self.values:
+            raise IndexError("Ошибка: dequeue из пустой очереди")
+        value = self.values.popleft()
+        # Равные значения хранятся в кандидатах каждый отдельно, поэтому удаляем ровно один.
+        if self.min_candidates[0] == value:
+            self.min_candidates.popleft()
+        if self.max_candidates[0] == value:
+            self.max_candidates.popleft()
+        return value
+
+    def front(self) -> int:
+        if not self.values:
+            raise IndexError("Ошибка: front из пустой очереди")
+        return self.values[0]
+
+    def min(self) -> int:
+        if not self.values:
+            raise IndexError("Ошибка: min из пустой очереди")
+        return self.min_candidates[0]
+
+    def max(self) -> int:
+        if not self.values:
+            raise IndexError("Ошибка: max из пустой очереди")
+        return self.max_candidates[0]
+
+    def is_empty(self) -> bool:
+        return not self.values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _sliding_window_extreme(iterable: Iterable[T], w: int, keep: Callable[..., object]) -> Iterator[T]:
+    candidates: deque = deque()
+    for index, value in enumerate(iterable):
+        while candidates and not keep(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((index, value))
+        if candidates[0][0] <= index - w:
+            candidates.popleft()
+        if index >= w - 1:
+            yield candidates[0][1]
+
+
+def sliding_window_min(iterable: Iterable[T], w: int) -> Iterator[T]:
+    """
+    Минимумы всех окон длины w за O(n) суммарно. Первое значение выдается после w элементов.
+    """
+    if w < 1:
+        raise ValueError("Размер окна должен быть положительным")
+    return _sliding_window_extreme(iterable, w, operator.le)
+
+
+def sliding_window_max(iterable: Iterable[T], w: int) -> Iterator[T]:
+    """
+    Максимумы всех окон длины w за O(n) суммарно. Первое значение выдается после w элементов.
+    """
+    if w < 1:
+        raise ValueError("Размер окна должен быть положительным")
+    return _sliding_window_extreme(iterable, w, operator.ge)
+
+
+class PriorityQueue(Generic[T]):
+    """
+    Индексированная d-арная min-куча (по compare из сортировок) с поддержкой key/cmp.
+    push возвращает handle, по которому за O(log n) меняется приоритет элемента.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T] | None = None,
+        *,
+        key: Callable[[T], object] | None = None,
+        cmp: Callable[[T, T], int] | None = None,
+        arity: int = 2,
+    ) -> None:
+        if arity < 2:
+            raise ValueError("Арность кучи должна быть не меньше 2")
+        self.key = key
+        self.cmp = cmp
+        self.arity = arity
+        self._values: list[T] = []
+        self._handles: list[int] = []
+        self._positions: dict[int, int] = {}
+        self._next_handle = 0
+        if items is not None:
+            self._heapify(items)
+
+    def _heapify(self, items: Iterable[T]) -> None:
+        # Построение кучи снизу вверх за O(n); handle совпадает с порядковым номером элемента.
+        for value in items:
+            self._positions[self._next_handle] = len(self._values)
+            self._values.append(value)
+            self._handles.append(self._next_handle)
+            self._next_handle += 1
+        for index in range((len(self._values) - 2) // self.arity, -1, -1):
+            self._sift_down(index)
+
+    def _swap(self, i: int, j: int) -> None:
+        self._values[i], self._values[j] = self._values[j], self._values[i]
+        self._handles[i], self._handles[j] = self._handles[j], self._handles[i]
+        self._positions[self._handles[i]] = i
+        self._positions[self._handles[j]] = j
+
+    def _sift_up(self, index: int) -> None:
+        values = self._values
+        while index > 0:
+            parent = (index - 1) // self.arity
+            if compare(values[index], values[parent], self.key, self.cmp) < 0:
+                self._swap(index, parent)
+                index = parent
+            else:
+                break
+
+    def _sift_down(self, index: int) -> None:
+        values = self._values
+        size = len(values)
+        while True:
+            first_child = self.arity * index + 1
+            if first_child >= size:
+                break
+            smallest = first_child
+            for child in range(first_child + 1, min(first_child + self.arity, size)):
+                if compare(values[child], values[smallest], self.key, self.cmp) < 0:
+                    smallest = child
+            if compare(values[smallest], values[index], self.key, self.cmp) < 0:
+                self._swap(index, smallest)
+                index = smallest
+            else:
+                break
+
+    def _position(self, handle: int) -> int:
+        if handle not in self._positions:
+            raise KeyError(f"Ошибка: элемента с handle={handle} нет в очереди")
+        return self._positions[handle]
+
+    def push(self, x: T) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        self._positions[handle] = len(self._values)
+        self._values.append(x)
+        self._handles.append(handle)
+        self._sift_up(len(self._values) - 1)
+        return handle
+
+    def pop_item(self) -> tuple[int, T]:
+        if not self._values:
+            raise IndexError("Ошибка: pop из пустой очереди с приоритетом")
+        last = len(self._values) - 1
+        self._swap(0, last)
+        value = self._values.pop()
+        handle = self._handles.pop()
+        del self._positions[handle]
+        if self._values:
+            self._sift_down(0)
+        return handle, value
+
+    def pop(self) -> T:
+        return self.pop_item()[1]
+
+    def peek(self) -> T:
+        if not self._values:
+            raise IndexError("Ошибка: peek из пустой очереди с приоритетом")
+        return self._values[0]
+
+    def get(self, handle: int) -> T:
+        return self._values[self._position(handle)]
+
+    def update(self, handle: int, x: T) -> None:
+        """
+        Заменяет значение элемента и восстанавливает свойство кучи в нужную сторону.
+        """
+        index = self._position(handle)
+        old_value = self._values[index]
+        self._values[index] = x
+        if compare(x, old_value, self.key, self.cmp) < 0:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def decrease_key(self, handle: int, x: T) -> None:
+        if compare(x, self.get(handle), self.key, self.cmp) > 0:
+            raise ValueError("Ошибка: новое значение больше текущего")
+        self.update(handle, x)
+
+    def increase_key(self, handle: int, x: T) -> None:
+        if compare(x, self.get(handle), self.key, self.cmp) < 0:
+            raise ValueError("Ошибка: новое значение меньше текущего")
+        self.update(handle, x)
+
+    def remove(self, handle: int) -> T:
+        index = self._position(handle)
+        last = len(self._values) - 1
+        self._swap(index, last)
+        value = self._values.pop()
+        self._handles.pop()
+        del self._positions[handle]
+        if index < len(self._values):
+            self._sift_down(index)
+            self._sift_up(index)
+        return value
+
+    def is_empty(self) -> bool:
+        return not self._values
+
+    def __contains__(self, handle: object) -> bool:
+        return handle in self._positions
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class PairingNode(Generic[T]):
+    def __init__(self, value: T, handle: int) -> None:
+        self.value = value
+        self.handle = handle
+        self.child: PairingNode[T] | None = None
+        self.sibling: PairingNode[T] | None = None
+        # Для крайнего левого ребенка prev указывает на родителя, иначе – на левого соседа.
+        self.prev: PairingNode[T] | None = None
+
+
+class PairingHeap(Generic[T]):
+    """
+    Pairing-куча (min по compare) с тем же интерфейсом, что у PriorityQueue.
+    push и decrease_key за O(1), pop за амортизированное O(log n).
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T] | None = None,
+        *,
+        key: Callable[[T], object] | None = None,
+        cmp: Callable[[T, T], int] | None = None,
+    ) -> None:
+        self.key = key
+        self.cmp = cmp
+        self.root: PairingNode[T] | None = None
+        self._nodes: dict[int, PairingNode[T]] = {}
+        self._next_handle = 0
+        if items is not None:
+            for value in items:
+                self.push(value)
+
+    def _meld(self, first: PairingNode[T] | None, second: PairingNode[T] | None) -> PairingNode[T] | None:
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if compare(second.value, first.value, self.key, self.cmp) < 0:
+            first, second = second, first
+        second.prev = first
+        second.sibling = first.child
+        if first.child is not None:
+            first.child.prev = second
+        first.child = second
+        first.sibling = None
+        first.prev = None
+        return first
+
+    def _merge_pairs(self, node: PairingNode[T] | None) -> PairingNode[T] | None:
+        # Двухпроходное слияние списка детей без рекурсии.
+        pairs: list[PairingNode[T] | None] = []
+        while node is not None:
+            first = node
+            second = node.sibling
+            node = second.sibling if second is not None else None
+            first.sibling = first.prev = None
+            if second is not None:
+                second.sibling = second.prev = None
+            pairs.append(self._meld(first, second))
+        result: PairingNode[T] | None = None
+        for tree in reversed(pairs):
+            result = self._meld(tree, result)
+        return result
+
+    def _cut(self, node: PairingNode[T]) -> None:
+        # Вызывается только для узлов не в корне, у них prev всегда есть.
+        parent = node.prev
+        if parent is not None and parent.child is node:
+            parent.child = node.sibling
+        elif parent is not None:
+            parent.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = parent
+        node.prev = None
+        node.sibling = None
+
+    def _node(self, handle: int) -> PairingNode[T]:
+        if handle not in self._nodes:
+            raise KeyError(f"Ошибка: элемента с handle={handle} нет в куче")
+        return self._nodes[handle]
+
+    def push(self, x: T) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        node = PairingNode(x, handle)
+        self._nodes[handle] = node
+        self.root = self._meld(self.root, node)
+        return handle
+
+    def pop_item(self) -> tuple[int, T]:
+        if self.root is None:
+            raise IndexError("Ошибка: pop из пустой кучи")
+        root = self.root
+        self.root = self._merge_pairs(root.child)
+        root.child = None
+        del self._nodes[root.handle]
+        return root.handle, root.value
+
+    def pop(self) -> T:
+        return self.pop_item()[1]
+
+    def peek(self) -> T:
+        if self.root is None:
+            raise IndexError("Ошибка: peek из пустой кучи")
+        return self.root.value
+
+    def get(self, handle: int) -> T:
+        return self._node(handle).value
+
+    def decrease_key(self, handle: int, x: T) -> None:
+        node = self._node(handle)
+        if compare(x, node.value, self.key, self.cmp) > 0:
+            raise ValueError("Ошибка: новое значение больше текущего")
+        node.value = x
+        if node is not self.root:
+            self._cut(node)
+            self.root = self._meld(self.root, node)
+
+    def remove(self, handle: int) -> T:
+        node = self._node(handle)
+        if node is self.root:
+            return self.pop_item()[1]
+        self._cut(node)
+        subtree = self._merge_pairs(node.child)
+        node.child = None
+        self.root = self._meld(self.root, subtree)
+        del self._nodes[handle]
+        return node.value
+
+    def increase_key(self, handle: int, x: T) -> None:
+        node = self._node(handle)
+        if compare(x, node.value, self.key, self.cmp) < 0:
+            raise ValueError("Ошибка: новое значение меньше текущего")
+        self.remove(handle)
+        node.value = x
+        self._nodes[handle] = node
+        self.root = self._meld(self.root, node)
+
+    def update(self, handle: int, x: T) -> None:
+        if compare(x, self.get(handle), self.key, self.cmp) <= 0:
+            self.decrease_key(handle, x)
+        else:
+            self.increase_key(handle, x)
+
+    def is_empty(self) -> bool:
+        return self.root is None
+
+    def __contains__(self, handle: object) -> bool:
+        return handle in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from src.datasets import (
+    DEFAULT_CHUNK_SIZE,
+    FORMAT_VERSION,
+    Dataset,
+    open_dataset,
+    read_header,
+    write_dataset,
+    write_values,
+)
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("LABS_DATASET_CACHE", Path.home() / ".cache" / "labs-datasets"))
+DEFAULT_CACHE_MAX_BYTES = 1 << 30
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """
+    Кэш сгенерированных наборов на диске с адресацией по содержимому запроса:
+    ключ – sha256 от (генератор, n, параметры, seed, размер чанка, версия формата).
+    Каждая запись – бинарный файл набора и JSON с метаданными (размер, sha256).
+    Время последнего использования хранится в mtime; при превышении max_bytes
+    удаляются давно не использованные записи.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_CACHE_DIR,
+        max_bytes: int | None = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes должно быть положительным")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(generator: str, n: int, seed: int | None, chunk_size: int | None, params: dict) -> str:
+        description = {
+            "generator": generator,
+            "n": n,
+            "seed": seed,
+            "chunk_size": chunk_size,
+            "params": params,
+            "format_version": FORMAT_VERSION,
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    def data_path(self, key: str) -> Path:
+        return self.directory / f"{key}.bin"
+
+    def meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read_meta(self, key: str) -> dict | None:
+        try:
+            return json.loads(self.meta_path(key).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def verify(self, key: str, *, full: bool = False) -> bool:
+        """
+        Проверяет запись: метаданные, размер файла и заголовок; при full – еще и sha256 всего файла.
+        """
+        meta = self._read_meta(key)
+        path = self.data_path(key)
+        if meta is None or not path.exists() or path.stat().st_size != meta["size"]:
+            return False
+        try:
+            header = read_header(str(path))
+        except (OSError, ValueError):
+            return False
+        expected = {name: meta[name] for name in ("generator", "n", "seed", "chunk_size", "params")}
+        if {name: header.get(name) for name in expected} != expected:
+            return False
+        return not full or _file_digest(path) == meta["sha256"]
+
+    def remove(self, key: str) -> None:
+        for path in (self.data_path(key), self.meta_path(key)):
+            path.unlink(missing_ok=True)
+
+    def ensure(
+        self,
+        generator: str,
+        n: int,
+        *,
+        seed: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        verify: bool = False,
+        **params: Any,
+    ) -> str:
+        """
+        Гарантирует наличие набора в кэше (генерирует при промахе или порче) и возвращает ключ.
+        """
+        key = self.make_key(generator, n, seed, chunk_size, params)
+        if self.verify(key, full=verify):
+            os.utime(self.data_path(key))
+            return key
+        self.remove(key)
+        temporary = self.directory / f"{key}.tmp"
+        header = write_dataset(str(temporary), generator, n, chunk_size=chunk_size, seed=seed, **params)
+        self._commit(key, temporary, header)
+        return key
+
+    def ensure_values(
+        self,
+        generator: str,
+        n: int,
+        build: Callable[[], Sequence],
+        *,
+        verify: bool = False,
+        **params: Any,
+    ) -> str:
+        """
+        Как ensure, но содержимое строит build() (например, генератор в памяти), поэтому набор
+        из кэша совпадает с тем, что build вернул бы без кэша. Ключ – (generator, n, params).
+        """
+        key = self.make_key(generator, n, None, None, params)
+        if self.verify(key, full=verify):
+            os.utime(self.data_path(key))
+            return key
+        self.remove(key)
+        values = build()
+        if len(values) != n:
+            raise ValueError(f"Ошибка: build вернул {len(values)} значений вместо {n}")
+        temporary = self.directory / f"{key}.tmp"
+        header = write_values(str(temporary), values, generator=generator, params=params)
+        self._commit(key, temporary, header)
+        return key
+
+    def _commit(self, key: str, temporary: Path, header: dict) -> None:
+        """Пишет метаданные, атомарно переносит временный файл на место и вытесняет лишнее."""
+        meta = {
+            "key": key,
+            "generator": header["generator"],
+            "n": header["n"],
+            "seed": header["seed"],
+            "chunk_size": header["chunk_size"],
+            "params": header["params"],
+            "dtype": header["dtype"],
+            "size": temporary.stat().st_size,
+            "sha256": _file_digest(temporary),
+        }
+        self.meta_path(key).write_text(json.dumps(meta, sort_keys=True))
+        os.replace(temporary, self.data_path(key))
+        self.evict(keep=key)
+
+    def load(
+        self,
+        generator: str,
+        n: int,
+        *,
+        seed: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        verify: bool = False,
+        **params: Any,
+    ) -> Dataset:
+        """
+        Возвращает набор из кэша, открытый через mmap (закрывать через close/with).
+        """
+        key = self.ensure(generator, n, seed=seed, chunk_size=chunk_size, verify=verify, **params)
+        return open_dataset(str(self.data_path(key)))
+
+    def load_values(
+        self,
+        generator: str,
+        n: int,
+        build: Callable[[], Sequence],
+        *,
+        verify: bool = False,
+        **params: Any,
+    ) -> Dataset:
+        """ensure_values и открытие набора через mmap."""
+        key = self.ensure_values(generator, n, build, verify=verify, **params)
+        return open_dataset(str(self.data_path(key)))
+
+    def entries(self) -> list[dict]:
+        """
+        Метаданные записей с полем last_used (mtime файла), от самой старой к самой новой.
+        """
+        result = []
+        for meta_path in self.directory.glob("*.json"):
+            meta = self._read_meta(meta_path.stem)
+            data_path = self.data_path(meta_path.stem)
+            if meta is None or not data_path.exists():
+                continue
+            meta["last_used"] = data_path.stat().st_mtime
+            result.append(meta)
+        return sorted(result, key=lambda meta: meta["last_used"])
+
+    def total_bytes(self) -> int:
+        return sum(meta["size"] for meta in self.entries())
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """
+        Удаляет самые давно использованные записи, пока кэш не уложится в max_bytes.
+        """
+        if self.max_bytes is None:
+            return []
+        entries = self.entries()
+        total = sum(meta["size"] for meta in entries)
+        removed = []
+        for meta in entries:
+            if total <= self.max_bytes:
+                break
+            if meta["key"] == keep:
+                continue
+            self.remove(meta["key"])
+            total -= meta["size"]
+            removed.append(meta["key"])
+        return removed
+
+    def purge(self) -> int:
+        """
+        Удаляет все записи (и недописанные временные файлы), возвращает число удаленных записей.
+        """
+        entries = self.entries()
+        for meta in entries:
+            self.remove(meta["key"])
+        for leftover in self.directory.glob("*.tmp"):
+            leftover.unlink(missing_ok=True)
+        return len(entries)
@@ -0,0 +1,415 @@
+import hashlib
+import inspect
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from src.generators import (
+    nearly_sorted_fast,
+    rand_float_array_fast,
+    rand_int_array_fast,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+# concurrent.futures и multiprocessing.shared_memory импортируются внутри функций:
+# они нужны только для параллельной генерации, а их загрузка заметно замедляет запуск CLI.
+
+# Формат файла: MAGIC, затем <u32 версия><u32 длина заголовка>, JSON-заголовок в UTF-8,
+# выравнивание пробелами до 8 байт и сами значения int64/float64 в little-endian.
+MAGIC = b"SRTDATA\x00"
+FORMAT_VERSION = 1
+PREFIX = struct.Struct("<II")
+DTYPES = {"int64": "q", "float64": "d"}
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def chunk_seed(seed: int, index: int) -> int:
+    """
+    Детерминированный 64-битный seed для чанка index, не зависящий от остальных чанков.
+    """
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def spawn_seeds(seed: int, count: int) -> list[int]:
+    """
+    Порождает count независимых дочерних seed'ов (в духе SeedSequence.spawn): i-й дочерний
+    seed – хеш пары (seed, i), поэтому он не зависит ни от числа процессов, ни от порядка работы.
+    """
+    if count < 0:
+        raise ValueError("Число seed'ов должно быть неотрицательным")
+    return [chunk_seed(seed, index) for index in range(count)]
+
+
+def _chunk_bounds(n: int, chunk_size: int) -> Iterator[tuple[int, int, int]]:
+    for index, start in enumerate(range(0, n, chunk_size)):
+        yield index, start, min(start + chunk_size, n)
+
+
+def _rand_int_chunk(start: int, end: int, n: int, seed: int, index: int, lo: int = 0, hi: int = 1000) -> array:
+    return rand_int_array_fast(end - start, lo, hi, seed=chunk_seed(seed, index), output="array")
+
+
+def _rand_float_chunk(
+    start: int, end: int, n: int, seed: int, index: int, lo: float = 0.0, hi: float = 1.0
+) -> array:
+    return rand_float_array_fast(end - start, lo, hi, seed=chunk_seed(seed, index), output="array")
+
+
+def _nearly_sorted_chunk(start: int, end: int, n: int, seed: int, index: int, swaps: int = 0) -> array:
+    # Перестановки распределяются по чанкам пропорционально длине и не выходят за границы чанка.
+    local_swaps = swaps * end // n - swaps * start // n if n else 0
+    if end - start < 2:
+        local_swaps = 0
+    local = nearly_sorted_fast(end - start, local_swaps, seed=chunk_seed(seed, index), output="array")
+    return array("q", [value + start for value in local])
+
+
+def _many_duplicates_chunk(start: int, end: int, n: int, seed: int, index: int, k_unique: int = 5) -> array:
+    # Пул значений общий для всего набора (seed без индекса), индексы пула – свои у каждого чанка.
+    pool = rand_int_array_fast(k_unique, -10 * k_unique, 10 * k_unique, seed=chunk_seed(seed, -1))
+    indexes = rand_int_array_fast(end - start, 0, k_unique - 1, seed=chunk_seed(seed, index))
+    return array("q", [pool[position] for position in indexes])
+
+
+def _reverse_sorted_chunk(start: int, end: int, n: int, seed: int, index: int) -> array:
+    return array("q", range(n - start, n - end, -1))
+
+
+# Имя генератора -> (dtype, функция построения одного чанка).
+STREAM_GENERATORS: dict[str, tuple[str, Callable[..., array]]] = {
+    "rand_int_array": ("int64", _rand_int_chunk),
+    "rand_float_array": ("float64", _rand_float_chunk),
+    "nearly_sorted": ("int64", _nearly_sorted_chunk),
+    "many_duplicates": ("int64", _many_duplicates_chunk),
+    "reverse_sorted": ("int64", _reverse_sorted_chunk),
+}
+
+
+def _stream_spec(generator: str) -> tuple[str, Callable[..., array]]:
+    if generator not in STREAM_GENERATORS:
+        raise ValueError(f"Неизвестный генератор: {generator}")
+    return STREAM_GENERATORS[generator]
+
+
+def stream_chunks(
+    generator: str,
+    n: int,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 0,
+    **params: object,
+) -> Iterator[array]:
+    """
+    Потоковая генерация набора длины n чанками array.array по chunk_size элементов.
+    Чанк i зависит только от (seed, i, chunk_size, params), поэтому память ограничена одним чанком.
+    """
+    _validate_stream(generator, n, chunk_size, params)
+    build_chunk = STREAM_GENERATORS[generator][1]
+    return (build_chunk(start, end, n, seed, index, **params) for index, start, end in _chunk_bounds(n, chunk_size))
+
+
+def _encode_header(header: dict) -> bytes:
+    payload = json.dumps(header, sort_keys=True).encode()
+    prefix_size = len(MAGIC) + PREFIX.size
+    padding = -(prefix_size + len(payload)) % 8
+    return MAGIC + PREFIX.pack(FORMAT_VERSION, len(payload) + padding) + payload + b" " * padding
+
+
+def _write_values(handle, values: array) -> None:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(handle)
+
+
+def _chunk_bytes(generator: str, n: int, seed: int, index: int, start: int, end: int, params: dict) -> bytes:
+    chunk = STREAM_GENERATORS[generator][1](start, end, n, seed, index, **params)
+    if sys.byteorder == "big":
+        chunk.byteswap()
+    return chunk.tobytes()
+
+
+def _write_chunk_to_file(task: tuple) -> None:
+    path, data_offset, generator, n, seed, index, start, end, params = task
+    data = _chunk_bytes(generator, n, seed, index, start, end, params)
+    with open(path, "r+b") as handle:
+        handle.seek(data_offset + start * 8)
+        handle.write(data)
+
+
+def _write_chunk_to_shared_memory(task: tuple) -> None:
+    name, generator, n, seed, index, start, end, params = task
+    from multiprocessing import shared_memory
+
+    data = _chunk_bytes(generator, n, seed, index, start, end, params)
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        block.buf[start * 8 : start * 8 + len(data)] = data
+    finally:
+        block.close()
+
+
+def _run_chunk_tasks(worker: Callable[[tuple], None], tasks: list[tuple], workers: int | None) -> None:
+    if workers is None or workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            worker(task)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # list() пробрасывает исключения из процессов.
+        list(pool.map(worker, tasks))
+
+
+def generator_params(generator: str) -> tuple[str, ...]:
+    """Имена параметров потокового генератора (все, кроме общих start/end/n/seed/index)."""
+    signature = inspect.signature(_stream_spec(generator)[1])
+    return tuple(name for name in signature.parameters if name not in ("start", "end", "n", "seed", "index"))
+
+
+def _validate_stream(generator: str, n: int, chunk_size: int, params: dict | None = None) -> str:
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if chunk_size < 1:
+        raise ValueError("chunk_size должен быть положительным")
+    dtype = _stream_spec(generator)[0]
+    allowed = generator_params(generator)
+    unknown = sorted(set(params or {}) - set(allowed))
+    if unknown:
+        raise ValueError(
+            f"Неизвестные параметры генератора {generator}: {', '.join(unknown)}"
+            f" (допустимы: {', '.join(allowed) or 'нет'})"
+        )
+    return dtype
+
+
+def write_dataset(
+    path: str,
+    generator: str,
+    n: int,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 0,
+    workers: int | None = None,
+    **params: object,
+) -> dict:
+    """
+    Записывает потоковый набор в бинарный файл чанками и возвращает заголовок.
+    При workers > 1 чанки генерируются в пуле процессов и пишутся по своим смещениям;
+    содержимое файла от числа процессов не зависит. Параметры проверяются до создания файла,
+    а при ошибке генерации недописанный файл удаляется.
+    """
+    dtype = _validate_stream(generator, n, chunk_size, params)
+    header = {
+        "dtype": dtype,
+        "n": n,
+        "generator": generator,
+        "params": params,
+        "seed": seed,
+        "chunk_size": chunk_size,
+    }
+    encoded_header = _encode_header(header)
+    try:
+        if workers is not None and workers > 1:
+            with open(path, "wb") as handle:
+                handle.write(encoded_header)
+                handle.truncate(len(encoded_header) + n * 8)
+            tasks = [
+                (path, len(encoded_header), generator, n, seed, index, start, end, params)
+                for index, start, end in _chunk_bounds(n, chunk_size)
+            ]
+            _run_chunk_tasks(_write_chunk_to_file, tasks, workers)
+            return header
+        chunks = stream_chunks(generator, n, chunk_size=chunk_size, seed=seed, **params)
+        with open(path, "wb") as handle:
+            handle.write(encoded_header)
+            for chunk in chunks:
+                _write_values(handle, chunk)
+    except BaseException:
+        if os.path.exists(path):
+            os.unlink(path)
+        raise
+    return header
+
+
+class SharedArray:
+    """
+    Набор в разделяемой памяти (multiprocessing.shared_memory). values – memoryview
+    int64/float64 без копирования. Создатель освобождает память через unlink (или with).
+    """
+
+    def __init__(self, block: "shared_memory.SharedMemory", typecode: str, n: int) -> None:
+        self.block = block
+        self.name = block.name
+        self.values = block.buf[: n * 8].cast(typecode)  # type: ignore[call-overload]
+
+    def close(self) -> None:
+        if self.values is not None:
+            self.values.release()
+            self.values = None
+            self.block.close()
+
+    def unlink(self) -> None:
+        self.close()
+        self.block.unlink()
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.unlink()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def generate_shared(
+    generator: str,
+    n: int,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 0,
+    workers: int | None = None,
+    **params: object,
+) -> SharedArray:
+    """
+    Параллельная генерация набора в разделяемую память: чанк i строится из дочернего seed
+    spawn_seeds(seed, ...)[i] в любом из процессов пула, поэтому результат побитово совпадает
+    для одинаковых (seed, n, chunk_size) при любом workers.
+    """
+    from multiprocessing import shared_memory
+
+    typecode = DTYPES[_validate_stream(generator, n, chunk_size, params)]
+    block = shared_memory.SharedMemory(create=True, size=max(n * 8, 1))
+    try:
+        tasks = [
+            (block.name, generator, n, seed, index, start, end, params)
+            for index, start, end in _chunk_bounds(n, chunk_size)
+        ]
+        _run_chunk_tasks(_write_chunk_to_shared_memory, tasks, workers)
+        if sys.byteorder == "big":
+            swapped = array(typecode, bytes(block.buf[: n * 8]))
+            swapped.byteswap()
+            block.buf[: n * 8] = swapped.tobytes()
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    return SharedArray(block, typecode, n)
+
+
+def write_values(
+    path: str,
+    values,
+    *,
+    generator: str = "custom",
+    params: dict | None = None,
+    seed: int | None = None,
+) -> dict:
+    """
+    Записывает готовую последовательность чисел (все int – int64, иначе float64) в тот же формат.
+    """
+    typecode = "q" if all(isinstance(value, int) for value in values) else "d"
+    dtype = "int64" if typecode == "q" else "float64"
+    header = {
+        "dtype": dtype,
+        "n": len(values),
+        "generator": generator,
+        "params": params or {},
+        "seed": seed,
+        "chunk_size": None,
+    }
+    with open(path, "wb") as handle:
+        handle.write(_encode_header(header))
+        if not (isinstance(values, array) and values.typecode == typecode):
+            values = array(typecode, values)
+        _write_values(handle, values)
+    return header
+
+
+def _parse_header(buffer) -> tuple[dict, int]:
+    prefix_size = len(MAGIC) + PREFIX.size
+    if len(buffer) < prefix_size or bytes(buffer[: len(MAGIC)]) != MAGIC:
+        raise ValueError("Ошибка: файл не является набором данных")
+    version, header_size = PREFIX.unpack_from(buffer, len(MAGIC))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Ошибка: неподдерживаемая версия формата {version}")
+    header = json.loads(bytes(buffer[prefix_size : prefix_size + header_size]))
+    if header.get("dtype") not in DTYPES:
+        raise ValueError("Ошибка: неизвестный dtype в заголовке")
+    return header, prefix_size + header_size
+
+
+class Dataset:
+    """
+    Набор данных из файла, отображенного через mmap. values – memoryview без копирования
+    (int64 или float64); поддерживаются len, индексация и итерация. Закрывается через close
+    или контекстный менеджер.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Ошибка: файл не является набором данных") from None
+        self._raw = memoryview(self._mmap)
+        try:
+            self.header, offset = _parse_header(self._raw)
+            n = self.header["n"]
+            size = n * 8
+            if len(self._raw) - offset < size:
+                raise ValueError("Ошибка: файл набора данных обрезан")
+            self._data = self._raw[offset : offset + size]
+            if sys.byteorder == "big":
+                # На big-endian платформах без копии не обойтись.
+                swapped = array(DTYPES[self.header["dtype"]], self._data.tobytes())
+                swapped.byteswap()
+                self.values = memoryview(swapped)
+            else:
+                self.values = self._data.cast(DTYPES[self.header["dtype"]])  # type: ignore[call-overload]
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for name in ("values", "_data", "_raw"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "Dataset":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+def open_dataset(path: str) -> Dataset:
+    return Dataset(path)
+
+
+def read_header(path: str) -> dict:
+    with open_dataset(path) as dataset:
+        return dict(dataset.header)
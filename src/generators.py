@@ -1,4 +1,24 @@
 import random
+import sys
+from array import array
+from typing import Any
+
+# NumPy необязателен (быстрые генераторы умеют работать на array.array) и загружается
+# только при первом обращении к быстрому режиму, чтобы не замедлять запуск CLI.
+np: Any = None
+_numpy_loaded = False
+
+
+def _load_numpy():
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        _numpy_loaded = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+    return np
 
 
 def rand_int_array(n: int, lo: int, hi: int, *, distinct: bool = False, seed: int | None = None) -> list[int]:
@@ -57,3 +77,301 @@ def rand_float_array(n: int, lo: float = 0.0, hi: float = 1.0, *, seed: int | No
         raise ValueError("Длина массива должна быть неотрицательной")
     rng = random.Random(seed)
     return [rng.uniform(lo, hi) for number in range(n)]
+
+
+def quick_sort_killer(n: int) -> list[int]:
+    """
+    Худший случай для quick_sort с опорным элементом из середины: на каждом шаге в середине
+    оставшейся части оказывается максимум, и разбиение отщепляет ровно один элемент (O(n²)).
+    """
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    result = [0] * n
+    # Позиции исходного массива в том порядке, в каком они останутся в части less.
+    positions = list(range(n))
+    for value in range(n, 0, -1):
+        result[positions.pop(len(positions) // 2)] = value
+    return result
+
+
+def bucket_skew(n: int, *, seed: int | None = None) -> list[float]:
+    """
+    Почти все значения в узком интервале плюс два выброса: после нормализации bucket_sort
+    складывает n - 2 элементов в одну корзину и сортирует ее вставками.
+    """
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    rng = random.Random(seed)
+    values = [0.5 + rng.random() * 1e-9 for number in range(max(n - 2, 0))]
+    values.extend([0.0, 1.0][: n - len(values)])
+    rng.shuffle(values)
+    return values
+
+
+def wide_range_ints(n: int, span: int = 10**7, *, seed: int | None = None) -> list[int]:
+    """
+    Немного целых на огромном диапазоне [0, span): counting_sort платит за весь диапазон ключей.
+    Минимум и максимум диапазона всегда присутствуют при n >= 2.
+    """
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if span < 1:
+        raise ValueError("Ошибка: span должен быть положительным")
+    rng = random.Random(seed)
+    values = [rng.randrange(span) for number in range(n)]
+    if n >= 2:
+        values[0], values[-1] = span - 1, 0
+    return values
+
+
+def organ_pipe(n: int) -> list[int]:
+    """«Органные трубы»: возрастающая половина, затем убывающая."""
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    half = (n + 1) // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+def sawtooth(n: int, teeth: int = 4) -> list[int]:
+    """Пила: teeth одинаковых возрастающих серий."""
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if teeth <= 0:
+        raise ValueError("Ошибка: teeth должно быть положительным")
+    period = max(1, -(-n // teeth))
+    return [index % period for index in range(n)]
+
+
+def zipf_ints(n: int, s: float = 1.2, k: int = 1000, *, seed: int | None = None) -> list[int]:
+    """Ранги 1..k с вероятностями ∝ 1 / rank**s (распределение Ципфа)."""
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if k <= 0 or s <= 0:
+        raise ValueError("Ошибка: k и s должны быть положительными")
+    rng = random.Random(seed)
+    cumulative = []
+    total = 0.0
+    for rank in range(1, k + 1):
+        total += rank**-s
+        cumulative.append(total)
+    return rng.choices(range(1, k + 1), cum_weights=cumulative, k=n)
+
+
+def lognormal_floats(n: int, mu: float = 0.0, sigma: float = 1.0, *, seed: int | None = None) -> list[float]:
+    """Логнормальное распределение (типично для задержек)."""
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    rng = random.Random(seed)
+    return [rng.lognormvariate(mu, sigma) for number in range(n)]
+
+
+def pareto_floats(n: int, alpha: float = 1.5, *, seed: int | None = None) -> list[float]:
+    """Распределение Парето с тяжелым хвостом."""
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if alpha <= 0:
+        raise ValueError("Ошибка: alpha должно быть положительным")
+    rng = random.Random(seed)
+    return [rng.paretovariate(alpha) for number in range(n)]
+
+
+def sorted_with_tail(n: int, tail: int, *, seed: int | None = None) -> list[int]:
+    """Отсортированный префикс длины n - tail, к которому дописаны tail случайных значений."""
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if not 0 <= tail <= n:
+        raise ValueError("Ошибка: tail должен быть в диапазоне [0, n]")
+    rng = random.Random(seed)
+    return list(range(n - tail)) + [rng.randrange(n) for number in range(tail)]
+
+
+# Быстрый режим ("fast"). Последовательность для данного seed определена так, что NumPy и
+# запасной backend на array.array выдают одинаковые значения:
+#   * rng = random.Random(seed); k случайных слов берутся одним вызовом rng.getrandbits(k * bits)
+#     и режутся на bits-битные слова w_0, w_1, ... от младших разрядов к старшим;
+#   * целые: span = hi - lo + 1; при span <= 2**32 значение lo + (w * span >> 32) по 32-битным словам,
+#     иначе lo + w % span по 64-битным словам (span <= 2**64);
+#   * float: lo + (hi - lo) * ((w >> 11) * 2**-53) по 64-битным словам.
+# Значения отличаются от медленных генераторов с тем же seed, но воспроизводимы между backend'ами.
+FAST_BACKENDS = ("auto", "numpy", "python")
+FAST_OUTPUTS = ("list", "array", "numpy")
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def _resolve_backend(backend: str, output: str) -> str:
+    if backend not in FAST_BACKENDS:
+        raise ValueError(f"Неизвестный backend: {backend}")
+    if output not in FAST_OUTPUTS:
+        raise ValueError(f"Неизвестный формат результата: {output}")
+    _load_numpy()
+    if (backend == "numpy" or output == "numpy") and np is None:
+        raise ValueError("Для backend/output numpy требуется установленный NumPy")
+    if backend == "auto":
+        return "numpy" if np is not None else "python"
+    return backend
+
+
+def _random_bytes(rng: random.Random, count: int, bits: int) -> bytes:
+    size = count * bits // 8
+    if size == 0:
+        return b""
+    return rng.getrandbits(count * bits).to_bytes(size, "little")
+
+
+def _python_words(data: bytes, bits: int) -> array:
+    words = array("I" if bits == 32 else "Q")
+    words.frombytes(data)
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words
+
+
+def _numpy_words(data: bytes, bits: int):
+    return np.frombuffer(data, dtype="<u4" if bits == 32 else "<u8")
+
+
+def _convert_output(values, typecode: str, output: str):
+    """
+    Приводит результат backend'а (list, array.array или numpy.ndarray) к запрошенному формату.
+    """
+    if output == "numpy":
+        return np.asarray(values, dtype="int64" if typecode == "q" else "float64")
+    if output == "array":
+        if np is not None and isinstance(values, np.ndarray):
+            result = array(typecode)
+            result.frombytes(values.astype("=i8" if typecode == "q" else "=f8").tobytes())
+            return result
+        return values if isinstance(values, array) else array(typecode, values)
+    return values.tolist() if not isinstance(values, list) else values
+
+
+def _fast_ints(rng: random.Random, n: int, lo: int, hi: int, backend: str):
+    span = hi - lo + 1
+    if span > 1 << 64:
+        raise ValueError("Ошибка: диапазон слишком велик для быстрого режима")
+    bits = 32 if span <= 1 << 32 else 64
+    data = _random_bytes(rng, n, bits)
+    if backend == "numpy":
+        words = _numpy_words(data, bits).astype("uint64")
+        if bits == 32:
+            offsets = (words * np.uint64(span)) >> np.uint64(32)
+        elif span == 1 << 64:
+            offsets = words
+        else:
+            offsets = words % np.uint64(span)
+        # Сложение по модулю 2**64 с последующим view дает точный int64 для lo/hi в диапазоне int64.
+        return (offsets + np.uint64(lo & ((1 << 64) - 1))).view("int64")
+    words = _python_words(data, bits)
+    if bits == 32:
+        return [lo + ((word * span) >> 32) for word in words]
+    return [lo + word % span for word in words]
+
+
+def rand_int_array_fast(
+    n: int,
+    lo: int,
+    hi: int,
+    *,
+    seed: int | None = None,
+    output: str = "list",
+    backend: str = "auto",
+):
+    """
+    Быстрая генерация случайных целых из [lo, hi] (см. описание режима fast выше).
+    output: "list", "array" (array.array('q')) или "numpy"; backend: "auto", "numpy" или "python".
+    """
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if hi < lo:
+        raise ValueError("Ошибка: hi должно быть не меньше lo")
+    backend = _resolve_backend(backend, output)
+    if lo < INT64_MIN or hi > INT64_MAX:
+        if backend == "numpy" or output != "list":
+            raise ValueError("Ошибка: для типизированного результата границы должны помещаться в int64")
+    rng = random.Random(seed)
+    return _convert_output(_fast_ints(rng, n, lo, hi, backend), "q", output)
+
+
+def rand_float_array_fast(
+    n: int,
+    lo: float = 0.0,
+    hi: float = 1.0,
+    *,
+    seed: int | None = None,
+    output: str = "list",
+    backend: str = "auto",
+):
+    """Быстрая генерация случайных float из [lo, hi) (см. описание режима fast выше)."""
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    backend = _resolve_backend(backend, output)
+    rng = random.Random(seed)
+    data = _random_bytes(rng, n, 64)
+    width = hi - lo
+    if backend == "numpy":
+        values = lo + width * ((_numpy_words(data, 64) >> np.uint64(11)).astype("float64") * 2.0**-53)
+    else:
+        values = array("d", [lo + width * ((word >> 11) * 2.0**-53) for word in _python_words(data, 64)])
+    return _convert_output(values, "d", output)
+
+
+def nearly_sorted_fast(n: int, swaps: int, *, seed: int | None = None, output: str = "list", backend: str = "auto"):
+    """
+    Быстрый почти отсортированный массив: индексы всех перестановок берутся одним вызовом getrandbits.
+    Для перестановки s: i = w_{2s} % n, j = (i + 1 + w_{2s+1} % (n - 1)) % n по 64-битным словам.
+    """
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if swaps < 0:
+        raise ValueError("Число перестановок не может быть отрицательным")
+    if swaps > 0 and n < 2:
+        raise ValueError("Нельзя выполнить перестановки в массиве длиной меньше 2")
+    backend = _resolve_backend(backend, output)
+    rng = random.Random(seed)
+    words = _python_words(_random_bytes(rng, 2 * swaps, 64), 64)
+    values = np.arange(n, dtype="int64") if backend == "numpy" else array("q", range(n))
+    for swap in range(swaps):
+        i = words[2 * swap] % n
+        j = (i + 1 + words[2 * swap + 1] % (n - 1)) % n
+        values[i], values[j] = values[j], values[i]
+    return _convert_output(values, "q", output)
+
+
+def many_duplicates_fast(
+    n: int,
+    k_unique: int = 5,
+    *,
+    seed: int | None = None,
+    output: str = "list",
+    backend: str = "auto",
+):
+    """
+    Быстрый массив с ограниченным числом уникальных значений: пул из k_unique целых
+    в [-10·k, 10·k] и затем n индексов пула, оба – в режиме fast из одного rng.
+    """
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    if k_unique <= 0:
+        raise ValueError("Ошибка: k_unique должно быть положительным")
+    backend = _resolve_backend(backend, output)
+    rng = random.Random(seed)
+    pool = _fast_ints(rng, k_unique, -10 * k_unique, 10 * k_unique, "python")
+    indexes = _fast_ints(rng, n, 0, k_unique - 1, backend)
+    if backend == "numpy":
+        values = np.asarray(pool, dtype="int64")[indexes]
+    else:
+        values = [pool[index] for index in indexes]
+    return _convert_output(values, "q", output)
+
+
+def reverse_sorted_fast(n: int, *, output: str = "list", backend: str = "auto"):
+    """Быстрый массив длины n, отсортированный по убыванию."""
+    if n < 0:
+        raise ValueError("Длина массива должна быть неотрицательной")
+    backend = _resolve_backend(backend, output)
+    if backend == "numpy":
+        values = np.arange(n, 0, -1, dtype="int64")
+    else:
+        values = array("q", range(n, 0, -1))
+    return _convert_output(values, "q", output)
@@ -0,0 +1,20 @@
+import math
+from typing import Sequence
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Перцентиль по ближайшему рангу для отсортированных значений (0 для пустых)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(latencies: Sequence[float]) -> dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "p50": percentile(ordered, 0.5),
+        "p90": percentile(ordered, 0.9),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
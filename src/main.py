@@ -1,25 +1,35 @@
+import os
+import sys
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Mapping, Sequence
+
 import typer
 
-from src.benchmark import timeit_once
-from src.data_structures import Queue, Stack
-from src.generators import (
-    many_duplicates,
-    nearly_sorted,
-    rand_float_array,
-    rand_int_array,
-    reverse_sorted,
-)
-from src.sequences import factorial, factorial_recursive, fibo, fibo_recursive
+# Тяжелые модули (benchmark, datasets, generators с NumPy, results, profiling и т.д.)
+# импортируются внутри команд: запуск CLI платит только за то, что нужно команде.
+from src.number_io import NUMBER_FORMATS, parse_token
 from src.sorting import (
+    adaptive_sort,
     bubble_sort,
     bucket_sort,
     counting_sort,
     heap_sort,
+    k_sorted_sort,
     quick_sort,
     radix_sort,
+    sorted_unique,
+    value_counts,
 )
 
+if TYPE_CHECKING:
+    from src.benchmark import SweepCell
+    from src.dataset_cache import DatasetCache
+
 app = typer.Typer(help="Алгоритмический мини-пакет: последовательности, сортировки и структуры данных.")
+cache_app = typer.Typer(help="Кэш сгенерированных наборов для бенчмарка.")
+app.add_typer(cache_app, name="cache")
 
 INTERACTIVE_COMMANDS = {
     "help": "help - показать список доступных команд.",
@@ -41,7 +51,7 @@ INTERACTIVE_COMMANDS = {
     "queue_enqueue": "queue_enqueue <значение> - добавить в очередь.",
     "queue_dequeue": "queue_dequeue - извлечь из очереди.",
     "queue_front": "queue_front - посмотреть первый элемент очереди.",
-    "benchmark": "benchmark [числа] - замеры bubble/quick/heap/counting/radix/bucket, секунды суммарно (runs=100000 по умолчанию).",
+    "benchmark": "benchmark [числа] [runs=<r>] - замеры bubble/quick/heap/counting/radix/bucket, медиана на вызов (runs подбирается автоматически).",
 }
 
 
@@ -50,13 +60,15 @@ def entrypoint(ctx: typer.Context) -> None:
     """
     Точка входа. Без аргументов запускает интерактивный режим.
     """
+    # CLI печатает факториалы и числа Фибоначчи длиннее 4300 цифр – снимаем лимит int -> str.
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
     if ctx.invoked_subcommand is None:
         interactive_session()
 
 
 def parse_single_number(token: str) -> int | float:
-    value = float(token)
-    return int(value) if value.is_integer() else value
+    return parse_token(token)
 
 
 def parse_numbers(tokens: list[str]) -> list[int | float]:
@@ -94,7 +106,7 @@ def format_sequence(values: list[object]) -> str:
     return "[" + ", ".join(format_value(value) for value in values) + "]"
 
 
-ALGOS = {
+ALGOS: dict[str, Callable[..., list]] = {
     "bubble": bubble_sort,
     "quick": quick_sort,
     "heap": heap_sort,
@@ -104,48 +116,228 @@ ALGOS = {
 }
 
 
-def benchmark_lines(arrays: dict[str, list[object]], runs: int) -> list[str]:
-    lines = [f"runs={runs}, единицы: секунды (суммарно)"]
-    totals_per_algo = {name: 0.0 for name in ALGOS}
-    counts_per_algo = {name: 0 for name in ALGOS}
+def format_seconds(value: float) -> str:
+    return f"{value:.3e}"
+
+
+def benchmark_lines(
+    arrays: Mapping[str, Sequence],
+    runs: int | None,
+    samples: int = 7,
+    target_time: float = 0.01,
+) -> list[str]:
+    from src.benchmark import run_benchmark
+
+    results = run_benchmark(arrays, ALGOS, runs=runs, samples=samples, target_time=target_time)
+    return format_benchmark_lines(arrays, results, runs, samples)
+
+
+def format_bytes(value: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def failure_label(outcome: Exception) -> str:
+    """Пометка для ячейки бенчмарка, завершившейся исключением."""
+    if isinstance(outcome, RecursionError):
+        return "переполнение стека"
+    if isinstance(outcome, (TimeoutError, MemoryError)):
+        return "прервано"
+    return "не поддерживается"
+
+
+def format_benchmark_lines(
+    arrays: Mapping[str, Sequence],
+    results: dict[str, dict[str, dict | Exception]],
+    runs: int | None,
+    samples: int,
+) -> list[str]:
+    runs_label = runs if runs is not None else "auto"
+    lines = [f"runs={runs_label}, samples={samples}, единицы: секунды на один вызов (медиана по замерам)"]
+    medians_per_algo: dict[str, list[float]] = {name: [] for name in ALGOS}
     for name, array in arrays.items():
         lines.append("")
         lines.append(f"{name} (n={len(array)}):")
-        for algo_name, algo in ALGOS.items():
-            total = 0.0
-            try:
-                for run_index in range(runs):
-                    total += timeit_once(algo, array.copy())
-                totals_per_algo[algo_name] += total
-                counts_per_algo[algo_name] += 1
-                lines.append(f"  {algo_name}: {format_value(total)} s")
-            except Exception as exc:
-                lines.append(f"  {algo_name}: не поддерживается ({exc})")
+        for algo_name, outcome in results[name].items():
+            if isinstance(outcome, Exception):
+                lines.append(f"  {algo_name}: {failure_label(outcome)} ({outcome})")
+                continue
+            medians_per_algo[algo_name].append(outcome["median"])
+            lines.append(
+                f"  {algo_name}: {format_seconds(outcome['median'])} s"
+                f" (min {format_seconds(outcome['min'])}, IQR {format_seconds(outcome['iqr'])},"
+                f" σ {format_seconds(outcome['stdev'])}, loops={outcome['loops']}, выбросов {outcome['outliers']})"
+            )
+            if "peak_bytes" in outcome:
+                lines.append(
+                    f"    память: пик {format_bytes(outcome['peak_bytes'])}, блоков {outcome['net_blocks']:+d},"
+                    f" {outcome['bytes_per_element']:.1f} B/элемент"
+                )
     lines.append("")
-    lines.append("среднее время:")
-    for algo_name in ALGOS:
-        if counts_per_algo[algo_name]:
-            average = totals_per_algo[algo_name] / counts_per_algo[algo_name]
-            lines.append(f"  {algo_name}: {format_value(average)} s")
+    lines.append("среднее время (по медианам наборов):")
+    for algo_name, medians in medians_per_algo.items():
+        if medians:
+            lines.append(f"  {algo_name}: {format_seconds(sum(medians) / len(medians))} s")
         else:
             lines.append(f"  {algo_name}: нет поддерживаемых наборов")
     return lines
 
 
-def build_benchmark_inputs(custom: list[int] | None) -> dict[str, list[object]]:
+# Параметры стандартных и патологических наборов бенчмарка: имя набора – это имя генератора
+# из src/generators.py, параметры (вместе с seed) передаются ему как есть и попадают в отчет
+# и в ключ кэша наборов.
+BENCHMARK_SPECS: dict[str, dict[str, int | float]] = {
+    "rand_int_array": {"seed": 7, "lo": -50, "hi": 50},
+    "nearly_sorted": {"seed": 1, "swaps": 3},
+    "many_duplicates": {"seed": 2, "k_unique": 5},
+    "reverse_sorted": {},
+    "rand_float_array": {"seed": 3, "lo": 0.0, "hi": 1.0},
+}
+ADVERSARIAL_SPECS: dict[str, dict[str, int | float]] = {
+    "quick_sort_killer": {},
+    "bucket_skew": {"seed": 4},
+    "wide_range_ints": {"seed": 5, "span": 10**5},
+    "organ_pipe": {},
+    "sawtooth": {"teeth": 4},
+    "zipf_ints": {"seed": 6},
+    "lognormal_floats": {"seed": 8},
+    "pareto_floats": {"seed": 9},
+    "sorted_with_tail": {"seed": 10},
+}
+
+
+def dataset_params(name: str, size: int) -> dict:
+    """
+    Фактические параметры генератора набора name для размера size: хвост sorted_with_tail – 10%
+    (не больше size), в массивах короче 2 элементов перестановок nearly_sorted нет.
+    """
+    params = dict(BENCHMARK_SPECS[name] if name in BENCHMARK_SPECS else ADVERSARIAL_SPECS[name])
+    if name == "sorted_with_tail":
+        params["tail"] = min(size, max(1, size // 10))
+    if name == "nearly_sorted" and size < 2:
+        params["swaps"] = 0
+    return params
+
+
+def build_dataset(name: str, size: int) -> list[object]:
+    """Набор бенчмарка по таблицам BENCHMARK_SPECS/ADVERSARIAL_SPECS (генераторы в памяти)."""
+    from src import generators
+
+    return getattr(generators, name)(size, **dataset_params(name, size))
+
+
+BENCHMARK_SUITES = ("default", "adversarial", "all")
+REPORT_FORMATS = ("text", "json", "csv")
+
+
+def build_adversarial_inputs(size: int) -> dict[str, Sequence]:
+    """
+    Патологические и «реалистичные» наборы: худшие случаи отдельных алгоритмов и тяжелые хвосты.
+    """
+    return {name: build_dataset(name, size) for name in ADVERSARIAL_SPECS}
+
+
+def build_benchmark_inputs(
+    custom: list[int] | None,
+    size: int = 20,
+    cache: "DatasetCache | None" = None,
+    stack: ExitStack | None = None,
+    suite: str = "default",
+) -> dict[str, Sequence]:
+    """
+    Наборы для бенчмарка. suite: "default" (стандартные генераторы), "adversarial"
+    (build_adversarial_inputs) или "all". С cache стандартные наборы один раз строятся теми же
+    генераторами в памяти, сохраняются в дисковый кэш и открываются через mmap (значения
+    совпадают с набором без кэша); файлы закрывает stack.
+    """
+    if suite not in BENCHMARK_SUITES:
+        raise ValueError(f"Неизвестный набор бенчмарка: {suite}")
     if custom is not None:
         return {"custom": custom}
-    size = 20
+    if suite == "adversarial":
+        return build_adversarial_inputs(size)
+    if suite == "all":
+        return {**build_benchmark_inputs(None, size, cache, stack), **build_adversarial_inputs(size)}
+    if cache is None:
+        return {name: build_dataset(name, size) for name in BENCHMARK_SPECS}
+    if stack is None:
+        raise ValueError("Для наборов из кэша нужен ExitStack")
     return {
-        "rand_int_array": rand_int_array(size, -50, 50, seed=7),
-        "nearly_sorted": nearly_sorted(size, swaps=3, seed=1),
-        "many_duplicates": many_duplicates(size, k_unique=5, seed=2),
-        "reverse_sorted": reverse_sorted(size),
-        "rand_float_array": rand_float_array(size, seed=3),
+        name: stack.enter_context(
+            cache.load_values(name, size, partial(build_dataset, name, size), **dataset_params(name, size))
+        ).values
+        for name in BENCHMARK_SPECS
     }
 
 
-def build_benchmark_report(custom: list[int] | None, runs: int) -> str:
+def sweep_generators(suite: str) -> dict[str, Callable[[int], Sequence]]:
+    """
+    Генераторы n -> набор для прогона по размерам (стандартные – в быстром режиме).
+    """
+    from src.generators import (
+        many_duplicates_fast,
+        nearly_sorted_fast,
+        rand_float_array_fast,
+        rand_int_array_fast,
+        reverse_sorted_fast,
+    )
+
+    if suite not in BENCHMARK_SUITES:
+        raise ValueError(f"Неизвестный набор бенчмарка: {suite}")
+    default: dict[str, Callable[[int], Sequence]] = {
+        "rand_int_array": lambda n: rand_int_array_fast(n, -50, 50, seed=7),
+        "nearly_sorted": lambda n: nearly_sorted_fast(n, swaps=max(1, n // 10), seed=1),
+        "many_duplicates": lambda n: many_duplicates_fast(n, k_unique=5, seed=2),
+        "reverse_sorted": lambda n: reverse_sorted_fast(n),
+        "rand_float_array": lambda n: rand_float_array_fast(n, seed=3),
+    }
+    adversarial: dict[str, Callable[[int], Sequence]] = {
+        name: partial(build_dataset, name) for name in ADVERSARIAL_SPECS
+    }
+    if suite == "default":
+        return default
+    if suite == "adversarial":
+        return adversarial
+    return {**default, **adversarial}
+
+
+def numeric_cmp(left: float, right: float) -> int:
+    return (left > right) - (left < right)
+
+
+def sweep_lines(results: Mapping[str, Mapping[str, "SweepCell"]]) -> list[str]:
+    from src.benchmark import find_crossovers
+
+    lines = ["единицы: секунды на один вызов, k – показатель степени t ~ n^k"]
+    for generator_name, cells in results.items():
+        lines.append("")
+        lines.append(f"{generator_name}:")
+        for algo_name, cell in cells.items():
+            if cell["sizes"]:
+                text = f"  {algo_name}: n={cell['sizes'][0]}..{cell['sizes'][-1]}"
+                text += f", t(n_max)={format_seconds(cell['medians'][-1])} s"
+            else:
+                text = f"  {algo_name}: нет замеров"
+            if cell["exponent"] is not None:
+                text += f", k≈{cell['exponent']:.2f}"
+                if cell["expected"] is not None:
+                    text += f" (ожидалось {cell['expected']:.2f})"
+            if cell["stopped_at"] is not None:
+                text += f", остановлен на n={cell['stopped_at']}"
+            if cell["error"]:
+                text += f" ({cell['error']})"
+            if cell["flagged"]:
+                text += " [ХУЖЕ ОЖИДАЕМОГО]"
+            lines.append(text)
+        for faster_small, faster_large, size in find_crossovers(cells):
+            lines.append(f"  пересечение: {faster_small} быстрее до n≈{size:.0f}, дальше быстрее {faster_large}")
+    return lines
+
+
+def build_benchmark_report(custom: list[int] | None, runs: int | None) -> str:
     arrays = build_benchmark_inputs(custom)
     return "\n".join(benchmark_lines(arrays, runs))
 
@@ -161,6 +353,9 @@ def interactive_session() -> None:
     """
     Запускает интерактивную сессию с командами сортировок, последовательностей и структур данных.
     """
+    from src.data_structures import Queue, Stack
+    from src.sequences import factorial, factorial_recursive, fibo, fibo_recursive
+
     stack = Stack()
     queue = Queue()
     typer.echo("Интерактивный режим. Введите help для списка команд, quit/exit для выхода.")
@@ -229,7 +424,7 @@ def interactive_session() -> None:
             elif command == "queue_front":
                 typer.echo(f"front -> {queue.front()}")
             elif command == "benchmark":
-                runs = 100000
+                runs = None
                 if args and args[-1].startswith("runs="):
                     runs = int(args.pop().split("=", maxsplit=1)[1])
                 numbers = parse_ints(args) if args else None
@@ -254,64 +449,301 @@ def int_argument(values: list[str]) -> list[int]:
         raise typer.BadParameter(str(exc)) from exc
 
 
+def sort_input(values: list[str] | None, source: str | None, fmt: str, ints: bool = False) -> list:
+    """
+    Числа для команды сортировки: из аргументов или из --input (файл или "-" для stdin).
+    """
+    from src.number_io import read_numbers
+
+    if source is None:
+        if not values:
+            raise typer.BadParameter("Нужно передать числа аргументами или через --input.")
+        return int_argument(values) if ints else numbers_argument(values)
+    if values:
+        raise typer.BadParameter("Числа передаются либо аргументами, либо через --input.")
+    try:
+        numbers = read_numbers(source, fmt)
+    except (OSError, ValueError, KeyError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    if ints and not all(isinstance(number, int) for number in numbers):
+        raise typer.BadParameter("Ожидались только целые числа.")
+    return numbers
+
+
+def echo_sorted(
+    name: str,
+    sort: Callable[[list], list],
+    values: list,
+    profile: Path | None,
+    output: str | None = None,
+    output_format: str = "text",
+) -> None:
+    """
+    Выводит результат сортировки: списком в stdout или, с output, потоково в файл/stdout ("-").
+    С profile запускает сортировку под cProfile, сохраняет pstats и свернутые стеки в этот
+    каталог и выводит сводку горячих функций в stderr.
+    """
+    from src.number_io import write_numbers
+    from src.profiling import profile_call, profile_summary, write_profile
+
+    if profile is None:
+        result = sort(values)
+    else:
+        result, stats = profile_call(sort, values)  # type: ignore[assignment]
+        stats_path, collapsed_path = write_profile(stats, profile, name)
+    if output is None:
+        typer.echo(format_sequence(result))
+    else:
+        try:
+            write_numbers(output, result, output_format)
+        except BrokenPipeError:
+            # Читатель (например, head) закрыл канал раньше времени – это не ошибка сортировки.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            raise typer.Exit()
+        except (OSError, ValueError) as exc:
+            raise typer.BadParameter(str(exc)) from exc
+    if profile is not None:
+        typer.echo(f"профиль {name}: {stats_path}, {collapsed_path}", err=True)
+        for line in profile_summary(stats):
+            typer.echo(line, err=True)
+
+
+PROFILE_HELP = "Каталог для профиля cProfile (.pstats и свернутые стеки .collapsed)"
+
+
+class SortIO:
+    """Общие опции ввода/вывода команд сортировки."""
+
+    values = typer.Argument(None, help="Числа через пробел (или --input)")
+    ints = typer.Argument(None, help="Целые числа через пробел (или --input)")
+    source = typer.Option(None, "--input", help='Файл с числами или "-" для stdin')
+    input_format = typer.Option("text", help=f"Формат --input: {', '.join(NUMBER_FORMATS)}")
+    output = typer.Option(None, help='Файл для результата или "-" для stdout (по числу в строке)')
+    output_format = typer.Option("text", help=f"Формат --output: {', '.join(NUMBER_FORMATS)}")
+    profile = typer.Option(None, help=PROFILE_HELP)
+
+
+def check_formats(*formats: str) -> None:
+    for fmt in formats:
+        if fmt not in NUMBER_FORMATS:
+            raise typer.BadParameter(f"Неизвестный формат чисел: {fmt}")
+
+
 @app.command("bubble")
-def bubble_cmd(values: list[str] = typer.Argument(..., help="Числа через пробел")) -> None:
-    typer.echo(format_sequence(bubble_sort(numbers_argument(values))))
+def bubble_cmd(
+    values: list[str] = SortIO.values,
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+    output: str | None = SortIO.output,
+    output_format: str = SortIO.output_format,
+    profile: Path | None = SortIO.profile,
+) -> None:
+    check_formats(input_format, output_format)
+    numbers = sort_input(values, source, input_format)
+    echo_sorted("bubble", bubble_sort, numbers, profile, output, output_format)
 
 
 @app.command("quick")
-def quick_cmd(values: list[str] = typer.Argument(..., help="Числа через пробел")) -> None:
-    typer.echo(format_sequence(quick_sort(numbers_argument(values))))
+def quick_cmd(
+    values: list[str] = SortIO.values,
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+    output: str | None = SortIO.output,
+    output_format: str = SortIO.output_format,
+    profile: Path | None = SortIO.profile,
+) -> None:
+    check_formats(input_format, output_format)
+    numbers = sort_input(values, source, input_format)
+    echo_sorted("quick", quick_sort, numbers, profile, output, output_format)
 
 
 @app.command("counting")
-def counting_cmd(values: list[str] = typer.Argument(..., help="Целые числа через пробел")) -> None:
-    typer.echo(format_sequence(counting_sort(int_argument(values))))
+def counting_cmd(
+    values: list[str] = SortIO.ints,
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+    output: str | None = SortIO.output,
+    output_format: str = SortIO.output_format,
+    profile: Path | None = SortIO.profile,
+) -> None:
+    check_formats(input_format, output_format)
+    numbers = sort_input(values, source, input_format, ints=True)
+    echo_sorted("counting", counting_sort, numbers, profile, output, output_format)
 
 
 @app.command("radix")
 def radix_cmd(
-    values: list[str] = typer.Argument(..., help="Целые числа через пробел"),
+    values: list[str] = SortIO.ints,
     base: int = typer.Option(10, min=2, help="Основание системы счисления"),
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+    output: str | None = SortIO.output,
+    output_format: str = SortIO.output_format,
+    profile: Path | None = SortIO.profile,
 ) -> None:
-    typer.echo(format_sequence(radix_sort(int_argument(values), base=base)))
+    check_formats(input_format, output_format)
+    numbers = sort_input(values, source, input_format, ints=True)
+    echo_sorted("radix", partial(radix_sort, base=base), numbers, profile, output, output_format)
 
 
 @app.command("bucket")
 def bucket_cmd(
-    values: list[str] = typer.Argument(..., help="Числа через пробел"),
+    values: list[str] = SortIO.values,
     buckets: int | None = typer.Option(None, min=1, help="Количество корзин"),
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+    output: str | None = SortIO.output,
+    output_format: str = SortIO.output_format,
+    profile: Path | None = SortIO.profile,
 ) -> None:
-    typer.echo(format_sequence(bucket_sort(numbers_argument(values), buckets=buckets)))
+    check_formats(input_format, output_format)
+    numbers = sort_input(values, source, input_format)
+    echo_sorted("bucket", partial(bucket_sort, buckets=buckets), numbers, profile, output, output_format)
 
 
 @app.command("heap")
-def heap_cmd(values: list[str] = typer.Argument(..., help="Числа через пробел")) -> None:
-    typer.echo(format_sequence(heap_sort(numbers_argument(values))))
+def heap_cmd(
+    values: list[str] = SortIO.values,
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+    output: str | None = SortIO.output,
+    output_format: str = SortIO.output_format,
+    profile: Path | None = SortIO.profile,
+) -> None:
+    check_formats(input_format, output_format)
+    numbers = sort_input(values, source, input_format)
+    echo_sorted("heap", heap_sort, numbers, profile, output, output_format)
+
+
+@app.command("k-sorted")
+def k_sorted_cmd(
+    values: list[str] = SortIO.values,
+    k: int | None = typer.Option(
+        None, min=0, help="Максимальное смещение элемента; по умолчанию оценивается по выборке"
+    ),
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+    output: str | None = SortIO.output,
+    output_format: str = SortIO.output_format,
+    profile: Path | None = SortIO.profile,
+) -> None:
+    """
+    Сортировка почти упорядоченных данных за O(n log k); без --k движок выбирается автоматически.
+    """
+    check_formats(input_format, output_format)
+    numbers = sort_input(values, source, input_format)
+    if k is None:
+        echo_sorted("k-sorted", adaptive_sort, numbers, profile, output, output_format)
+        return
+    try:
+        echo_sorted("k-sorted", partial(k_sorted_sort, k=k), numbers, profile, output, output_format)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+
+@app.command("unique")
+def unique_cmd(
+    values: list[str] = SortIO.values,
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+    output: str | None = SortIO.output,
+    output_format: str = SortIO.output_format,
+    profile: Path | None = SortIO.profile,
+) -> None:
+    """
+    Различные значения по возрастанию (для целых – прямо из корзин сортировки подсчетом).
+    """
+    check_formats(input_format, output_format)
+    numbers = sort_input(values, source, input_format)
+    echo_sorted("unique", sorted_unique, numbers, profile, output, output_format)
+
+
+@app.command("value-counts")
+def value_counts_cmd(
+    values: list[str] = SortIO.values,
+    source: str | None = SortIO.source,
+    input_format: str = SortIO.input_format,
+) -> None:
+    """
+    Число повторов каждого значения, по возрастанию значений.
+    """
+    check_formats(input_format)
+    numbers = sort_input(values, source, input_format)
+    distinct, counts = value_counts(numbers)
+    for value, count in zip(distinct, counts):
+        typer.echo(f"{format_value(value)}: {count}")
 
 
 @app.command("factorial")
 def factorial_cmd(n: int = typer.Argument(..., help="Натуральное число")) -> None:
+    from src.sequences import factorial
+
     typer.echo(factorial(n))
 
 
 @app.command("factorial-rec")
 def factorial_rec_cmd(n: int = typer.Argument(..., help="Натуральное число")) -> None:
+    from src.sequences import factorial_recursive
+
     typer.echo(factorial_recursive(n))
 
 
+@app.command("factorial-fast")
+def factorial_fast_cmd(
+    n: int = typer.Argument(..., help="Натуральное число"),
+    workers: int | None = typer.Option(None, min=1, help="Число процессов для частичных произведений"),
+    prime_swing: bool = typer.Option(False, "--prime-swing", help="Использовать алгоритм prime-swing"),
+) -> None:
+    from src.sequences import factorial_fast, factorial_prime_swing
+
+    typer.echo(factorial_prime_swing(n) if prime_swing else factorial_fast(n, workers=workers))
+
+
+@app.command("factorial-mod")
+def factorial_mod_cmd(
+    n: int = typer.Argument(..., help="Натуральное число"),
+    m: int = typer.Argument(..., help="Модуль"),
+) -> None:
+    from src.sequences import factorial_mod
+
+    typer.echo(factorial_mod(n, m))
+
+
 @app.command("fibo")
 def fibo_cmd(n: int = typer.Argument(..., help="Номер числа Фибоначчи")) -> None:
+    from src.sequences import fibo
+
     typer.echo(fibo(n))
 
 
 @app.command("fibo-rec")
 def fibo_rec_cmd(n: int = typer.Argument(..., help="Номер числа Фибоначчи")) -> None:
+    from src.sequences import fibo_recursive
+
     typer.echo(fibo_recursive(n))
 
 
+@app.command("fibo-fast")
+def fibo_fast_cmd(n: int = typer.Argument(..., help="Номер числа Фибоначчи")) -> None:
+    from src.sequences import fibo_fast
+
+    typer.echo(fibo_fast(n))
+
+
+@app.command("fibo-mod")
+def fibo_mod_cmd(
+    n: int = typer.Argument(..., help="Номер числа Фибоначчи"),
+    m: int = typer.Argument(..., help="Модуль"),
+) -> None:
+    from src.sequences import fibo_mod
+
+    typer.echo(fibo_mod(n, m))
+
+
 @app.command("stack-demo")
 def stack_demo(values: list[int] = typer.Argument([3, 1, 4], help="Числа для последовательных push")) -> None:
+    from src.data_structures import Stack
+
     stack = Stack()
     for value in values:
         stack.push(value)
@@ -322,6 +754,8 @@ def stack_demo(values: list[int] = typer.Argument([3, 1, 4], help="Числа д
 
 @app.command("queue-demo")
 def queue_demo(values: list[int] = typer.Argument([1, 2, 3], help="Числа для последовательных enqueue")) -> None:
+    from src.data_structures import Queue
+
     queue = Queue()
     for value in values:
         queue.enqueue(value)
@@ -330,17 +764,532 @@ def queue_demo(values: list[int] = typer.Argument([1, 2, 3], help="Числа д
     typer.echo(f"dequeue -> {dequeued}; новый размер={len(queue)}; первый={queue.front() if not queue.is_empty() else 'n/a'}")
 
 
+@app.command("benchmark-factorial")
+def benchmark_factorial_cmd(
+    n: int = typer.Argument(10000, min=0, help="Аргумент факториала"),
+    runs: int = typer.Option(3, min=1, help="Сколько раз повторить каждую реализацию"),
+    workers: int | None = typer.Option(None, min=2, help="Добавить параллельный вариант с этим числом процессов"),
+) -> None:
+    from src.benchmark import benchmark_factorials
+
+    typer.echo(f"n={n}, runs={runs}, единицы: секунды (среднее)")
+    for name, seconds in benchmark_factorials(n, runs, workers).items():
+        if seconds is None:
+            typer.echo(f"  {name}: превышен лимит рекурсии")
+        else:
+            typer.echo(f"  {name}: {format_value(seconds)} s")
+
+
+def parse_params(tokens: list[str]) -> dict[str, int | float]:
+    params = {}
+    for token in tokens:
+        name, separator, raw_value = token.partition("=")
+        if not separator or not name:
+            raise typer.BadParameter(f"Ожидался параметр вида имя=значение: {token}")
+        try:
+            params[name] = parse_single_number(raw_value)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+    return params
+
+
+@app.command("make-dataset")
+def make_dataset_cmd(
+    path: Path = typer.Argument(..., help="Файл для записи набора"),
+    generator: str = typer.Argument(..., help="Потоковый генератор (rand_int_array, nearly_sorted, ...)"),
+    n: int = typer.Argument(..., min=0, help="Число элементов"),
+    seed: int = typer.Option(0, help="Seed генерации"),
+    chunk_size: int | None = typer.Option(None, min=1, help="Размер чанка в элементах (по умолчанию 2^20)"),
+    param: list[str] = typer.Option(None, "--param", help="Параметр генератора вида имя=значение"),
+    workers: int | None = typer.Option(None, min=1, help="Число процессов генерации (результат от него не зависит)"),
+) -> None:
+    from src.datasets import DEFAULT_CHUNK_SIZE, write_dataset
+
+    try:
+        header = write_dataset(
+            str(path), generator, n, chunk_size=chunk_size or DEFAULT_CHUNK_SIZE, seed=seed, workers=workers, **parse_params(param or [])
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    typer.echo(f"Записано {header['n']} значений ({header['dtype']}) в {path}")
+
+
+def profile_benchmark(
+    arrays: Mapping[str, Sequence],
+    results: dict[str, dict[str, dict | Exception]],
+    directory: Path,
+) -> list[str]:
+    """
+    Отдельный прогон каждой успешной ячейки под cProfile (столько вызовов, сколько было в замере):
+    файлы algo-dataset.pstats/.collapsed в directory и строки сводки для отчета.
+    """
+    from src.profiling import profile_call, profile_summary, write_profile
+
+    lines = ["", f"профили (каталог {directory}):"]
+    for name, array in arrays.items():
+        for algo_name, outcome in results[name].items():
+            if isinstance(outcome, Exception):
+                continue
+            _, stats = profile_call(ALGOS[algo_name], array, repeat=outcome.get("loops", 1))
+            write_profile(stats, directory, f"{algo_name}-{name}")
+            lines.append(f"{algo_name}/{name}:")
+            lines.extend(profile_summary(stats, limit=3))
+    return lines
+
+
 @app.command("benchmark")
 def benchmark_cmd(
     values: list[str] = typer.Argument(
         None,
         help="Необязательно: свои числа для замера. Если пусто — используется набор генераторов.",
     ),
-    runs: int = typer.Option(100000, min=1, help="Сколько раз повторить каждую сортировку"),
+    runs: int | None = typer.Option(
+        None, min=1, help="Вызовов в одном замере; по умолчанию подбирается автоматически по --target-time"
+    ),
+    samples: int = typer.Option(7, min=1, help="Число замеров на каждую пару набор/алгоритм"),
+    target_time: float = typer.Option(0.01, min=0.0, help="Минимальная длительность одного замера, с"),
+    datasets: list[Path] = typer.Option(None, "--dataset", help="Бинарный файл набора (make-dataset), читается через mmap"),
+    size: int = typer.Option(20, min=0, help="Размер наборов генераторов"),
+    cache_dir: Path | None = typer.Option(None, help="Каталог кэша наборов; без него наборы генерируются заново"),
+    suite: str = typer.Option("default", help=f"Группа наборов: {', '.join(BENCHMARK_SUITES)}"),
+    output_format: str = typer.Option("text", "--format", help=f"Формат отчета: {', '.join(REPORT_FORMATS)}"),
+    output: Path | None = typer.Option(None, help="Файл для отчета (по умолчанию – stdout)"),
+    history: Path | None = typer.Option(None, help="JSONL-история: дописать сводку этого запуска"),
+    history_limit: int = typer.Option(100, min=1, help="Сколько последних запусков хранить в истории"),
+    isolated: bool = typer.Option(False, "--isolated", help="Каждая пара набор/алгоритм – в отдельном процессе"),
+    workers: int | None = typer.Option(None, min=1, help="Параллельных процессов для --isolated (по умолчанию – ядра)"),
+    timeout: float | None = typer.Option(None, min=0.0, help="Лимит времени на ячейку для --isolated, с"),
+    memory_limit: int | None = typer.Option(None, min=1, help="Лимит памяти процесса для --isolated, МиБ"),
+    pin_cpus: bool = typer.Option(False, "--pin-cpus", help="Привязать процессы --isolated к отдельным ядрам"),
+    memory: bool = typer.Option(False, "--memory", help="Дополнительно замерить память (tracemalloc)"),
+    profile: Path | None = typer.Option(None, help=PROFILE_HELP + " – по файлу на пару алгоритм/набор"),
+    sort_cache: bool = typer.Option(
+        False, "--sort-cache", help="Замерять сортировки через кэш результатов (повторы входа – попадания)"
+    ),
 ) -> None:
+    from src.benchmark import run_benchmark, run_isolated
+    from src.dataset_cache import DatasetCache
+    from src.datasets import open_dataset
+    from src.results import append_history, build_results, dumps_csv, dumps_json
+
+    if suite not in BENCHMARK_SUITES:
+        raise typer.BadParameter(f"Неизвестный набор бенчмарка: {suite}")
+    if output_format not in REPORT_FORMATS:
+        raise typer.BadParameter(f"Неизвестный формат отчета: {output_format}")
     numbers = int_argument(values) if values else None
-    report = build_benchmark_report(numbers, runs)
-    typer.echo(report)
+    algos = ALGOS
+    if sort_cache:
+        from src.sort_cache import SortCache
+
+        result_cache = SortCache()
+        algos = {name: result_cache.wrap(algo) for name, algo in ALGOS.items()}
+    with ExitStack() as stack:
+        if datasets:
+            arrays: dict[str, Sequence] = {} if numbers is None else {"custom": numbers}
+            for path in datasets:
+                arrays[path.name] = stack.enter_context(open_dataset(str(path))).values
+        else:
+            dataset_cache = DatasetCache(cache_dir) if cache_dir is not None else None
+            arrays = build_benchmark_inputs(numbers, size, dataset_cache, stack, suite)
+        if isolated:
+            try:
+                results = run_isolated(
+                    arrays,
+                    algos,
+                    workers=workers,
+                    timeout=timeout or None,
+                    memory_limit=memory_limit << 20 if memory_limit is not None else None,
+                    pin_cpus=pin_cpus,
+                    runs=runs,
+                    samples=samples,
+                    target_time=target_time,
+                    memory=memory,
+                    sort_cache=sort_cache,
+                )
+            except ValueError as exc:
+                raise typer.BadParameter(str(exc)) from exc
+        else:
+            results = run_benchmark(
+                arrays,
+                algos,
+                runs=runs,
+                samples=samples,
+                target_time=target_time,
+                memory=memory,
+                sort_cache=sort_cache,
+            )
+        dataset_config = {
+            name: dataset_params(name, size)
+            for name in arrays
+            if not datasets and (name in BENCHMARK_SPECS or name in ADVERSARIAL_SPECS)
+        }
+        config = {
+            "suite": suite if not datasets and numbers is None else None,
+            "size": size,
+            "runs": runs,
+            "samples": samples,
+            "target_time": target_time,
+            "seeds": {name: params["seed"] for name, params in dataset_config.items() if "seed" in params},
+            "params": dataset_config,
+            "datasets": [str(path) for path in datasets or []],
+            "isolated": isolated,
+            "workers": workers,
+            "timeout": timeout,
+            "memory_limit_mib": memory_limit,
+            "pin_cpus": pin_cpus,
+            "memory": memory,
+            "sort_cache": sort_cache,
+        }
+        document = build_results(results, {name: len(array) for name, array in arrays.items()}, config)
+        profile_lines = profile_benchmark(arrays, results, profile) if profile is not None else []
+        if output_format == "json":
+            report = dumps_json(document)
+        elif output_format == "csv":
+            report = dumps_csv(document)
+        else:
+            report = "\n".join(format_benchmark_lines(arrays, results, runs, samples) + profile_lines)
+    if profile_lines and output_format != "text":
+        typer.echo("\n".join(profile_lines), err=True)
+    if history is not None:
+        append_history(history, document, history_limit)
+    if output is None:
+        typer.echo(report)
+    else:
+        output.write_text(report if report.endswith("\n") else report + "\n")
+        typer.echo(f"Отчет записан в {output}")
+
+
+@app.command("compare")
+def compare_cmd(
+    baseline: Path = typer.Argument(..., help="JSON-результаты базового запуска"),
+    current: Path = typer.Argument(..., help="JSON-результаты нового запуска"),
+    threshold: float = typer.Option(0.05, min=0.0, help="Допустимое относительное замедление"),
+    alpha: float = typer.Option(0.05, min=0.0, max=1.0, help="Уровень значимости (Манн–Уитни)"),
+) -> None:
+    """
+    Сравнивает два JSON-отчета benchmark; код выхода 1, если есть значимые замедления больше threshold.
+    """
+    from src.results import compare_results, load_results
+
+    try:
+        comparisons = compare_results(load_results(baseline), load_results(current), threshold=threshold, alpha=alpha)
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    regressions = 0
+    for item in comparisons:
+        regressions += item["status"] == "regression"
+        typer.echo(
+            f"{item['algorithm']}/{item['dataset']}: {format_seconds(item['baseline'])} -> "
+            f"{format_seconds(item['current'])} s ({item['ratio'] - 1:+.1%}, p={item['p_value']:.3f}) {item['status']}"
+        )
+    typer.echo(f"Сравнено ячеек: {len(comparisons)}, замедлений: {regressions}")
+    if regressions:
+        raise typer.Exit(code=1)
+
+
+@app.command("trend")
+def trend_cmd(history: Path = typer.Argument(..., help="JSONL-история benchmark --history")) -> None:
+    from src.results import history_trends, load_history
+
+    try:
+        trends = history_trends(load_history(history))
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    for name, trend in trends.items():
+        typer.echo(
+            f"{name}: запусков {trend['runs']}, последняя медиана {format_seconds(trend['last'])} s, "
+            f"всего {trend['change']:+.1%}, за запуск {trend['per_run']:+.1%}"
+        )
+
+
+@app.command("benchmark-sweep")
+def benchmark_sweep_cmd(
+    min_exp: int = typer.Option(4, min=0, help="Минимальный размер 2^min_exp"),
+    max_exp: int = typer.Option(16, min=0, help="Максимальный размер 2^max_exp"),
+    budget: float = typer.Option(1.0, min=0.0, help="Лимит времени одного вызова, с; дальше алгоритм выбывает"),
+    suite: str = typer.Option("default", help=f"Группа наборов: {', '.join(BENCHMARK_SUITES)}"),
+    samples: int = typer.Option(3, min=1, help="Число замеров на каждую точку"),
+    target_time: float = typer.Option(0.005, min=0.0, help="Минимальная длительность одного замера, с"),
+    with_cmp: bool = typer.Option(False, "--cmp", help="Передавать в сортировки cmp (ветки со вставками)"),
+) -> None:
+    from src.benchmark import geometric_sizes, sweep
+
+    try:
+        sizes = geometric_sizes(min_exp, max_exp)
+        generators = sweep_generators(suite)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    algos = {name: partial(algo, cmp=numeric_cmp) for name, algo in ALGOS.items()} if with_cmp else ALGOS
+    results = sweep(generators, algos, sizes, time_budget=budget, samples=samples, target_time=target_time)
+    typer.echo("\n".join(sweep_lines(results)))
+
+
+DS_REPORT_FORMATS = ("text", "json")
+
+
+def structure_lines(results: dict[str, dict]) -> list[str]:
+    lines = []
+    for structure, report in results.items():
+        lines.append(f"{structure}: {report['bytes_per_element']:.1f} B/элемент")
+        for trace, cell in report["traces"].items():
+            if isinstance(cell, Exception):
+                lines.append(f"  {trace}: не поддерживается ({cell})")
+                continue
+            lines.append(f"  {trace}: {cell['ops_per_sec']:,.0f} оп/с ({cell['ops']} операций за {format_seconds(cell['median'])} s)")
+            for op, latency in cell.get("latency_ns", {}).items():
+                lines.append(
+                    f"    {op}: p50 {latency['p50']:.0f} нс, p90 {latency['p90']:.0f} нс,"
+                    f" p99 {latency['p99']:.0f} нс, max {latency['max']:.0f} нс"
+                )
+    return lines
+
+
+@app.command("benchmark-ds")
+def benchmark_ds_cmd(
+    ops: int = typer.Option(20000, min=1, help="Число операций в трассе"),
+    traces: list[str] = typer.Option(None, "--trace", help="Трасса операций (по умолчанию – все)"),
+    structures: list[str] = typer.Option(None, "--structure", help="Структура данных (по умолчанию – все)"),
+    samples: int = typer.Option(5, min=1, help="Число замеров на каждую пару структура/трасса"),
+    target_time: float = typer.Option(0.01, min=0.0, help="Минимальная длительность одного замера, с"),
+    seed: int = typer.Option(0, help="Зерно генератора трасс"),
+    output_format: str = typer.Option("text", "--format", help=f"Формат отчета: {', '.join(DS_REPORT_FORMATS)}"),
+) -> None:
+    """
+    Микробенчмарк стека и очередей на трассах операций: оп/с, перцентили задержки операций, память на элемент.
+    """
+    from src.benchmark import DS_STRUCTURES, DS_TRACES, benchmark_structures, make_trace
+
+    if output_format not in DS_REPORT_FORMATS:
+        raise typer.BadParameter(f"Неизвестный формат отчета: {output_format}")
+    unknown = sorted(set(structures or ()) - set(DS_STRUCTURES))
+    if unknown:
+        raise typer.BadParameter(f"Неизвестные структуры: {', '.join(unknown)}")
+    try:
+        selected = {name: make_trace(name, ops, seed=seed) for name in (traces or DS_TRACES)}
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    chosen = {name: DS_STRUCTURES[name] for name in (structures or DS_STRUCTURES)}
+    results = benchmark_structures(selected, chosen, samples=samples, target_time=target_time)
+    if output_format == "json":
+        import json
+
+        document = {
+            structure: {
+                "bytes_per_element": report["bytes_per_element"],
+                "traces": {
+                    trace: {"error": str(cell)} if isinstance(cell, Exception) else cell
+                    for trace, cell in report["traces"].items()
+                },
+            }
+            for structure, report in results.items()
+        }
+        typer.echo(json.dumps(document, ensure_ascii=False, indent=2, sort_keys=True))
+        return
+    typer.echo("\n".join(structure_lines(results)))
+
+
+SERVICE_ADDRESS_HELP = 'Адрес сервиса: host:port или unix:/путь'
+
+
+@app.command("serve")
+def serve_cmd(
+    address: str = typer.Option("127.0.0.1:8765", help=SERVICE_ADDRESS_HELP),
+    workers: int | None = typer.Option(None, min=0, help="Процессов для сортировок (0 – поток; по умолчанию – ядра)"),
+    batch_size: int = typer.Option(32, min=1, help="Максимум сортировок в одной пачке для пула"),
+    batch_delay_ms: float = typer.Option(2.0, min=0.0, help="Сколько ждать добора пачки, мс"),
+    max_pending: int = typer.Option(256, min=1, help="Максимум одновременно обрабатываемых запросов"),
+    max_frame_mib: int = typer.Option(64, min=1, help="Максимальный размер кадра, МиБ"),
+    cache_mib: int = typer.Option(0, min=0, help="Бюджет кэша результатов сортировок, МиБ (0 – выключен)"),
+) -> None:
+    """
+    Запускает долгоживущий сервис сортировок/последовательностей/структур данных (Ctrl+C – остановить).
+    """
+    import asyncio
+
+    from src.service import parse_address, run_service
+
+    try:
+        parse_address(address)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    typer.echo(f"Сервис слушает {address}")
+    try:
+        asyncio.run(
+            run_service(
+                address,
+                workers=workers,
+                batch_size=batch_size,
+                batch_delay=batch_delay_ms / 1000,
+                max_pending=max_pending,
+                max_frame=max_frame_mib << 20,
+                cache_bytes=cache_mib << 20,
+            )
+        )
+    except KeyboardInterrupt:
+        typer.echo("Сервис остановлен")
+
+
+@app.command("client")
+def client_cmd(
+    op: str = typer.Argument(..., help="Операция: sort, fibo, factorial, stack_push, queue_dequeue, stats, ..."),
+    values: list[str] = typer.Argument(None, help="Числа для sort; n [m] для последовательностей; значение для push"),
+    address: str = typer.Option("127.0.0.1:8765", help=SERVICE_ADDRESS_HELP),
+    algorithm: str = typer.Option("quick", help="Алгоритм для sort"),
+    name: str = typer.Option("default", help="Имя стека/очереди на сервисе"),
+) -> None:
+    from src.service import SEQUENCE_OPS, ServiceClient
+
+    numbers = numbers_argument(values) if values else []
+    try:
+        with ServiceClient(address) as client:
+            if op == "sort":
+                typer.echo(format_sequence(client.sort(numbers, algorithm)))
+                return
+            params: dict[str, object] = {}
+            if op in SEQUENCE_OPS:
+                params = dict(zip(("n", "m"), numbers))
+            elif op.startswith(("stack_", "queue_")):
+                params = {"name": name, **({"value": numbers[0]} if numbers else {})}
+            result = client.call(op, **params)
+    except (OSError, RuntimeError, ValueError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    if isinstance(result, dict):
+        import json
+
+        typer.echo(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        typer.echo(format_value(result))
+
+
+@app.command("benchmark-serve")
+def benchmark_serve_cmd(
+    address: str | None = typer.Option(None, help=SERVICE_ADDRESS_HELP + " (по умолчанию – временный сервис)"),
+    requests: int = typer.Option(2000, min=1, help="Число запросов sort"),
+    concurrency: int = typer.Option(32, min=1, help="Запросов в полете одновременно"),
+    connections: int = typer.Option(4, min=1, help="Число соединений"),
+    size: int = typer.Option(100, min=0, help="Длина сортируемых массивов"),
+    algorithm: str = typer.Option("quick", help="Алгоритм сортировки"),
+    workers: int | None = typer.Option(None, min=0, help="Процессов временного сервиса"),
+    batch_size: int = typer.Option(32, min=1, help="Размер пачки временного сервиса"),
+    batch_delay_ms: float = typer.Option(2.0, min=0.0, help="Ожидание пачки временного сервиса, мс"),
+    cache_mib: int = typer.Option(0, min=0, help="Кэш результатов временного сервиса, МиБ (0 – выключен)"),
+) -> None:
+    """
+    Генератор нагрузки: пропускная способность и p50/p99 задержки сортировок через сервис.
+    """
+    import asyncio
+
+    from src.service import load_benchmark
+
+    service_options = {
+        "workers": workers,
+        "batch_size": batch_size,
+        "batch_delay": batch_delay_ms / 1000,
+        "cache_bytes": cache_mib << 20,
+    }
+    try:
+        report = asyncio.run(
+            load_benchmark(
+                address,
+                service_options,
+                requests=requests,
+                concurrency=concurrency,
+                connections=connections,
+                size=size,
+                algorithm=algorithm,
+            )
+        )
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    typer.echo(
+        f"запросов {report['requests']} (ошибок {report['errors']}) за {report['seconds']:.3f} s: "
+        f"{report['throughput']:.0f} запросов/с"
+    )
+    typer.echo(
+        "задержка: "
+        + ", ".join(f"{name} {report[name] * 1000:.2f} мс" for name in ("p50", "p90", "p99", "max"))
+    )
+    if "server" in report:
+        server = report["server"]
+        typer.echo(f"сервис: пачек {server['batches']}, в среднем {server['requests'] / max(server['batches'], 1):.1f} запросов на пачку")
+        if server["cache"] is not None:
+            typer.echo(f"кэш: попаданий {server['cache']['hits']}, промахов {server['cache']['misses']}")
+
+
+@app.command("startup")
+def startup_cmd(
+    command: str = typer.Argument("fibo 10", help="Команда CLI, запуск которой замеряется"),
+    repeats: int = typer.Option(5, min=1, help="Число запусков (берется лучший)"),
+    budget_ms: float = typer.Option(150.0, min=0.0, help="Бюджет суммарного импорта, мс"),
+    module_budget_ms: float | None = typer.Option(None, min=0.0, help="Бюджет импорта одного модуля, мс"),
+    top: int = typer.Option(8, min=1, help="Сколько самых дорогих модулей показать"),
+) -> None:
+    """
+    Замеряет запуск CLI через python -X importtime; код выхода 1 при превышении бюджета.
+    """
+    import shlex
+
+    from src.benchmark import measure_startup
+
+    try:
+        report = measure_startup(shlex.split(command), repeats=repeats, cwd=str(Path(__file__).resolve().parent.parent))
+    except RuntimeError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    total_ms = report["total_import"] / 1000
+    typer.echo(f"{command}: запуск {report['wall'] * 1000:.1f} мс, импорт {total_ms:.1f} мс (бюджет {budget_ms:g} мс)")
+    for name, micros in list(report["imports"].items())[:top]:
+        typer.echo(f"  {name}: {micros / 1000:.1f} мс")
+    violations = [] if total_ms <= budget_ms else [f"суммарный импорт {total_ms:.1f} мс > {budget_ms:g} мс"]
+    if module_budget_ms is not None:
+        violations += [
+            f"{name}: {micros / 1000:.1f} мс > {module_budget_ms:g} мс"
+            for name, micros in report["imports"].items()
+            if micros / 1000 > module_budget_ms
+        ]
+    for violation in violations:
+        typer.echo(f"Превышен бюджет: {violation}")
+    if violations:
+        raise typer.Exit(code=1)
+
+
+def open_cache(cache_dir: Path | None, max_bytes: int | None) -> "DatasetCache":
+    from src.dataset_cache import DEFAULT_CACHE_DIR, DatasetCache
+
+    try:
+        return DatasetCache(cache_dir or DEFAULT_CACHE_DIR, max_bytes)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+
+@cache_app.command("list")
+def cache_list_cmd(cache_dir: Path | None = typer.Option(None, help="Каталог кэша (по умолчанию $LABS_DATASET_CACHE или ~/.cache/labs-datasets)")) -> None:
+    cache = open_cache(cache_dir, None)
+    entries = cache.entries()
+    for meta in entries:
+        seed = meta["seed"] if meta["seed"] is not None else meta["params"].get("seed", "-")
+        typer.echo(f"{meta['key'][:12]}  {meta['generator']:<18} n={meta['n']:<10} seed={seed!s:<6} {meta['size']} B")
+    typer.echo(f"Записей: {len(entries)}, всего {sum(meta['size'] for meta in entries)} B")
+
+
+@cache_app.command("prewarm")
+def cache_prewarm_cmd(
+    sizes: list[int] = typer.Option([20], "--size", min=0, help="Размеры наборов (можно несколько)"),
+    cache_dir: Path | None = typer.Option(None, help="Каталог кэша (по умолчанию $LABS_DATASET_CACHE или ~/.cache/labs-datasets)"),
+    max_bytes: int | None = typer.Option(None, min=1, help="Лимит размера кэша в байтах (по умолчанию 1 ГиБ)"),
+) -> None:
+    from src.dataset_cache import DEFAULT_CACHE_MAX_BYTES
+
+    cache = open_cache(cache_dir, max_bytes or DEFAULT_CACHE_MAX_BYTES)
+    for size in sizes:
+        for name in BENCHMARK_SPECS:
+            key = cache.ensure_values(name, size, partial(build_dataset, name, size), **dataset_params(name, size))
+            typer.echo(f"{name} (n={size}): {key[:12]}")
+
+
+@cache_app.command("purge")
+def cache_purge_cmd(cache_dir: Path | None = typer.Option(None, help="Каталог кэша (по умолчанию $LABS_DATASET_CACHE или ~/.cache/labs-datasets)")) -> None:
+    removed = open_cache(cache_dir, None).purge()
+    typer.echo(f"Удалено записей: {removed}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+import sys
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Hashable, Iterable
+
+_MISSING = object()
+
+
+class MemoCache:
+    """
+    Ограниченный кэш мемоизации с вытеснением LRU. Лимит задается числом записей
+    и/или суммарным размером значений в байтах (по sys.getsizeof). Ведет статистику
+    попаданий, промахов и вытеснений. Последняя добавленная запись не вытесняется,
+    даже если одна превышает max_bytes.
+    """
+
+    def __init__(self, max_entries: int | None = 1024, max_bytes: int | None = None) -> None:
+        self.entries: OrderedDict = OrderedDict()
+        self.sizes: dict[Hashable, int] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.max_entries: int | None = None
+        self.max_bytes: int | None = None
+        self.resize(max_entries=max_entries, max_bytes=max_bytes)
+
+    def resize(self, *, max_entries: int | None = None, max_bytes: int | None = None) -> None:
+        """
+        Меняет лимиты (None – без ограничения) и сразу вытесняет лишнее.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries должно быть положительным")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes должно быть положительным")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _over_limit(self) -> bool:
+        if self.max_entries is not None and len(self.entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+
+    def _evict(self) -> None:
+        while len(self.entries) > 1 and self._over_limit():
+            key, value = self.entries.popitem(last=False)
+            self.total_bytes -= self.sizes.pop(key)
+            self.evictions += 1
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: object) -> None:
+        if key in self.entries:
+            self.total_bytes -= self.sizes[key]
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.sizes[key] = sys.getsizeof(value)
+        self.total_bytes += self.sizes[key]
+        self._evict()
+
+    def warm(self, func: Callable[[Hashable], object], keys: Iterable[Hashable]) -> None:
+        """
+        Заранее вычисляет func для переданных ключей (func сама кладет значения в кэш).
+        """
+        for key in keys:
+            func(key)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.sizes.clear()
+        self.total_bytes = 0
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+        }
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def chunked_memo(cache: MemoCache, chunk: int = 256) -> Callable:
+    """
+    Декоратор мемоизации рекурсивной функции от натурального n через MemoCache.
+    Холодный вызов сначала итеративно прогревает кэш опорными точками chunk, 2·chunk, ...
+    (вместе с предыдущими значениями), поэтому глубина рекурсии не превышает примерно chunk.
+    """
+    if chunk < 2:
+        raise ValueError("chunk должен быть не меньше 2")
+
+    def decorator(func: Callable[[int], object]) -> Callable[[int], object]:
+        warming = False
+
+        @wraps(func)
+        def wrapper(n: int) -> object:
+            nonlocal warming
+            value = cache.get(n, _MISSING)
+            if value is not _MISSING:
+                return value
+            if warming or n <= chunk:
+                value = func(n)
+                cache.put(n, value)
+                return value
+            warming = True
+            try:
+                # Ищем сверху ближайшую опорную точку, уже лежащую в кэше, и прогреваем вверх от нее.
+                start = (n - 1) // chunk * chunk
+                while start >= chunk and not (start in cache and start - 1 in cache):
+                    start -= chunk
+                for anchor in range(max(start, 0) + chunk, n, chunk):
+                    wrapper(anchor - 1)
+                    wrapper(anchor)
+                value = func(n)
+            finally:
+                warming = False
+            cache.put(n, value)
+            return value
+
+        def warm(n: int) -> None:
+            wrapper(n)
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        wrapper.warm = warm  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
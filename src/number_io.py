@@ -0,0 +1,189 @@
+import os
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, TextIO
+
+NUMBER_FORMATS = ("text", "int64", "float64")
+BINARY_TYPECODES = {"int64": "q", "float64": "d"}
+DEFAULT_IO_CHUNK = 1 << 16
+_SEPARATORS = re.compile(r"[\s,;]+")
+
+
+def parse_token(token: str) -> int | float:
+    """
+    Число из строки: сначала быстрый путь int без округления через float; иначе float,
+    целые float (например 1e3) приводятся к int.
+    """
+    try:
+        return int(token)
+    except ValueError:
+        value = float(token)
+        return int(value) if value.is_integer() else value
+
+
+def parse_tokens(tokens: list[str]) -> list[int | float]:
+    """Разбирает пачку токенов: map(int) на всю пачку и поштучный разбор только при неудаче."""
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        try:
+            return [parse_token(token) for token in tokens]
+        except ValueError as exc:
+            raise ValueError(f"Ошибка: не число во входных данных ({exc})") from exc
+
+
+def iter_text_chunks(stream: TextIO, chunk_size: int = DEFAULT_IO_CHUNK) -> Iterator[list[int | float]]:
+    """
+    Читает текст чанками по chunk_size символов и выдает пачки чисел. Разделители – пробелы,
+    переводы строк, запятые и точки с запятой (CSV в одну или несколько колонок); токен
+    на границе чанка переносится в следующий.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size должен быть положительным")
+    tail = ""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        tokens = _SEPARATORS.split(tail + block)
+        tail = tokens.pop()
+        tokens = [token for token in tokens if token]
+        if tokens:
+            yield parse_tokens(tokens)
+    if tail:
+        yield parse_tokens([tail])
+
+
+def iter_binary_chunks(stream: BinaryIO, fmt: str, chunk_size: int = DEFAULT_IO_CHUNK) -> Iterator[array]:
+    """
+    Читает сырые little-endian int64/float64 пачками по chunk_size значений.
+    """
+    typecode = BINARY_TYPECODES[fmt]
+    itemsize = array(typecode).itemsize
+    while True:
+        block = stream.read(chunk_size * itemsize)
+        if not block:
+            break
+        while len(block) % itemsize:
+            tail = stream.read(itemsize - len(block) % itemsize)
+            if not tail:
+                raise ValueError(f"Ошибка: длина входа не кратна {itemsize} байтам")
+            block += tail
+        values = array(typecode)
+        values.frombytes(block)
+        if sys.byteorder != "little":
+            values.byteswap()
+        yield values
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in NUMBER_FORMATS:
+        raise ValueError(f"Неизвестный формат чисел: {fmt}")
+
+
+def read_numbers(source: str | Path, fmt: str = "text", chunk_size: int = DEFAULT_IO_CHUNK) -> list[int | float]:
+    """
+    Читает все числа из файла или stdin ("-") в формате text/int64/float64.
+    """
+    _check_format(fmt)
+    values: list[int | float] = []
+    if fmt == "text":
+        if str(source) == "-":
+            for chunk in iter_text_chunks(sys.stdin, chunk_size):
+                values.extend(chunk)
+        else:
+            with open(source, encoding="utf-8") as stream:
+                for chunk in iter_text_chunks(stream, chunk_size):
+                    values.extend(chunk)
+        return values
+    if str(source) == "-":
+        for block in iter_binary_chunks(sys.stdin.buffer, fmt, chunk_size):
+            values.extend(block)
+    else:
+        with open(source, "rb") as stream:
+            for block in iter_binary_chunks(stream, fmt, chunk_size):
+                values.extend(block)
+    return values
+
+
+def format_number(value: int | float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def write_numbers_to(
+    stream: TextIO | BinaryIO,
+    values: Iterable[int | float],
+    fmt: str = "text",
+    chunk_size: int = DEFAULT_IO_CHUNK,
+) -> int:
+    """
+    Пишет числа в открытый поток пачками по chunk_size (текст – по одному в строке, без
+    сборки всего вывода в одну строку). Возвращает число записанных значений.
+    """
+    _check_format(fmt)
+    written = 0
+    batch: list[int | float] = []
+
+    def flush() -> None:
+        if fmt == "text":
+            stream.write("".join(f"{format_number(value)}\n" for value in batch))  # type: ignore[call-overload]
+        else:
+            try:
+                packed = array(BINARY_TYPECODES[fmt], batch)
+            except (TypeError, OverflowError) as exc:
+                raise ValueError(f"Ошибка: значения не помещаются в {fmt} ({exc})") from exc
+            if sys.byteorder != "little":
+                packed.byteswap()
+            stream.write(packed.tobytes())  # type: ignore[arg-type]
+
+    for value in values:
+        batch.append(value)
+        if len(batch) >= chunk_size:
+            flush()
+            written += len(batch)
+            batch = []
+    if batch:
+        flush()
+        written += len(batch)
+    return written
+
+
+def write_numbers(
+    target: str | Path,
+    values: Iterable[int | float],
+    fmt: str = "text",
+    chunk_size: int = DEFAULT_IO_CHUNK,
+) -> int:
+    """
+    Пишет числа в файл или stdout ("-") в формате text/int64/float64. Обычный файл сначала
+    пишется во временный рядом и подменяет target только после успешной записи: при ошибке
+    (например, float в int64) прежнее содержимое target остается, пустой файл не появляется.
+    """
+    _check_format(fmt)
+    if str(target) == "-":
+        stream = sys.stdout if fmt == "text" else sys.stdout.buffer
+        written = write_numbers_to(stream, values, fmt, chunk_size)
+        stream.flush()
+        return written
+    path = Path(target)
+    if path.exists() and not path.is_file():
+        # Устройства и каналы (/dev/null, FIFO) не подменяются – пишем в них напрямую.
+        return _write_numbers_file(path, values, fmt, chunk_size)
+    temporary = path.with_name(f"{path.name}.tmp")
+    try:
+        written = _write_numbers_file(temporary, values, fmt, chunk_size)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    os.replace(temporary, path)
+    return written
+
+
+def _write_numbers_file(path: Path, values: Iterable[int | float], fmt: str, chunk_size: int) -> int:
+    if fmt == "text":
+        with open(path, "w", encoding="utf-8") as stream:
+            return write_numbers_to(stream, values, fmt, chunk_size)
+    with open(path, "wb") as stream:
+        return write_numbers_to(stream, values, fmt, chunk_size)
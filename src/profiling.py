@@ -0,0 +1,130 @@
+import cProfile
+import os
+import pstats
+from pathlib import Path
+from typing import Callable
+
+# Порог, ниже которого ветки свернутых стеков отбрасываются (в секундах).
+MIN_STACK_TIME = 1e-7
+
+
+def profile_call(func: Callable, *args: object, repeat: int = 1) -> tuple[object, pstats.Stats]:
+    """
+    Вызывает func(*args) repeat раз под cProfile и возвращает результат последнего вызова и статистику.
+    """
+    if repeat < 1:
+        raise ValueError("repeat должно быть не меньше 1")
+    profiler = cProfile.Profile()
+    result = None
+    profiler.enable()
+    try:
+        for _ in range(repeat):
+            result = func(*args)
+    finally:
+        profiler.disable()
+    return result, pstats.Stats(profiler)
+
+
+def frame_label(function: tuple[str, int, str]) -> str:
+    """Имя функции для отчетов: «name (file.py:line)» или имя встроенной функции."""
+    filename, line, name = function
+    if filename == "~":
+        return name.replace(";", ",")
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, float]:
+    """
+    Свернутые стеки («a;b;c» -> секунды собственного времени c) для flamegraph-инструментов.
+    cProfile хранит только ребра вызовов, поэтому время функции раскладывается по путям
+    пропорционально накопленному времени ребер; рекурсия сворачивается в один кадр.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    callees: dict[tuple, list[tuple[tuple, float]]] = {}
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, edge_time) in callers.items():
+            if caller != function:
+                callees.setdefault(caller, []).append((function, edge_time))
+    roots = [function for function, entry in entries.items() if not set(entry[4]) - {function}]
+
+    stacks: dict[str, float] = {}
+
+    def walk(function: tuple, path: list[tuple], share: float) -> None:
+        _, _, own_time, total_time, _ = entries[function]
+        path = path + [function]
+        if own_time * share >= MIN_STACK_TIME:
+            key = ";".join(frame_label(frame) for frame in path)
+            stacks[key] = stacks.get(key, 0.0) + own_time * share
+        for callee, edge_time in callees.get(function, []):
+            callee_total = entries[callee][3]
+            if callee in path or callee_total <= 0 or edge_time * share < MIN_STACK_TIME:
+                continue
+            walk(callee, path, share * edge_time / callee_total)
+
+    for root in roots:
+        walk(root, [], 1.0)
+    return stacks
+
+
+def hot_functions(stats: pstats.Stats, limit: int = 5) -> list[dict]:
+    """
+    Самые «горячие» функции по собственному времени: вызовы, собственное и накопленное время
+    и доля собственного времени от общего.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    total = sum(entry[2] for entry in entries.values()) or 1.0
+    ranked = sorted(entries.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        {
+            "function": frame_label(function),
+            "calls": calls,
+            "own": own_time,
+            "cumulative": total_time,
+            "share": own_time / total,
+        }
+        for function, (_, calls, own_time, total_time, _) in ranked
+    ]
+
+
+def function_share(stats: pstats.Stats, name: str, filename: str | None = None) -> float:
+    """
+    Доля общего времени, проведенная внутри функции name (вместе с ее вызовами), например compare.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    total = sum(entry[2] for entry in entries.values())
+    if total <= 0:
+        return 0.0
+    inside = sum(
+        entry[3]
+        for (path, _, function_name), entry in entries.items()
+        if function_name == name and (filename is None or os.path.basename(path) == filename)
+    )
+    return min(inside / total, 1.0)
+
+
+def write_profile(stats: pstats.Stats, directory: str | Path, name: str) -> tuple[Path, Path]:
+    """
+    Сохраняет name.pstats (для pstats/snakeviz) и name.collapsed (для flamegraph.pl/speedscope;
+    значения – микросекунды) в directory и возвращает оба пути.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    safe_name = "".join(char if char.isalnum() or char in "-_." else "_" for char in name)
+    stats_path = directory / f"{safe_name}.pstats"
+    collapsed_path = directory / f"{safe_name}.collapsed"
+    stats.dump_stats(str(stats_path))
+    micros = {stack: round(seconds * 1e6) for stack, seconds in collapsed_stacks(stats).items()}
+    lines = [f"{stack} {value}" for stack, value in sorted(micros.items()) if value > 0]
+    collapsed_path.write_text("\n".join(lines) + "\n" if lines else "")
+    return stats_path, collapsed_path
+
+
+def profile_summary(stats: pstats.Stats, limit: int = 5) -> list[str]:
+    """Строки отчета: доля compare() из src/sorting.py и top горячих функций."""
+    lines = [f"  в compare(): {function_share(stats, 'compare', 'sorting.py'):.1%} времени, остальное – тело алгоритма"]
+    for item in hot_functions(stats, limit):
+        lines.append(
+            f"  {item['share']:6.1%}  {item['function']}: {item['calls']} вызовов,"
+            f" собственное {item['own']:.3e} s, накопленное {item['cumulative']:.3e} s"
+        )
+    return lines
@@ -0,0 +1,222 @@
+import csv
+import io
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCHEMA_VERSION = 1
+CSV_FIELDS = (
+    "dataset",
+    "algorithm",
+    "n",
+    "median",
+    "min",
+    "mean",
+    "iqr",
+    "stdev",
+    "samples",
+    "outliers",
+    "loops",
+    "peak_bytes",
+    "net_blocks",
+    "bytes_per_element",
+    "error",
+)
+
+
+def git_commit() -> str | None:
+    """Текущий коммит репозитория или None, если git недоступен."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def environment_metadata() -> dict:
+    """Окружение замера: версия Python, платформа, CPU, коммит и время."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "executable": sys.executable,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def build_results(
+    results: dict[str, dict[str, dict | Exception]],
+    sizes: dict[str, int],
+    config: dict,
+) -> dict:
+    """
+    Переводит результат run_benchmark в документ для JSON/CSV: окружение, конфигурация
+    запуска и по ячейке на пару (набор, алгоритм) вместе с отдельными замерами.
+    """
+    cells = []
+    for dataset, by_algorithm in results.items():
+        for algorithm, outcome in by_algorithm.items():
+            cell = {"dataset": dataset, "algorithm": algorithm, "n": sizes.get(dataset)}
+            if isinstance(outcome, Exception):
+                cell["error"] = str(outcome)
+            else:
+                cell.update(outcome)
+            cells.append(cell)
+    return {
+        "schema": SCHEMA_VERSION,
+        "environment": environment_metadata(),
+        "config": config,
+        "cells": cells,
+    }
+
+
+def dumps_json(document: dict) -> str:
+    return json.dumps(document, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def dumps_csv(document: dict) -> str:
+    """CSV по ячейкам без сырых замеров; метаданные окружения в CSV не попадают."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    for cell in document["cells"]:
+        writer.writerow(cell)
+    return buffer.getvalue()
+
+
+def load_results(path: str | Path) -> dict:
+    document = json.loads(Path(path).read_text())
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"Ошибка: неподдерживаемая версия результатов {document.get('schema')}")
+    return document
+
+
+def mann_whitney_p(first: list[float], second: list[float]) -> float:
+    """
+    Двусторонний p-value критерия Манна–Уитни (нормальное приближение с поправкой на связи).
+    """
+    if not first or not second:
+        return 1.0
+    combined = sorted([(value, 0) for value in first] + [(value, 1) for value in second])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    start = 0
+    while start < len(combined):
+        end = start
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[start][0]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[position] = (start + end) / 2 + 1
+        tied = end - start + 1
+        tie_term += tied**3 - tied
+        start = end + 1
+    size_first, size_second = len(first), len(second)
+    rank_sum = sum(rank for rank, (value, group) in zip(ranks, combined) if group == 0)
+    u_statistic = rank_sum - size_first * (size_first + 1) / 2
+    mean_u = size_first * size_second / 2
+    total = size_first + size_second
+    variance = size_first * size_second / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z_score = (abs(u_statistic - mean_u) - 0.5) / math.sqrt(variance)
+    return min(1.0, math.erfc(max(z_score, 0.0) / math.sqrt(2)))
+
+
+def compare_results(baseline: dict, current: dict, *, threshold: float = 0.05, alpha: float = 0.05) -> list[dict]:
+    """
+    Сравнивает медианы по общим ячейкам. Статус regression/improvement ставится, если
+    относительное изменение больше threshold и различие значимо (p < alpha), иначе unchanged.
+    """
+    base_cells = {(cell["dataset"], cell["algorithm"]): cell for cell in baseline["cells"] if "median" in cell}
+    comparisons = []
+    for cell in current["cells"]:
+        key = (cell["dataset"], cell["algorithm"])
+        if "median" not in cell or key not in base_cells:
+            continue
+        base = base_cells[key]
+        ratio = cell["median"] / base["median"] if base["median"] > 0 else math.inf
+        p_value = mann_whitney_p(base.get("times", []), cell.get("times", []))
+        status = "unchanged"
+        if p_value < alpha and ratio > 1 + threshold:
+            status = "regression"
+        elif p_value < alpha and ratio < 1 - threshold:
+            status = "improvement"
+        comparisons.append(
+            {
+                "dataset": key[0],
+                "algorithm": key[1],
+                "baseline": base["median"],
+                "current": cell["median"],
+                "ratio": ratio,
+                "p_value": p_value,
+                "status": status,
+            }
+        )
+    return comparisons
+
+
+def append_history(path: str | Path, document: dict, max_entries: int | None = 100) -> int:
+    """
+    Добавляет сводку запуска (медианы без сырых замеров) в JSONL-историю и обрезает ее
+    до последних max_entries записей. Возвращает число записей в истории.
+    """
+    entry = {
+        "environment": document["environment"],
+        "medians": {
+            f"{cell['algorithm']}/{cell['dataset']}": cell["median"] for cell in document["cells"] if "median" in cell
+        },
+    }
+    path = Path(path)
+    lines = path.read_text().splitlines() if path.exists() else []
+    lines.append(json.dumps(entry, ensure_ascii=False, sort_keys=True))
+    if max_entries is not None:
+        lines = lines[-max_entries:]
+    path.write_text("\n".join(lines) + "\n")
+    return len(lines)
+
+
+def load_history(path: str | Path) -> list[dict]:
+    return [json.loads(line) for line in Path(path).read_text().splitlines() if line.strip()]
+
+
+def history_trends(history: list[dict]) -> dict[str, dict]:
+    """
+    Тренд по каждой паре алгоритм/набор: последняя медиана, изменение относительно первой
+    и средний относительный прирост за запуск (наклон log медианы по номеру запуска).
+    """
+    series: dict[str, list[float]] = {}
+    for entry in history:
+        for name, median in entry["medians"].items():
+            if median > 0:
+                series.setdefault(name, []).append(median)
+    trends = {}
+    for name, medians in sorted(series.items()):
+        slope = 0.0
+        if len(medians) >= 2:
+            logs = [math.log(median) for median in medians]
+            mean_index = (len(logs) - 1) / 2
+            mean_log = sum(logs) / len(logs)
+            spread = sum((index - mean_index) ** 2 for index in range(len(logs)))
+            slope = sum((index - mean_index) * (value - mean_log) for index, value in enumerate(logs)) / spread
+        trends[name] = {
+            "runs": len(medians),
+            "last": medians[-1],
+            "change": medians[-1] / medians[0] - 1,
+            "per_run": math.exp(slope) - 1,
+        }
+    return trends
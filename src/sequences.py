@@ -1,4 +1,14 @@
 from functools import lru_cache
+from math import isqrt
+from typing import Iterator
+
+from src.memo import MemoCache, chunked_memo
+
+# Кэши рекурсивных версий ограничены по числу записей и по объему, вытеснение – LRU.
+SEQUENCE_CACHE_MAX_ENTRIES = 1024
+SEQUENCE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+factorial_cache = MemoCache(max_entries=SEQUENCE_CACHE_MAX_ENTRIES, max_bytes=SEQUENCE_CACHE_MAX_BYTES)
+fibo_cache = MemoCache(max_entries=SEQUENCE_CACHE_MAX_ENTRIES, max_bytes=SEQUENCE_CACHE_MAX_BYTES)
 
 
 def factorial(n: int) -> int:
@@ -14,10 +24,10 @@ def factorial(n: int) -> int:
     return result
 
 
-@lru_cache(maxsize=None)
+@chunked_memo(factorial_cache)
 def factorial_recursive(n: int) -> int:
     """
-    Рекурсивное вычисление n-го факториала.
+    Рекурсивное вычисление n-го факториала с ограниченной мемоизацией (factorial_cache).
     """
     if n < 0:
         raise ValueError("Факториал не определён для отрицательных чисел")
@@ -26,6 +36,145 @@ def factorial_recursive(n: int) -> int:
     return n * factorial_recursive(n - 1)
 
 
+SMALL_FACTORIAL_LIMIT = 256
+
+
+def _build_small_factorials(limit: int) -> tuple[int, ...]:
+    table = [1]
+    for value in range(1, limit):
+        table.append(table[-1] * value)
+    return tuple(table)
+
+
+# Таблица 0!..255! строится один раз при импорте и обслуживает малые n без вычислений.
+SMALL_FACTORIALS = _build_small_factorials(SMALL_FACTORIAL_LIMIT)
+
+
+def _product_tree(values: list[int]) -> int:
+    """
+    Произведение списка попарным (сбалансированным) перемножением.
+    """
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def range_product(lo: int, hi: int) -> int:
+    """
+    Произведение целых из [lo, hi) методом бинарного разбиения.
+    """
+    if hi - lo <= 16:
+        result = 1
+        for value in range(lo, hi):
+            result *= value
+        return result
+    middle = (lo + hi) // 2
+    return range_product(lo, middle) * range_product(middle, hi)
+
+
+def _range_product_task(bounds: tuple[int, int]) -> int:
+    return range_product(*bounds)
+
+
+def factorial_fast(n: int, *, workers: int | None = None) -> int:
+    """
+    Факториал через дерево произведений (binary splitting): большие числа перемножаются
+    сбалансированно. При workers > 1 частичные произведения считаются в пуле процессов.
+    """
+    if n < 0:
+        raise ValueError("Факториал не определён для отрицательных чисел")
+    if n < SMALL_FACTORIAL_LIMIT:
+        return SMALL_FACTORIALS[n]
+    if workers is None or workers <= 1:
+        return range_product(2, n + 1)
+
+    chunk_count = workers * 4
+    step = (n - 1) // chunk_count + 1
+    bounds = [(lo, min(lo + step, n + 1)) for lo in range(2, n + 1, step)]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partial_products = list(pool.map(_range_product_task, bounds))
+    return _product_tree(partial_products)
+
+
+def _primes_up_to(n: int) -> list[int]:
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0:2] = b"\x00\x00"
+    for value in range(2, isqrt(n) + 1):
+        if sieve[value]:
+            sieve[value * value :: value] = bytes(len(range(value * value, n + 1, value)))
+    return [value for value in range(n + 1) if sieve[value]]
+
+
+def _swing(n: int, primes: list[int]) -> int:
+    # Разложение «качания» n!/(⌊n/2⌋!)² на простые множители по Luschny.
+    root = isqrt(n)
+    factors = []
+    for prime in primes:
+        if prime > n:
+            break
+        if prime > n // 2:
+            factors.append(prime)
+        elif prime > n // 3:
+            continue
+        elif prime > root:
+            if (n // prime) & 1:
+                factors.append(prime)
+        else:
+            quotient, power = n, 1
+            while quotient:
+                quotient //= prime
+                if quotient & 1:
+                    power *= prime
+            if power > 1:
+                factors.append(power)
+    return _product_tree(factors)
+
+
+def factorial_prime_swing(n: int) -> int:
+    """
+    Факториал по алгоритму prime-swing (Luschny): n! = (⌊n/2⌋!)² · swing(n).
+    """
+    if n < 0:
+        raise ValueError("Факториал не определён для отрицательных чисел")
+    if n < SMALL_FACTORIAL_LIMIT:
+        return SMALL_FACTORIALS[n]
+    primes = _primes_up_to(n)
+    chain = []
+    value = n
+    while value >= SMALL_FACTORIAL_LIMIT:
+        chain.append(value)
+        value //= 2
+    result = SMALL_FACTORIALS[value]
+    for value in reversed(chain):
+        result = result * result * _swing(value, primes)
+    return result
+
+
+def factorial_mod(n: int, m: int) -> int:
+    """
+    n! mod m. При n >= m результат равен 0, так как m входит в произведение.
+    """
+    if n < 0:
+        raise ValueError("Факториал не определён для отрицательных чисел")
+    if m < 1:
+        raise ValueError("Модуль должен быть положительным")
+    if n >= m:
+        return 0
+    if n < SMALL_FACTORIAL_LIMIT:
+        return SMALL_FACTORIALS[n] % m
+    result = 1
+    for value in range(2, n + 1):
+        result = result * value % m
+    return result
+
+
 def fibo(n: int) -> int:
     """
     Итеративное вычисление n-го числа Фибоначчи.
@@ -41,10 +190,10 @@ def fibo(n: int) -> int:
     return current
 
 
-@lru_cache(maxsize=None)
+@chunked_memo(fibo_cache)
 def fibo_recursive(n: int) -> int:
     """
-    Рекурсивное вычисление n-го числа Фибоначчи с мемоизацией.
+    Рекурсивное вычисление n-го числа Фибоначчи с ограниченной мемоизацией (fibo_cache).
     Начальные условия: F(0) = 0, F(1) = 1.
     """
     if n < 0:
@@ -52,3 +201,95 @@ def fibo_recursive(n: int) -> int:
     if n in (0, 1):
         return n
     return fibo_recursive(n - 1) + fibo_recursive(n - 2)
+
+
+def clear_sequence_caches() -> None:
+    """
+    Очищает кэши factorial_recursive и fibo_recursive.
+    """
+    factorial_cache.clear()
+    fibo_cache.clear()
+
+
+def _fibo_pair(n: int, modulus: int | None = None) -> tuple[int, int]:
+    """
+    Fast doubling: возвращает (F(n), F(n + 1)) за O(log n) умножений, при modulus – по модулю.
+    """
+    previous, current = 0, 1
+    for bit in bin(n)[2:]:
+        doubled = previous * (2 * current - previous)
+        doubled_next = previous * previous + current * current
+        if modulus is not None:
+            doubled %= modulus
+            doubled_next %= modulus
+        if bit == "1":
+            previous, current = doubled_next, doubled + doubled_next
+            if modulus is not None:
+                current %= modulus
+        else:
+            previous, current = doubled, doubled_next
+    return previous, current
+
+
+def fibo_fast(n: int) -> int:
+    """
+    Вычисление n-го числа Фибоначчи методом fast doubling за O(log n) умножений.
+    Начальные условия: F(0) = 0, F(1) = 1.
+    """
+    if n < 0:
+        raise ValueError("Числа Фибоначчи не определены для отрицательных значений")
+    return _fibo_pair(n)[0]
+
+
+PISANO_LIMIT = 1 << 16
+
+
+@lru_cache(maxsize=128)
+def pisano_period(m: int) -> int:
+    """
+    Период Пизано: длина периода последовательности F(n) mod m.
+    """
+    if m < 1:
+        raise ValueError("Модуль должен быть положительным")
+    if m == 1:
+        return 1
+    previous, current = 0, 1
+    period = 0
+    while True:
+        previous, current = current, (previous + current) % m
+        period += 1
+        if previous == 0 and current == 1:
+            return period
+
+
+def fibo_mod(n: int, m: int) -> int:
+    """
+    F(n) mod m для сколь угодно больших n. Для небольших модулей (до PISANO_LIMIT)
+    n сначала сокращается по периоду Пизано, затем используется fast doubling по модулю.
+    """
+    if n < 0:
+        raise ValueError("Числа Фибоначчи не определены для отрицательных значений")
+    if m < 1:
+        raise ValueError("Модуль должен быть положительным")
+    if m <= PISANO_LIMIT:
+        n %= pisano_period(m)
+    return _fibo_pair(n, m)[0] % m
+
+
+def fibo_range(a: int, b: int) -> Iterator[int]:
+    """
+    Генератор чисел Фибоначчи F(a), F(a + 1), ..., F(b - 1). Стартовая пара считается
+    через fast doubling, дальше – по одному сложению на значение.
+    """
+    if a < 0:
+        raise ValueError("Числа Фибоначчи не определены для отрицательных значений")
+    return _fibo_range(a, b)
+
+
+def _fibo_range(a: int, b: int) -> Iterator[int]:
+    if b <= a:
+        return
+    previous, current = _fibo_pair(a)
+    for index in range(a, b):
+        yield previous
+        previous, current = current, previous + current
@@ -0,0 +1,671 @@
+import asyncio
+import json
+import os
+import random
+import socket
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Sequence
+
+from src.data_structures import Queue, Stack
+from src.latency import latency_summary
+from src.sequences import factorial, factorial_fast, factorial_mod, fibo, fibo_fast, fibo_mod
+from src.sort_cache import SortCache
+from src.sorting import bubble_sort, bucket_sort, counting_sort, heap_sort, quick_sort, radix_sort
+
+# Кадр протокола: <u32 длина тела><u32 длина заголовка> (big-endian), затем JSON-заголовок
+# в UTF-8 и необязательная полезная нагрузка – значения int64/float64 в little-endian.
+# Заголовок запроса: {"id", "op", ...параметры, "dtype"}; ответа: {"id", "ok", "result"|"error", "dtype"}.
+FRAME = struct.Struct("!II")
+PAYLOAD_TYPECODES = {"int64": "q", "float64": "d"}
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+DEFAULT_MAX_FRAME = 64 << 20
+# Лимиты запросов sort, которые иначе надолго заняли бы пул: число корзин counting_sort
+# (max - min + 1) и длина массива для квадратичной bubble_sort.
+MAX_COUNTING_SPAN = 1 << 20
+MAX_BUBBLE_N = 2000
+# Предел n для последовательностей: все они считаются в одном потоке, и factorial(10**5)
+# занимал бы его секунды. fibo_mod сокращает n по периоду Пизано и не ограничивается.
+MAX_SEQUENCE_N = 20000
+# Целые длиннее int64 передаются в заголовке шестнадцатеричной строкой ("result_encoding": "hex"):
+# JSON-числа больше 4300 цифр не (де)сериализуются из-за лимита int <-> str.
+MAX_JSON_INT_BITS = 63
+
+SORTS: dict[str, Callable[[list], list]] = {
+    "bubble": bubble_sort,
+    "quick": quick_sort,
+    "heap": heap_sort,
+    "counting": counting_sort,
+    "radix": radix_sort,
+    "bucket": bucket_sort,
+}
+SEQUENCE_OPS: dict[str, Callable[..., int]] = {
+    "factorial": factorial,
+    "factorial_fast": factorial_fast,
+    "factorial_mod": factorial_mod,
+    "fibo": fibo,
+    "fibo_fast": fibo_fast,
+    "fibo_mod": fibo_mod,
+}
+STRUCTURE_OPS = (
+    "stack_push",
+    "stack_pop",
+    "stack_peek",
+    "stack_min",
+    "stack_max",
+    "stack_len",
+    "queue_enqueue",
+    "queue_dequeue",
+    "queue_front",
+    "queue_len",
+)
+
+
+def parse_address(address: str) -> tuple[str, str | tuple[str, int]]:
+    """
+    "unix:/путь/к/сокету" -> ("unix", путь); "host:port" -> ("tcp", (host, port)).
+    """
+    if address.startswith("unix:"):
+        path = address[len("unix:") :]
+        if not path:
+            raise ValueError("Ошибка: пустой путь Unix-сокета")
+        return "unix", path
+    host, separator, port = address.rpartition(":")
+    if not separator or not port.isdigit():
+        raise ValueError(f"Ошибка: адрес должен быть host:port или unix:/путь, получено {address!r}")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+def encode_values(values: Sequence[int | float] | None) -> tuple[str | None, bytes]:
+    """
+    Упаковывает числа в int64 (если все целые) или float64; None – без нагрузки.
+    """
+    if values is None:
+        return None, b""
+    dtype = "int64" if all(isinstance(value, int) for value in values) else "float64"
+    try:
+        packed = array(PAYLOAD_TYPECODES[dtype], values)
+    except (TypeError, OverflowError) as exc:
+        raise ValueError(f"Ошибка: значения не помещаются в {dtype} ({exc})") from exc
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return dtype, packed.tobytes()
+
+
+def decode_values(dtype: str | None, payload: bytes) -> list[int | float] | None:
+    if dtype is None:
+        return None
+    if dtype not in PAYLOAD_TYPECODES:
+        raise ValueError(f"Ошибка: неизвестный dtype {dtype}")
+    values: array = array(PAYLOAD_TYPECODES[dtype])
+    if len(payload) % values.itemsize:
+        raise ValueError("Ошибка: длина нагрузки не кратна размеру значения")
+    values.frombytes(payload)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
+
+
+def encode_frame(header: dict, values: Sequence[int | float] | None = None) -> bytes:
+    dtype, payload = encode_values(values)
+    header = {**header, "dtype": dtype}
+    encoded = json.dumps(header, ensure_ascii=False).encode()
+    return FRAME.pack(len(encoded) + len(payload), len(encoded)) + encoded + payload
+
+
+def decode_body(body: bytes, header_length: int) -> tuple[dict, list[int | float] | None]:
+    if header_length > len(body):
+        raise ValueError("Ошибка: длина заголовка больше длины кадра")
+    header = json.loads(body[:header_length])
+    if not isinstance(header, dict):
+        raise ValueError("Ошибка: заголовок кадра должен быть JSON-объектом")
+    return header, decode_values(header.get("dtype"), body[header_length:])
+
+
+def encode_result(result: object) -> dict:
+    """Поля ответа для result: большие целые – шестнадцатеричной строкой."""
+    if isinstance(result, int) and not isinstance(result, bool) and result.bit_length() > MAX_JSON_INT_BITS:
+        return {"result": hex(result), "result_encoding": "hex"}
+    return {"result": result}
+
+
+def decode_result(header: dict) -> object:
+    if header.get("result_encoding") == "hex":
+        return int(header["result"], 16)
+    return header.get("result")
+
+
+def check_sort_request(algorithm: str, values: list) -> None:
+    """Отклоняет сортировки, которые заняли бы пул надолго (см. MAX_COUNTING_SPAN, MAX_BUBBLE_N)."""
+    if algorithm == "bubble" and len(values) > MAX_BUBBLE_N:
+        raise ValueError(f"Ошибка: bubble принимает не больше {MAX_BUBBLE_N} значений")
+    if algorithm == "counting" and values and max(values) - min(values) >= MAX_COUNTING_SPAN:
+        raise ValueError(f"Ошибка: диапазон значений для counting должен быть меньше {MAX_COUNTING_SPAN}")
+
+
+def check_sequence_request(op: str, n: object) -> None:
+    """Отклоняет последовательности с n больше MAX_SEQUENCE_N до постановки в поток последовательностей."""
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise ValueError(f"Ошибка: n для {op} должно быть целым")
+    if op != "fibo_mod" and n > MAX_SEQUENCE_N:
+        raise ValueError(f"Ошибка: {op} принимает n не больше {MAX_SEQUENCE_N}")
+
+
+async def read_frame(reader: asyncio.StreamReader, max_frame: int = DEFAULT_MAX_FRAME) -> tuple[dict, list | None]:
+    """Читает один кадр; IncompleteReadError – соединение закрыто."""
+    body_length, header_length = FRAME.unpack(await reader.readexactly(FRAME.size))
+    if body_length > max_frame:
+        raise ValueError(f"Ошибка: кадр {body_length} байт больше лимита {max_frame}")
+    return decode_body(await reader.readexactly(body_length), header_length)
+
+
+def _sort_batch(tasks: list[tuple[str, list, dict]]) -> list[tuple[bool, object]]:
+    """Выполняется в процессе пула: пачка сортировок, по (ok, результат или текст ошибки) на задачу."""
+    results: list[tuple[bool, object]] = []
+    for algorithm, values, options in tasks:
+        try:
+            results.append((True, SORTS[algorithm](values, **options)))
+        except Exception as exc:
+            results.append((False, f"{type(exc).__name__}: {exc}"))
+    return results
+
+
+class SortService:
+    """
+    Долгоживущий сервис сортировок, последовательностей и структур данных на asyncio.
+
+    Сортировки собираются в пачки (до batch_size запросов или batch_delay секунд) и уходят
+    в пул процессов (workers=0 – выполнять в отдельном потоке). Последовательности считаются
+    в одном выделенном потоке, поэтому кэши мемоизации остаются теплыми между запросами;
+    стеки и очереди хранятся по имени прямо в цикле событий. Одновременно обрабатывается не
+    больше max_pending запросов – дальше сервер перестает читать сокеты (обратное давление
+    через TCP), а на каждое соединение приходится не больше max_pending_per_connection.
+    Задержка каждого запроса (от чтения кадра до записи ответа) попадает в статистику op "stats".
+    С cache_bytes > 0 результаты сортировок кэшируются по отпечатку входа (SortCache):
+    повторы одинаковых массивов отвечаются из цикла событий без похода в пул.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int | None = None,
+        batch_size: int = 32,
+        batch_delay: float = 0.002,
+        max_pending: int = 256,
+        max_pending_per_connection: int = 64,
+        max_frame: int = DEFAULT_MAX_FRAME,
+        latency_window: int = 10000,
+        cache_bytes: int = 0,
+    ) -> None:
+        if workers is not None and workers < 0:
+            raise ValueError("workers должно быть неотрицательным")
+        if batch_size < 1 or max_pending < 1 or max_pending_per_connection < 1 or latency_window < 1:
+            raise ValueError("batch_size, max_pending и latency_window должны быть положительными")
+        if batch_delay < 0 or cache_bytes < 0:
+            raise ValueError("batch_delay и cache_bytes должны быть неотрицательными")
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self.max_pending_per_connection = max_pending_per_connection
+        self.max_frame = max_frame
+        self.latencies: dict[str, deque] = {}
+        self.latency_window = latency_window
+        self.sort_cache = SortCache(max_bytes=cache_bytes) if cache_bytes > 0 else None
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.stacks: dict[str, Stack] = {}
+        self.queues: dict[str, Queue] = {}
+        self.address: str | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._pool: Executor | None = None
+        self._sequence_thread: ThreadPoolExecutor | None = None
+        self._cache_thread: ThreadPoolExecutor | None = None
+        # Пересоздаются в start(); примитивы asyncio привязываются к циклу только при первом ожидании.
+        self._pending = asyncio.Semaphore(max_pending)
+        self._sort_queue: asyncio.Queue = asyncio.Queue()
+        self._batcher: asyncio.Task | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._connections: set[asyncio.Task] = set()
+        self._handlers: set[asyncio.Task] = set()
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._started = 0.0
+        self._unix_path: str | None = None
+
+    async def start(self, address: str = DEFAULT_ADDRESS) -> str:
+        """Открывает сокет и пулы; возвращает фактический адрес (порт 0 заменяется выданным ОС)."""
+        _, target = parse_address(address)
+        if self.workers > 0:
+            # multiprocessing грузится только для пула процессов: клиентам модуля он не нужен.
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(self.workers)
+        else:
+            self._pool = ThreadPoolExecutor(1)
+        # Пустая пачка запускает процессы пула до появления других потоков (fork из
+        # многопоточного процесса небезопасен).
+        await asyncio.get_running_loop().run_in_executor(self._pool, _sort_batch, [])
+        self._sequence_thread = ThreadPoolExecutor(1, thread_name_prefix="sequences")
+        if self.sort_cache is not None:
+            self._cache_thread = ThreadPoolExecutor(1, thread_name_prefix="sort-cache")
+        self._pending = asyncio.Semaphore(self.max_pending)
+        self._sort_queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        if isinstance(target, str):
+            if os.path.exists(target):
+                os.unlink(target)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=target)
+            self._unix_path = target
+            self.address = f"unix:{target}"
+        else:
+            host, port = target
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+            bound = self._server.sockets[0].getsockname()
+            self.address = f"{bound[0]}:{bound[1]}"
+        self._started = time.perf_counter()
+        return self.address
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("Сервис не запущен")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Задачи соединений не отменяются (asyncio.streams логирует отмену как ошибку):
+        # отменяются обработчики и пачки, а закрытие сокетов завершает чтение.
+        tasks = [*self._handlers, *self._batch_tasks] + ([self._batcher] if self._batcher else [])
+        for task in tasks:
+            task.cancel()
+        for writer in list(self._writers):
+            writer.close()
+        await asyncio.gather(*tasks, *self._connections, return_exceptions=True)
+        self._batcher = None
+        for executor in (self._pool, self._sequence_thread, self._cache_thread):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        self._pool = self._sequence_thread = self._cache_thread = None
+        if self._unix_path is not None and os.path.exists(self._unix_path):
+            os.unlink(self._unix_path)
+
+    async def __aenter__(self) -> "SortService":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        self._writers.add(writer)
+        write_lock = asyncio.Lock()
+        in_flight = asyncio.Semaphore(self.max_pending_per_connection)
+        handlers: set[asyncio.Task] = set()
+        try:
+            while True:
+                try:
+                    header, values = await read_frame(reader, self.max_frame)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except ValueError as exc:
+                    async with write_lock:
+                        writer.write(encode_frame({"id": None, "ok": False, "error": str(exc)}))
+                        await writer.drain()
+                    break
+                received = time.perf_counter()
+                await in_flight.acquire()
+                await self._pending.acquire()
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                handler = asyncio.create_task(self._respond(header, values, received, writer, write_lock))
+                handlers.add(handler)
+                self._handlers.add(handler)
+                handler.add_done_callback(handlers.discard)
+                handler.add_done_callback(self._handlers.discard)
+                handler.add_done_callback(lambda _: self._release(in_flight))
+            await asyncio.gather(*handlers, return_exceptions=True)
+        finally:
+            writer.close()
+            self._writers.discard(writer)
+            if task is not None:
+                self._connections.discard(task)
+
+    def _release(self, connection_slots: asyncio.Semaphore) -> None:
+        self.in_flight -= 1
+        connection_slots.release()
+        self._pending.release()
+
+    async def _respond(
+        self,
+        header: dict,
+        values: list | None,
+        received: float,
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+    ) -> None:
+        op = str(header.get("op"))
+        try:
+            result, result_values = await self.dispatch(op, header, values)
+            response = encode_frame({"id": header.get("id"), "ok": True, **encode_result(result)}, result_values)
+        except Exception as exc:
+            self.errors += 1
+            response = encode_frame({"id": header.get("id"), "ok": False, "error": f"{type(exc).__name__}: {exc}"})
+        try:
+            async with write_lock:
+                writer.write(response)
+                await writer.drain()
+        except ConnectionError:
+            return
+        self.requests += 1
+        self.latencies.setdefault(op, deque(maxlen=self.latency_window)).append(time.perf_counter() - received)
+
+    async def dispatch(self, op: str, header: dict, values: list | None) -> tuple[object, list | None]:
+        """Выполняет одну операцию: (result для JSON-заголовка, массив для нагрузки или None)."""
+        if op == "sort":
+            algorithm = header.get("algorithm", "quick")
+            if algorithm not in SORTS:
+                raise ValueError(f"Неизвестный алгоритм: {algorithm}")
+            if values is None:
+                raise ValueError("Для sort нужны значения в нагрузке")
+            check_sort_request(algorithm, values)
+            options = {"base": header["base"]} if algorithm == "radix" and "base" in header else {}
+            loop = asyncio.get_running_loop()
+            cache = self.sort_cache
+            ticket = None
+            if cache is not None:
+                # Упаковка и хеширование входа (до max_frame байт) идут в отдельном потоке кэша,
+                # не блокируя цикл событий; он же единственный меняет LRU кэша.
+                ticket, cached = await loop.run_in_executor(
+                    self._cache_thread, cache.lookup, SORTS[algorithm], values, options
+                )
+                if cached is not None:
+                    return None, cached
+            future = loop.create_future()
+            await self._sort_queue.put((algorithm, values, options, future))
+            result = await future
+            if cache is not None and ticket is not None:
+                await loop.run_in_executor(self._cache_thread, cache.store, ticket, result)
+            return None, result
+        if op in SEQUENCE_OPS:
+            check_sequence_request(op, header.get("n"))
+            args = [header["n"]] + ([header["m"]] if op.endswith("_mod") else [])
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._sequence_thread, SEQUENCE_OPS[op], *args), None
+        if op in STRUCTURE_OPS:
+            return self._structure_op(op, header), None
+        if op == "stats":
+            return self.stats(), None
+        if op == "ping":
+            return "pong", None
+        raise ValueError(f"Неизвестная операция: {op}")
+
+    def _structure_op(self, op: str, header: dict) -> object:
+        name = str(header.get("name", "default"))
+        if op.startswith("stack_"):
+            stack = self.stacks.setdefault(name, Stack())
+            action = op[len("stack_") :]
+            if action == "push":
+                stack.push(header["value"])
+                return len(stack)
+            if action == "len":
+                return len(stack)
+            return getattr(stack, action)()
+        queue = self.queues.setdefault(name, Queue())
+        action = op[len("queue_") :]
+        if action == "enqueue":
+            queue.enqueue(header["value"])
+            return len(queue)
+        if action == "len":
+            return len(queue)
+        return getattr(queue, action)()
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._sort_queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0 and self._sort_queue.empty():
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._sort_queue.get(), max(remaining, 0)))
+                except asyncio.TimeoutError:
+                    break
+            self.batches += 1
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple]) -> None:
+        loop = asyncio.get_running_loop()
+        tasks = [(algorithm, values, options) for algorithm, values, options, _ in batch]
+        try:
+            outcomes = await loop.run_in_executor(self._pool, _sort_batch, tasks)
+        except Exception as exc:
+            outcomes = [(False, f"{type(exc).__name__}: {exc}")] * len(batch)
+        for (_, _, _, future), (ok, outcome) in zip(batch, outcomes):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(outcome)
+            else:
+                future.set_exception(RuntimeError(outcome))
+
+    def stats(self) -> dict:
+        uptime = time.perf_counter() - self._started if self._started else 0.0
+        return {
+            "uptime": uptime,
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "throughput": self.requests / uptime if uptime > 0 else 0.0,
+            "cache": self.sort_cache.stats() if self.sort_cache is not None else None,
+            "ops": {
+                op: {"count": len(latencies), **latency_summary(latencies)}
+                for op, latencies in sorted(self.latencies.items())
+            },
+        }
+
+
+async def run_service(address: str = DEFAULT_ADDRESS, **options: Any) -> None:
+    """Запускает сервис и обслуживает запросы до отмены (Ctrl+C)."""
+    async with SortService(**options) as service:
+        await service.start(address)
+        await service.serve_forever()
+
+
+def _connect(address: str, timeout: float | None) -> socket.socket:
+    _, target = parse_address(address)
+    if isinstance(target, str):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        connection.connect(target)
+        return connection
+    return socket.create_connection(target, timeout=timeout)
+
+
+class ServiceClient:
+    """
+    Синхронный клиент SortService: один запрос – один ответ по одному соединению.
+    Ошибки сервиса поднимаются как RuntimeError.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, timeout: float | None = 30.0) -> None:
+        self.connection = _connect(address, timeout)
+        self.next_id = 0
+
+    def _recv_exact(self, size: int) -> bytes:
+        chunks = []
+        while size:
+            chunk = self.connection.recv(min(size, 1 << 20))
+            if not chunk:
+                raise ConnectionError("Сервис закрыл соединение")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def request(self, op: str, values: Sequence[int | float] | None = None, **params: Any) -> tuple[object, list | None]:
+        self.next_id += 1
+        self.connection.sendall(encode_frame({"id": self.next_id, "op": op, **params}, values))
+        body_length, header_length = FRAME.unpack(self._recv_exact(FRAME.size))
+        header, result_values = decode_body(self._recv_exact(body_length), header_length)
+        if not header.get("ok"):
+            raise RuntimeError(f"Ошибка сервиса: {header.get('error')}")
+        return decode_result(header), result_values
+
+    def sort(self, values: Sequence[int | float], algorithm: str = "quick", **params: Any) -> list:
+        result_values = self.request("sort", values, algorithm=algorithm, **params)[1]
+        if result_values is None:
+            raise RuntimeError("Ошибка сервиса: ответ на sort без значений")
+        return result_values
+
+    def call(self, op: str, **params: Any) -> Any:
+        return self.request(op, **params)[0]
+
+    def stats(self) -> dict:
+        return self.call("stats")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ServiceClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class AsyncServiceClient:
+    """
+    Асинхронный клиент с конвейером: несколько запросов в полете по одному соединению,
+    ответы сопоставляются по id.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.waiting: dict[int, asyncio.Future] = {}
+        self.listener = asyncio.create_task(self._listen())
+
+    @classmethod
+    async def connect(cls, address: str = DEFAULT_ADDRESS) -> "AsyncServiceClient":
+        _, target = parse_address(address)
+        if isinstance(target, str):
+            reader, writer = await asyncio.open_unix_connection(target)
+        else:
+            reader, writer = await asyncio.open_connection(*target)
+        return cls(reader, writer)
+
+    async def _listen(self) -> None:
+        try:
+            while True:
+                header, values = await read_frame(self.reader)
+                future = self.waiting.pop(header.get("id", 0), None)
+                if future is None or future.done():
+                    continue
+                if header.get("ok"):
+                    future.set_result((decode_result(header), values))
+                else:
+                    future.set_exception(RuntimeError(f"Ошибка сервиса: {header.get('error')}"))
+        except Exception as exc:
+            # Любой сбой чтения (закрытое соединение, испорченный или слишком большой кадр)
+            # завершает слушателя: ожидающие запросы получают ошибку, а не висят вечно.
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Соединение с сервисом прервано: {exc}"))
+            self.waiting.clear()
+
+    async def request(self, op: str, values: Sequence[int | float] | None = None, **params: object) -> tuple[object, list | None]:
+        if self.listener.done():
+            raise ConnectionError("Соединение с сервисом прервано")
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[self.next_id] = future
+        self.writer.write(encode_frame({"id": self.next_id, "op": op, **params}, values))
+        await self.writer.drain()
+        return await future
+
+    async def close(self) -> None:
+        self.listener.cancel()
+        await asyncio.gather(self.listener, return_exceptions=True)
+        self.writer.close()
+
+
+async def run_load(
+    address: str,
+    *,
+    requests: int = 1000,
+    concurrency: int = 16,
+    connections: int = 4,
+    size: int = 100,
+    algorithm: str = "quick",
+    seed: int = 0,
+) -> dict:
+    """
+    Генератор нагрузки: requests сортировок массивов длины size, не больше concurrency запросов
+    в полете на connections соединениях. Возвращает пропускную способность и p50/p90/p99/max
+    задержки (с) со стороны клиента.
+    """
+    if requests < 1 or concurrency < 1 or connections < 1 or size < 0:
+        raise ValueError("requests, concurrency и connections должны быть положительными")
+    generator = random.Random(seed)
+    inputs = [[generator.randint(-1000, 1000) for _ in range(size)] for _ in range(16)]
+    clients = [await AsyncServiceClient.connect(address) for _ in range(min(connections, concurrency))]
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker(client: AsyncServiceClient) -> None:
+        nonlocal errors
+        for index in counter:
+            started = time.perf_counter()
+            try:
+                await client.request("sort", inputs[index % len(inputs)], algorithm=algorithm)
+            except RuntimeError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker(clients[index % len(clients)]) for index in range(concurrency)))
+    finally:
+        for client in clients:
+            await client.close()
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        **latency_summary(latencies),
+    }
+
+
+async def load_benchmark(address: str | None = None, service_options: dict | None = None, **load_options: Any) -> dict:
+    """
+    run_load против сервиса по address или, если он не задан, против временного сервиса на
+    127.0.0.1 со случайным портом (service_options передаются в SortService). Для временного
+    сервиса в результат добавляется его статистика ("server").
+    """
+    if address is not None:
+        return await run_load(address, **load_options)
+    async with SortService(**(service_options or {})) as service:
+        bound = await service.start("127.0.0.1:0")
+        report = await run_load(bound, **load_options)
+        report["server"] = service.stats()
+        return report
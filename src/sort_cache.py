@@ -0,0 +1,168 @@
+import hashlib
+import sys
+from array import array
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Hashable, Iterator, Sequence
+
+from src.memo import MemoCache
+
+DEFAULT_SORT_CACHE_BYTES = 64 << 20
+FINGERPRINT_CHUNK = 1 << 20
+
+# Глобальный выключатель всех кэшей результатов сортировок (бенчмарк выключает его на время замеров).
+_enabled = True
+
+
+def set_caching(enabled: bool) -> bool:
+    """Включает или выключает кэши результатов сортировок; возвращает прежнее состояние."""
+    global _enabled
+    previous, _enabled = _enabled, enabled
+    return previous
+
+
+def caching_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def caching_disabled() -> Iterator[None]:
+    """Контекст, в котором кэши результатов сортировок пропускаются."""
+    previous = set_caching(False)
+    try:
+        yield
+    finally:
+        set_caching(previous)
+
+
+def typed_buffer(values: Sequence) -> array | None:
+    """
+    Вход как array('q') (только int в пределах int64) или array('d') (только float);
+    None – если типы смешаны, элементы другие или вход пуст.
+    """
+    if not values:
+        return None
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return None
+    if types == {float}:
+        return array("d", values)
+    return None
+
+
+def fingerprint(buffer: array) -> tuple[str, int, bytes]:
+    """Отпечаток типизированного буфера: тип, длина и blake2b по байтам, читаемым кусками без копий."""
+    digest = hashlib.blake2b(digest_size=16)
+    view = memoryview(buffer).cast("B")
+    for start in range(0, len(view), FINGERPRINT_CHUNK):
+        digest.update(view[start : start + FINGERPRINT_CHUNK])
+    return buffer.typecode, len(buffer), digest.digest()
+
+
+class _Entry:
+    """Запись кэша: исходный буфер (для проверки при попадании) и отсортированный результат."""
+
+    __slots__ = ("source", "result")
+
+    def __init__(self, source: array, result: array) -> None:
+        self.source = source
+        self.result = result
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.source) + sys.getsizeof(self.result)
+
+
+class SortCache:
+    """
+    Кэш результатов сортировок по отпечатку входа (длина + blake2b по буферу int64/float64).
+    Записи вытесняются по LRU в пределах max_bytes (считаются вход и результат); запись
+    больше max_bytes целиком не сохраняется (oversized). При попадании вход сверяется с
+    сохраненным побайтно, так что коллизия отпечатков считается промахом. Кэш пропускается,
+    если передан key или cmp (их детерминированность проверить нельзя), параметры не
+    хешируются, вход не числовой или кэши выключены set_caching.
+    """
+
+    def __init__(self, max_bytes: int | None = DEFAULT_SORT_CACHE_BYTES, max_entries: int | None = None) -> None:
+        self.memo = MemoCache(max_entries=max_entries, max_bytes=max_bytes)
+        self.bypassed = 0
+        self.collisions = 0
+        self.oversized = 0
+
+    def lookup(self, func: Callable, values: Sequence, options: dict) -> tuple[tuple | None, list | None]:
+        """
+        Ищет результат func(values, **options): (билет для store или None при обходе кэша,
+        копия результата или None при промахе).
+        """
+        if not _enabled or options.get("key") is not None or options.get("cmp") is not None:
+            self.bypassed += 1
+            return None, None
+        buffer = typed_buffer(values)
+        if buffer is None:
+            self.bypassed += 1
+            return None, None
+        cache_key = (func, tuple(sorted(options.items())), fingerprint(buffer))
+        try:
+            hash(cache_key)
+        except TypeError:
+            self.bypassed += 1
+            return None, None
+        entry = self.memo.get(cache_key)
+        if entry is None:
+            return (cache_key, buffer), None
+        # Сравнение байтов, а не значений: NaN != NaN, но одинаковый вход должен попадать.
+        if memoryview(entry.source).cast("B") != memoryview(buffer).cast("B"):  # type: ignore[attr-defined]
+            self.collisions += 1
+            return (cache_key, buffer), None
+        return None, entry.result.tolist()  # type: ignore[attr-defined]
+
+    def store(self, ticket: tuple[Hashable, array], result: Sequence) -> None:
+        cache_key, buffer = ticket
+        try:
+            packed = array(buffer.typecode, result)
+        except (TypeError, OverflowError):
+            return
+        entry = _Entry(buffer, packed)
+        if self.memo.max_bytes is not None and sys.getsizeof(entry) > self.memo.max_bytes:
+            self.oversized += 1
+            return
+        self.memo.put(cache_key, entry)
+
+    def sort(self, func: Callable, values: Sequence, **options: object) -> list:
+        """func(values, **options) через кэш; результат всегда новый список."""
+        ticket, result = self.lookup(func, values, options)
+        if result is not None:
+            return result
+        result = func(values, **options)
+        if ticket is not None:
+            self.store(ticket, result)
+        return result
+
+    def wrap(self, func: Callable) -> Callable:
+        """Кэширующая обертка над функцией сортировки (параметры передаются по имени)."""
+
+        @wraps(func)
+        def cached(values: Sequence, **options: object) -> list:
+            return self.sort(func, values, **options)
+
+        cached.cache = self  # type: ignore[attr-defined]
+        return cached
+
+    def clear(self) -> None:
+        self.memo.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Попадания, промахи (включая коллизии), обходы, слишком большие записи, вытеснения, записи и байты."""
+        memo = self.memo.stats()
+        return {
+            "hits": memo["hits"] - self.collisions,
+            "misses": memo["misses"] + self.collisions,
+            "collisions": self.collisions,
+            "bypassed": self.bypassed,
+            "oversized": self.oversized,
+            "evictions": memo["evictions"],
+            "entries": memo["entries"],
+            "bytes": memo["bytes"],
+        }
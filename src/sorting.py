@@ -1,4 +1,9 @@
-from typing import Callable, TypeVar
+import random
+from array import array
+from bisect import bisect_right
+from functools import cmp_to_key
+from itertools import accumulate
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
 
 T = TypeVar("T")
 
@@ -16,14 +21,14 @@ def compare(left: T, right: T, key: Callable[[T], object] | None, cmp: Callable[
 
 
 def bubble_sort(
-    a: list[T],
+    a: Sequence[T],
     key: Callable[[T], object] | None = None,
     cmp: Callable[[T, T], int] | None = None,
 ) -> list[T]:
     """
     Сортировка пузырьком. Поддерживает произвольные элементы с key или cmp.
     """
-    result = a.copy()
+    result = list(a)
     n = len(result)
     for i in range(n):
         swapped = False
@@ -37,7 +42,7 @@ def bubble_sort(
 
 
 def quick_sort(
-    a: list[T],
+    a: Sequence[T],
     key: Callable[[T], object] | None = None,
     cmp: Callable[[T, T], int] | None = None,
 ) -> list[T]:
@@ -45,7 +50,7 @@ def quick_sort(
     Быстрая сортировка (рекурсивная реализация). Поддерживает key и cmp.
     """
     if len(a) <= 1:
-        return a.copy()
+        return list(a)
 
     pivot = a[len(a) // 2]
     less = [x for x in a if compare(x, pivot, key, cmp) < 0]
@@ -56,7 +61,7 @@ def quick_sort(
 
 
 def counting_sort(
-    a: list[T],
+    a: Sequence[T],
     key: Callable[[T], object] | None = None,
     cmp: Callable[[T, T], int] | None = None,
 ) -> list[T]:
@@ -68,7 +73,7 @@ def counting_sort(
         return []
 
     if cmp is not None:
-        result = a.copy()
+        result = list(a)
         for i in range(1, len(result)):
             current = result[i]
             j = i - 1
@@ -99,7 +104,7 @@ def counting_sort(
 
 
 def radix_sort(
-    a: list[T],
+    a: Sequence[T],
     base: int = 10,
     key: Callable[[T], object] | None = None,
     cmp: Callable[[T, T], int] | None = None,
@@ -115,7 +120,7 @@ def radix_sort(
         return []
 
     if cmp is not None:
-        result = a.copy()
+        result = list(a)
         for i in range(1, len(result)):
             current = result[i]
             j = i - 1
@@ -168,7 +173,7 @@ def radix_sort(
 
 
 def bucket_sort(
-    a: list[T],
+    a: Sequence[T],
     buckets: int | None = None,
     key: Callable[[T], object] | None = None,
     cmp: Callable[[T, T], int] | None = None,
@@ -178,10 +183,10 @@ def bucket_sort(
     но при необходимости нормализует данные к этому диапазону. При cmp сортирует вставками с использованием компаратора.
     """
     if len(a) < 2:
-        return a.copy()
+        return list(a)
 
     if cmp is not None:
-        result = a.copy()
+        result = list(a)
         for i in range(1, len(result)):
             current = result[i]
             j = i - 1
@@ -221,44 +226,276 @@ def bucket_sort(
     return result
 
 
+def sift_down(
+    items: list[T],
+    root: int,
+    end: int,
+    key: Callable[[T], object] | None,
+    cmp: Callable[[T, T], int] | None,
+    order: int = 1,
+) -> None:
+    """
+    Просеивает items[root] вниз в двоичной куче items[:end].
+    order=1 строит max-кучу (как в heap_sort), order=-1 – min-кучу.
+    """
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            break
+        if child + 1 < end and compare(items[child], items[child + 1], key, cmp) * order < 0:
+            child += 1
+        if compare(items[root], items[child], key, cmp) * order < 0:
+            items[root], items[child] = items[child], items[root]
+            root = child
+        else:
+            break
+
+
+def sift_up(
+    items: list[T],
+    index: int,
+    key: Callable[[T], object] | None,
+    cmp: Callable[[T, T], int] | None,
+    order: int = 1,
+) -> None:
+    """
+    Поднимает items[index] вверх в двоичной куче. Семантика order та же, что и в sift_down.
+    """
+    while index > 0:
+        parent = (index - 1) // 2
+        if compare(items[parent], items[index], key, cmp) * order < 0:
+            items[parent], items[index] = items[index], items[parent]
+            index = parent
+        else:
+            break
+
+
 def heap_sort(
-    a: list[T],
+    a: Sequence[T],
     key: Callable[[T], object] | None = None,
     cmp: Callable[[T, T], int] | None = None,
 ) -> list[T]:
     """
     Сортировка кучей (пирамидальная сортировка). Поддерживает key и cmp.
     """
-    result = a.copy()
+    result = list(a)
     n = len(result)
 
     for i in range(n // 2 - 1, -1, -1):
-        root = i
-        while True:
-            child = 2 * root + 1
-            if child >= n:
-                break
-            if child + 1 < n and compare(result[child], result[child + 1], key, cmp) < 0:
-                child += 1
-            if compare(result[root], result[child], key, cmp) < 0:
-                result[root], result[child] = result[child], result[root]
-                root = child
-            else:
-                break
+        sift_down(result, i, n, key, cmp)
 
     for i in range(n - 1, 0, -1):
         result[0], result[i] = result[i], result[0]
-        root = 0
-        while True:
-            child = 2 * root + 1
-            if child >= i:
-                break
-            if child + 1 < i and compare(result[child], result[child + 1], key, cmp) < 0:
-                child += 1
-            if compare(result[root], result[child], key, cmp) < 0:
-                result[root], result[child] = result[child], result[root]
-                root = child
-            else:
-                break
+        sift_down(result, 0, i, key, cmp)
 
     return result
+
+
+def iter_k_sorted(
+    values: Iterable[T],
+    k: int,
+    key: Callable[[T], object] | None = None,
+    cmp: Callable[[T, T], int] | None = None,
+) -> Iterator[T]:
+    """
+    Потоковая сортировка входа, где каждый элемент не дальше k позиций от своего места:
+    min-куча из k+1 элементов, O(n log k) сравнений, O(k) памяти, элемент выдается не позже
+    чем через k прочитанных. Если вход смещен сильнее (новый элемент меньше уже выданного),
+    выбрасывается ValueError.
+    """
+    if k < 0:
+        raise ValueError("k должно быть неотрицательным")
+    heap: list[T] = []
+
+    def pop_min() -> T:
+        smallest = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            sift_down(heap, 0, len(heap), key, cmp, order=-1)
+        return smallest
+
+    emitted = False
+    latest: T | None = None
+    for value in values:
+        if emitted and compare(value, latest, key, cmp) < 0:  # type: ignore[arg-type]
+            raise ValueError(f"Вход смещен больше чем на k={k} позиций")
+        heap.append(value)
+        sift_up(heap, len(heap) - 1, key, cmp, order=-1)
+        if len(heap) > k:
+            latest = pop_min()
+            emitted = True
+            yield latest
+    while heap:
+        yield pop_min()
+
+
+def k_sorted_sort(
+    a: Sequence[T],
+    k: int,
+    key: Callable[[T], object] | None = None,
+    cmp: Callable[[T, T], int] | None = None,
+) -> list[T]:
+    """
+    Сортировка почти упорядоченного входа (каждый элемент не дальше k позиций от своего места)
+    за O(n log k). Поддерживает key и cmp. При большем смещении выбрасывает ValueError.
+    """
+    return list(iter_k_sorted(a, k, key, cmp))
+
+
+def estimate_displacement(
+    a: Sequence[T],
+    key: Callable[[T], object] | None = None,
+    cmp: Callable[[T, T], int] | None = None,
+    samples: int = 256,
+    seed: int = 0,
+) -> int:
+    """
+    Оценка k для k_sorted_sort по выборке: префиксные максимумы считаются за один проход,
+    затем для samples случайных позиций i бинарным поиском находится первый j с a[j] > a[i].
+    Возвращается max(i - j) – сколько предыдущих элементов может быть больше a[i]; по
+    невыбранным позициям оценка может оказаться заниженной.
+    """
+    n = len(a)
+    if n < 2:
+        return 0
+    keys: list
+    if cmp is not None:
+        keys = list(map(cmp_to_key(cmp), a))
+    else:
+        keys = list(map(key, a)) if key else list(a)
+    prefix_max = list(accumulate(keys, max))
+    positions = range(n) if n <= samples else random.Random(seed).sample(range(1, n), samples)
+    return max(index - bisect_right(prefix_max, keys[index], 0, index) for index in positions)
+
+
+def adaptive_sort(
+    a: Sequence[T],
+    key: Callable[[T], object] | None = None,
+    cmp: Callable[[T, T], int] | None = None,
+    samples: int = 256,
+) -> list[T]:
+    """
+    Сортировка с выбором движка без подсказки: если estimate_displacement дает небольшое
+    смещение (k не больше n/4), используется k_sorted_sort, иначе – heap_sort. Если выборка
+    недооценила смещение, k_sorted_sort обнаруживает это и сортировка повторяется heap_sort.
+    """
+    if len(a) < 2:
+        return list(a)
+    k = estimate_displacement(a, key, cmp, samples)
+    if 4 * k <= len(a):
+        try:
+            return k_sorted_sort(a, k, key, cmp)
+        except ValueError:
+            pass
+    return heap_sort(a, key, cmp)
+
+
+def _integer_keys(
+    a: Sequence[T],
+    key: Callable[[T], object] | None,
+    cmp: Callable[[T, T], int] | None,
+) -> list[int] | None:
+    """Целочисленные ключи элементов или None, если есть cmp или нецелый ключ."""
+    if cmp is not None:
+        return None
+    keys = list(map(key, a)) if key else list(a)
+    if any(not isinstance(key_value, int) for key_value in keys):
+        return None
+    return keys  # type: ignore[return-value]
+
+
+def _counting_buckets(a: Sequence[T], keys: list[int]) -> list[list[T]] | None:
+    """
+    Корзины counting_sort по целочисленным ключам или None, если диапазон ключей намного
+    шире числа элементов (тогда выгоднее radix_sort).
+    """
+    if not keys:
+        return []
+    low, high = min(keys), max(keys)
+    if high - low + 1 > 2 * len(keys) + 1024:
+        return None
+    buckets: list[list[T]] = [[] for bucket_index in range(high - low + 1)]
+    for key_value, value in zip(keys, a):
+        buckets[key_value - low].append(value)
+    return buckets
+
+
+def _sorted_groups(
+    a: Sequence[T],
+    key: Callable[[T], object] | None,
+    cmp: Callable[[T, T], int] | None,
+    keys: list[int] | None,
+) -> tuple[list[T], array]:
+    """
+    Отсортированные элементы и границы групп равных ключей: radix_sort для целых ключей,
+    quick_sort (устойчивая) иначе, затем один проход сравнения соседей.
+    """
+    ordered = radix_sort(a, key=key) if keys is not None else quick_sort(a, key=key, cmp=cmp)
+    offsets = array("q", [0])
+    for index in range(1, len(ordered)):
+        if compare(ordered[index - 1], ordered[index], key, cmp) != 0:
+            offsets.append(index)
+    if ordered:
+        offsets.append(len(ordered))
+    return ordered, offsets
+
+
+def sorted_unique(
+    a: Sequence[T],
+    key: Callable[[T], object] | None = None,
+    cmp: Callable[[T, T], int] | None = None,
+) -> list[T]:
+    """
+    Различные значения по возрастанию (для равных ключей – первый встретившийся элемент).
+    Для целых ключей с компактным диапазоном берется первый элемент каждой непустой корзины
+    counting_sort без сборки отсортированного массива. Поддерживает key и cmp.
+    """
+    keys = _integer_keys(a, key, cmp)
+    buckets = _counting_buckets(a, keys) if keys is not None else None
+    if buckets is not None:
+        return [bucket[0] for bucket in buckets if bucket]
+    ordered, offsets = _sorted_groups(a, key, cmp, keys)
+    return [ordered[start] for start in offsets[:-1]]
+
+
+def value_counts(
+    a: Sequence[T],
+    key: Callable[[T], object] | None = None,
+    cmp: Callable[[T, T], int] | None = None,
+) -> tuple[list[T], array]:
+    """
+    Различные значения по возрастанию и число повторов каждого (array('q') той же длины).
+    Для целых ключей счетчики берутся из размеров корзин counting_sort. Поддерживает key и cmp.
+    """
+    keys = _integer_keys(a, key, cmp)
+    buckets = _counting_buckets(a, keys) if keys is not None else None
+    if buckets is not None:
+        non_empty = [bucket for bucket in buckets if bucket]
+        return [bucket[0] for bucket in non_empty], array("q", map(len, non_empty))
+    ordered, offsets = _sorted_groups(a, key, cmp, keys)
+    counts = array("q", (end - start for start, end in zip(offsets, offsets[1:])))
+    return [ordered[start] for start in offsets[:-1]], counts
+
+
+def group_by_sorted(
+    a: Sequence[T],
+    key: Callable[[T], object] | None = None,
+    cmp: Callable[[T, T], int] | None = None,
+) -> tuple[list[T], array]:
+    """
+    Группировка по ключу: отсортированные (устойчиво) элементы и array('q') границ групп
+    длиной «число групп + 1» – группа i занимает ordered[offsets[i]:offsets[i + 1]].
+    Для целых ключей с компактным диапазоном группы – это непустые корзины counting_sort.
+    """
+    keys = _integer_keys(a, key, cmp)
+    buckets = _counting_buckets(a, keys) if keys is not None else None
+    if buckets is None:
+        return _sorted_groups(a, key, cmp, keys)
+    ordered: list[T] = []
+    offsets = array("q", [0])
+    for bucket in buckets:
+        if bucket:
+            ordered.extend(bucket)
+            offsets.append(len(ordered))
+    return ordered, offsets
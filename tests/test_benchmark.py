@@ -1,5 +1,35 @@
-from src.benchmark import benchmark_sorts, timeit_once
-from src.sorting import bubble_sort
+import asyncio
+import time
+from typing import Callable, Sequence
+
+import pytest
+
+from src.benchmark import (
+    DS_STRUCTURES,
+    DS_TRACES,
+    SweepCell,
+    benchmark_factorials,
+    benchmark_sliding_window,
+    benchmark_sorts,
+    benchmark_structures,
+    find_crossovers,
+    fit_exponent,
+    geometric_sizes,
+    make_trace,
+    measure,
+    measure_memory,
+    measure_startup,
+    naive_sliding_window_min,
+    parse_importtime,
+    run_benchmark,
+    run_isolated,
+    summarize,
+    sweep,
+    timeit_once,
+    timer_overhead,
+)
+from src.service import SortService
+from src.sorting import bubble_sort, counting_sort, heap_sort
 
 
 def test_benchmark_runs_and_timeit_once() -> None:
@@ -11,3 +41,259 @@ def test_benchmark_runs_and_timeit_once() -> None:
     assert "sample" in report
     assert "bubble" in report["sample"]
     assert report["sample"]["bubble"] >= 0
+
+
+def test_benchmark_sliding_window() -> None:
+    values = [5, 1, 4, 2, 8, 0, 3]
+    assert naive_sliding_window_min(values, 3) == [1, 1, 2, 0, 0]
+    report = benchmark_sliding_window(values, 3, runs=2)
+    assert set(report) == {"naive", "monotonic_deque", "min_max_queue"}
+    assert all(value >= 0 for value in report.values())
+    with pytest.raises(ValueError):
+        benchmark_sliding_window(values, 3, runs=0)
+
+
+def test_benchmark_factorials() -> None:
+    report = benchmark_factorials(300, runs=2)
+    assert set(report) == {"factorial", "factorial_recursive", "factorial_fast", "factorial_prime_swing"}
+    assert all(value is not None and value >= 0 for value in report.values())
+    with pytest.raises(ValueError):
+        benchmark_factorials(10, runs=0)
+
+
+def test_summarize_rejects_outliers() -> None:
+    stats = summarize([1.0, 1.1, 0.9, 1.0, 1.05, 50.0])
+    assert stats["outliers"] == 1
+    assert stats["samples"] == 5
+    assert stats["min"] == 0.9
+    assert stats["median"] == 1.0
+    assert stats["iqr"] > 0
+    assert 50.0 not in stats["times"]
+    single = summarize([2.0])
+    assert single["stdev"] == 0.0 and single["iqr"] == 0.0
+    assert summarize([1.0, 100.0, 1.0, 1.0], outlier_k=None)["samples"] == 4
+    with pytest.raises(ValueError):
+        summarize([])
+
+
+def test_measure_fixed_runs_and_calibration() -> None:
+    calls = []
+
+    def sorter(values: list) -> list:
+        calls.append(values)
+        return bubble_sort(values)
+
+    data = [3, 1, 2]
+    fixed = measure(sorter, data, runs=4, samples=3, warmup=2)
+    assert fixed["loops"] == 4
+    assert len(calls) == 2 + 4 * 3
+    assert all(values == data and values is not data for values in calls)
+    assert fixed["min"] <= fixed["median"]
+
+    calibrated = measure(bubble_sort, data, samples=2, target_time=0.001)
+    assert calibrated["loops"] > 1
+    assert timer_overhead(10) >= 0
+    with pytest.raises(ValueError):
+        measure(bubble_sort, data, runs=0)
+    with pytest.raises(ValueError):
+        measure(bubble_sort, data, samples=0)
+
+
+def test_run_benchmark_keeps_errors() -> None:
+    report = run_benchmark({"floats": [0.5, 0.25]}, {"bubble": bubble_sort, "counting": counting_sort}, runs=1, samples=2)
+    stats = report["floats"]["bubble"]
+    assert isinstance(stats, dict) and stats["samples"] >= 1
+    assert isinstance(report["floats"]["counting"], ValueError)
+
+
+def test_geometric_sizes_and_fit_exponent() -> None:
+    assert geometric_sizes(2, 5) == [4, 8, 16, 32]
+    assert geometric_sizes(1, 2, base=10) == [10, 100]
+    with pytest.raises(ValueError):
+        geometric_sizes(5, 2)
+    with pytest.raises(ValueError):
+        geometric_sizes(1, 2, base=1)
+    sizes = [16, 32, 64, 128]
+    slope, intercept = fit_exponent(sizes, [3e-9 * size**2 for size in sizes])
+    assert slope == pytest.approx(2.0)
+    with pytest.raises(ValueError):
+        fit_exponent([16], [1.0])
+    with pytest.raises(ValueError):
+        fit_exponent([16, 16], [1.0, 2.0])
+
+
+def _sweep_cell(sizes: list[int], medians: list[float]) -> SweepCell:
+    return {
+        "sizes": sizes,
+        "medians": medians,
+        "stopped_at": None,
+        "error": None,
+        "exponent": None,
+        "expected": None,
+        "flagged": False,
+    }
+
+
+def test_find_crossovers() -> None:
+    cells = {
+        "quadratic": _sweep_cell([10, 100, 1000], [1e-6, 1e-4, 1e-2]),
+        "linear": _sweep_cell([10, 100, 1000], [1e-5, 1e-4 * 2, 1e-3]),
+    }
+    crossovers = find_crossovers(cells)
+    assert len(crossovers) == 1
+    faster_small, faster_large, size = crossovers[0]
+    assert (faster_small, faster_large) == ("quadratic", "linear")
+    assert 100 < size < 1000
+
+
+def test_sweep_stops_on_budget_and_reports_exponents() -> None:
+    def failing(values: list) -> list:
+        if len(values) > 16:
+            raise RecursionError("слишком глубоко")
+        return sorted(values)
+
+    results = sweep(
+        {"reverse": lambda n: list(range(n, 0, -1))},
+        {"bubble": bubble_sort, "heap": heap_sort, "failing": failing},
+        geometric_sizes(3, 8),
+        time_budget=1e-4,
+        samples=2,
+        runs=1,
+        expected={"bubble": 1.0},
+        tolerance=0.2,
+    )
+    cells = results["reverse"]
+    assert cells["bubble"]["stopped_at"] is not None
+    assert cells["bubble"]["sizes"][-1] < 256
+    assert cells["failing"]["sizes"] == [8, 16]
+    assert str(cells["failing"]["error"]).startswith("RecursionError")
+    assert cells["failing"]["stopped_at"] == 32
+    if cells["bubble"]["exponent"] is not None and cells["bubble"]["exponent"] > 1.2:
+        assert cells["bubble"]["flagged"]
+    assert cells["heap"]["expected"] is None
+    assert not cells["heap"]["flagged"]
+
+
+def test_sweep_records_generator_errors_per_cell() -> None:
+    def picky(n: int) -> list[int]:
+        if n > 8:
+            raise ValueError("слишком длинный")
+        return list(range(n, 0, -1))
+
+    cells = sweep({"picky": picky}, {"heap": heap_sort, "bubble": bubble_sort}, [4, 8, 16, 32], samples=1, runs=1)["picky"]
+    for cell in cells.values():
+        assert cell["sizes"] == [4, 8]
+        assert cell["stopped_at"] == 16
+        assert cell["error"] == "ValueError: слишком длинный"
+
+
+def _hog_memory(values: list) -> list:
+    return [0] * (1 << 31)
+
+
+def _sleepy_sort(values: list) -> list:
+    time.sleep(5)
+    return sorted(values)
+
+
+def test_run_isolated_matches_structure_and_limits() -> None:
+    arrays: dict[str, Sequence] = {"ints": [3, 1, 2], "floats": [0.5, 0.1]}
+    algos: dict[str, Callable[..., list]] = {"sorted": sorted, "counting": counting_sort, "slow": _sleepy_sort, "hog": _hog_memory}
+    results = run_isolated(
+        arrays, algos, workers=2, timeout=1.0, memory_limit=1 << 30, pin_cpus=True, runs=1, samples=2
+    )
+    assert list(results) == ["ints", "floats"]
+    assert list(results["ints"]) == list(algos)
+    sorted_stats, counting_stats = results["ints"]["sorted"], results["ints"]["counting"]
+    assert isinstance(sorted_stats, dict) and sorted_stats["samples"] == 2
+    assert isinstance(counting_stats, dict) and counting_stats["median"] > 0
+    assert isinstance(results["floats"]["counting"], ValueError)
+    assert isinstance(results["ints"]["slow"], TimeoutError)
+    assert isinstance(results["ints"]["hog"], MemoryError)
+
+    with pytest.raises(ValueError):
+        run_isolated(arrays, algos, workers=0)
+    with pytest.raises(ValueError):
+        run_isolated(arrays, algos, timeout=0)
+
+
+def test_measure_memory_reports_peak_and_blocks() -> None:
+    values = list(range(1000))
+    copy_stats = measure_memory(list, values)
+    assert copy_stats["peak_bytes"] >= 8 * len(values)
+    assert copy_stats["bytes_per_element"] == copy_stats["peak_bytes"] / len(values)
+    assert copy_stats["net_blocks"] >= 1
+    heavy = measure_memory(lambda items: [[item] for item in items] and None, values)
+    assert heavy["peak_bytes"] > copy_stats["peak_bytes"]
+    assert heavy["net_blocks"] < 100
+    assert measure_memory(sorted, [])["bytes_per_element"] == 0.0
+
+    with_memory = run_benchmark({"ints": values}, {"heap": heap_sort}, runs=1, samples=1, memory=True)["ints"]["heap"]
+    assert isinstance(with_memory, dict) and with_memory["peak_bytes"] > 0
+    without_memory = run_benchmark({"ints": values}, {"heap": heap_sort}, runs=1, samples=1)["ints"]["heap"]
+    assert isinstance(without_memory, dict) and "peak_bytes" not in without_memory
+
+
+def test_parse_importtime() -> None:
+    stderr = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | encodings
+import time:      1500 |       2100 |     src.sorting
+not an import line"""
+    records = parse_importtime(stderr)
+    assert records == [
+        {"module": "_io", "self": 120, "cumulative": 120, "depth": 1},
+        {"module": "encodings", "self": 300, "cumulative": 420, "depth": 0},
+        {"module": "src.sorting", "self": 1500, "cumulative": 2100, "depth": 2},
+    ]
+
+
+def test_measure_startup_keeps_heavy_modules_lazy() -> None:
+    report = measure_startup(["fibo", "10"], repeats=1)
+    assert report["wall"] > 0
+    assert report["total_import"] == sum(report["imports"].values())
+    assert "src.sequences" in report["imports"]
+    assert "encodings" not in report["imports"]
+    for heavy in ("src.benchmark", "src.generators", "src.datasets", "numpy", "multiprocessing"):
+        assert heavy not in report["modules"]
+    with pytest.raises(ValueError):
+        measure_startup([], repeats=0)
+
+
+def test_measure_startup_keeps_client_free_of_benchmark(tmp_path) -> None:
+    async def scenario() -> dict:
+        async with SortService(workers=0) as service:
+            bound = await service.start(f"unix:{tmp_path / 'sort.sock'}")
+            return await asyncio.to_thread(measure_startup, ["client", "fibo", "10", "--address", bound], repeats=1)
+
+    report = asyncio.run(scenario())
+    assert "src.service" in report["modules"] and "src.latency" in report["modules"]
+    for heavy in ("src.benchmark", "multiprocessing", "tracemalloc"):
+        assert heavy not in report["modules"]
+
+
+@pytest.mark.parametrize("name", DS_TRACES)
+def test_make_trace_never_pops_empty(name: str) -> None:
+    trace = make_trace(name, 500, seed=3, burst=50)
+    assert len(trace) == 500
+    assert trace == make_trace(name, 500, seed=3, burst=50)
+    size = 0
+    for op, value in trace:
+        assert (value is not None) == (op == "push")
+        if op != "push":
+            assert size > 0
+        size += {"push": 1, "pop": -1}.get(op, 0)
+    with pytest.raises(ValueError):
+        make_trace("unknown", 10)
+
+
+def test_benchmark_structures_reports_throughput_latency_and_memory() -> None:
+    traces = {name: make_trace(name, 200) for name in ("alternating", "min_queries")}
+    results = benchmark_structures(traces, samples=2, target_time=0.0, memory_elements=500)
+    assert set(results) == set(DS_STRUCTURES)
+    assert isinstance(results["queue"]["traces"]["min_queries"], ValueError)
+    cell = results["stack"]["traces"]["min_queries"]
+    assert cell["ops"] == 200 and cell["ops_per_sec"] > 0
+    assert set(cell["latency_ns"]) == {"push", "pop", "min"}
+    assert cell["latency_ns"]["push"]["p50"] <= cell["latency_ns"]["push"]["p99"]
+    assert results["stack"]["bytes_per_element"] > 0
@@ -1,6 +1,17 @@
+import random
+
 import pytest
 
-from src.data_structures import Queue, Stack
+from src.data_structures import (
+    MinMaxQueue,
+    MonotonicDeque,
+    PairingHeap,
+    PriorityQueue,
+    Queue,
+    Stack,
+    sliding_window_max,
+    sliding_window_min,
+)
 
 
 def test_stack_push_pop_min() -> None:
@@ -11,10 +22,13 @@ def test_stack_push_pop_min() -> None:
         stack.peek()
     with pytest.raises(IndexError):
         stack.min()
+    with pytest.raises(IndexError):
+        stack.max()
     stack.push(3)
     stack.push(1)
     stack.push(4)
     assert stack.min() == 1
+    assert stack.max() == 4
     assert stack.peek() == 4
     assert stack.pop() == 4
     assert stack.min() == 1
@@ -37,3 +51,108 @@ def test_queue_enqueue_dequeue() -> None:
         queue.dequeue()
     with pytest.raises(IndexError):
         queue.front()
+
+
+@pytest.mark.parametrize("queue_class", [MinMaxQueue, MonotonicDeque])
+def test_min_max_queues(queue_class) -> None:
+    queue = queue_class()
+    for method in (queue.dequeue, queue.front, queue.min, queue.max):
+        with pytest.raises(IndexError):
+            method()
+    rng = random.Random(3)
+    expected: list[int] = []
+    for step in range(300):
+        if rng.random() < 0.6 or not expected:
+            value = rng.randint(-5, 5)
+            queue.enqueue(value)
+            expected.append(value)
+        else:
+            assert queue.dequeue() == expected.pop(0)
+        if expected:
+            assert queue.front() == expected[0]
+            assert queue.min() == min(expected)
+            assert queue.max() == max(expected)
+        assert len(queue) == len(expected)
+        assert queue.is_empty() == (not expected)
+
+
+def test_sliding_window_min_max() -> None:
+    data = [4, 2, 12, 3, 8, 8, 1, 7]
+    assert list(sliding_window_min(data, 3)) == [2, 2, 3, 3, 1, 1]
+    assert list(sliding_window_max(iter(data), 3)) == [12, 12, 12, 8, 8, 8]
+    assert list(sliding_window_min(data, 1)) == data
+    assert list(sliding_window_max(data, 20)) == []
+    with pytest.raises(ValueError):
+        sliding_window_min(data, 0)
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4])
+def test_priority_queue_heapify_and_pop(arity: int) -> None:
+    data = [5, -2, 9, 0, 3, 3, -2, 7]
+    queue = PriorityQueue(data, arity=arity)
+    assert len(queue) == len(data)
+    assert queue.peek() == -2
+    assert [queue.pop() for index in range(len(data))] == sorted(data)
+    assert queue.is_empty()
+    with pytest.raises(IndexError):
+        queue.pop()
+    with pytest.raises(IndexError):
+        queue.peek()
+    with pytest.raises(ValueError):
+        PriorityQueue(arity=1)
+
+
+@pytest.mark.parametrize("heap_class", [PriorityQueue, PairingHeap])
+def test_heaps_decrease_increase_and_remove(heap_class) -> None:
+    heap = heap_class()
+    handles = {value: heap.push(value) for value in (10, 20, 30, 40, 50)}
+    heap.decrease_key(handles[40], 5)
+    assert heap.peek() == 5
+    heap.increase_key(handles[40], 45)
+    heap.increase_key(handles[10], 35)
+    assert heap.peek() == 20
+    heap.update(handles[50], 1)
+    assert heap.remove(handles[30]) == 30
+    assert handles[30] not in heap
+    with pytest.raises(KeyError):
+        heap.get(handles[30])
+    with pytest.raises(ValueError):
+        heap.decrease_key(handles[20], 100)
+    with pytest.raises(ValueError):
+        heap.increase_key(handles[20], 0)
+    assert heap.pop_item() == (handles[50], 1)
+    assert [heap.pop() for index in range(len(heap))] == [20, 35, 45]
+
+
+@pytest.mark.parametrize("heap_class", [PriorityQueue, PairingHeap])
+def test_heaps_key_and_cmp(heap_class) -> None:
+    words = ["bbb", "a", "dddd", "cc"]
+    by_length = heap_class(words, key=len)
+    assert [by_length.pop() for index in range(len(words))] == sorted(words, key=len)
+
+    def reverse_cmp(left: int, right: int) -> int:
+        return (right > left) - (right < left)
+
+    reversed_heap = heap_class([3, 1, 2], cmp=reverse_cmp)
+    assert [reversed_heap.pop() for index in range(3)] == [3, 2, 1]
+
+
+@pytest.mark.parametrize("heap_class", [PriorityQueue, PairingHeap])
+def test_heaps_random_operations_match_sorted(heap_class) -> None:
+    rng = random.Random(5)
+    heap = heap_class()
+    alive: dict[int, int] = {}
+    for step in range(500):
+        action = rng.random()
+        if action < 0.5 or not alive:
+            value = rng.randint(-100, 100)
+            alive[heap.push(value)] = value
+        elif action < 0.8:
+            handle = rng.choice(list(alive))
+            alive[handle] = rng.randint(-100, 100)
+            heap.update(handle, alive[handle])
+        else:
+            handle, value = heap.pop_item()
+            assert value == min(alive.values())
+            assert alive.pop(handle) == value
+    assert sorted(alive.values()) == [heap.pop() for index in range(len(alive))]
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from src.dataset_cache import DatasetCache
+from src.datasets import stream_chunks
+
+
+def test_cache_generates_once_and_loads_via_mmap(tmp_path) -> None:
+    cache = DatasetCache(tmp_path)
+    with cache.load("rand_int_array", 10, seed=4, chunk_size=4, lo=0, hi=9) as dataset:
+        first = list(dataset.values)
+    expected = [value for chunk in stream_chunks("rand_int_array", 10, chunk_size=4, seed=4, lo=0, hi=9) for value in chunk]
+    assert first == expected
+
+    key = cache.make_key("rand_int_array", 10, 4, 4, {"lo": 0, "hi": 9})
+    modified = cache.data_path(key).stat().st_mtime_ns
+    assert cache.ensure("rand_int_array", 10, seed=4, chunk_size=4, lo=0, hi=9) == key
+    assert cache.verify(key, full=True)
+    assert [meta["key"] for meta in cache.entries()] == [key]
+    assert cache.data_path(key).stat().st_mtime_ns >= modified
+    assert cache.make_key("rand_int_array", 10, 5, 4, {"lo": 0, "hi": 9}) != key
+
+
+def test_cache_detects_corruption(tmp_path) -> None:
+    cache = DatasetCache(tmp_path)
+    key = cache.ensure("reverse_sorted", 6, chunk_size=4)
+    path = cache.data_path(key)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert cache.verify(key)
+    assert not cache.verify(key, full=True)
+    with cache.load("reverse_sorted", 6, chunk_size=4, verify=True) as dataset:
+        assert list(dataset.values) == [6, 5, 4, 3, 2, 1]
+
+    path.write_bytes(b"garbage")
+    assert not cache.verify(key)
+    assert cache.ensure("reverse_sorted", 6, chunk_size=4) == key
+    assert cache.verify(key, full=True)
+
+
+def test_cache_lru_eviction_and_purge(tmp_path) -> None:
+    cache = DatasetCache(tmp_path, max_bytes=10**9)
+    old_key = cache.ensure("reverse_sorted", 100)
+    new_key = cache.ensure("reverse_sorted", 200)
+    os.utime(cache.data_path(old_key), (1, 1))
+    cache.max_bytes = cache.data_path(new_key).stat().st_size
+    assert cache.evict() == [old_key]
+    assert [meta["key"] for meta in cache.entries()] == [new_key]
+    assert cache.total_bytes() <= cache.max_bytes
+    (tmp_path / "leftover.tmp").write_bytes(b"x")
+    assert cache.purge() == 1
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(ValueError):
+        DatasetCache(tmp_path, max_bytes=0)
+
+
+def test_cache_ensure_values_stores_built_values(tmp_path) -> None:
+    cache = DatasetCache(tmp_path)
+    calls = []
+
+    def build() -> list[float]:
+        calls.append(1)
+        return [0.5, -1.0, 2.25]
+
+    with cache.load_values("custom", 3, build, seed=1, scale=2) as dataset:
+        assert list(dataset.values) == [0.5, -1.0, 2.25]
+    key = cache.ensure_values("custom", 3, build, seed=1, scale=2)
+    assert calls == [1]
+    assert cache.verify(key, full=True)
+    assert key != cache.ensure_values("custom", 3, build, seed=2, scale=2)
+    with pytest.raises(ValueError):
+        cache.ensure_values("custom", 4, build)
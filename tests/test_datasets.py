@@ -0,0 +1,122 @@
+from array import array
+
+import pytest
+
+from src.datasets import (
+    Dataset,
+    chunk_seed,
+    generate_shared,
+    generator_params,
+    open_dataset,
+    read_header,
+    spawn_seeds,
+    stream_chunks,
+    write_dataset,
+    write_values,
+)
+from src.sorting import heap_sort, quick_sort
+
+
+def test_stream_chunks_are_deterministic_and_bounded() -> None:
+    chunks = list(stream_chunks("rand_int_array", 10, chunk_size=4, seed=3, lo=-5, hi=5))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert all(isinstance(chunk, array) for chunk in chunks)
+    again = list(stream_chunks("rand_int_array", 10, chunk_size=4, seed=3, lo=-5, hi=5))
+    assert chunks == again
+    assert all(-5 <= value <= 5 for chunk in chunks for value in chunk)
+    assert chunk_seed(3, 0) != chunk_seed(3, 1)
+
+
+def test_stream_chunks_generators() -> None:
+    reverse = [value for chunk in stream_chunks("reverse_sorted", 7, chunk_size=3) for value in chunk]
+    assert reverse == [7, 6, 5, 4, 3, 2, 1]
+    nearly = [value for chunk in stream_chunks("nearly_sorted", 20, chunk_size=8, seed=1, swaps=4) for value in chunk]
+    assert sorted(nearly) == list(range(20))
+    duplicates = [value for chunk in stream_chunks("many_duplicates", 50, chunk_size=8, k_unique=3) for value in chunk]
+    assert len(set(duplicates)) <= 3
+    floats = next(stream_chunks("rand_float_array", 5, chunk_size=8))
+    assert floats.typecode == "d"
+    with pytest.raises(ValueError):
+        stream_chunks("unknown", 5)
+    with pytest.raises(ValueError):
+        stream_chunks("reverse_sorted", 5, chunk_size=0)
+    with pytest.raises(ValueError):
+        stream_chunks("reverse_sorted", -1)
+
+
+def test_write_and_mmap_dataset(tmp_path) -> None:
+    path = tmp_path / "ints.bin"
+    header = write_dataset(str(path), "rand_int_array", 9, chunk_size=4, seed=5, lo=0, hi=100)
+    expected = [value for chunk in stream_chunks("rand_int_array", 9, chunk_size=4, seed=5, lo=0, hi=100) for value in chunk]
+    assert read_header(str(path)) == header
+    assert header["params"] == {"lo": 0, "hi": 100}
+    with open_dataset(str(path)) as dataset:
+        assert isinstance(dataset.values, memoryview)
+        assert dataset.values.format == "q"
+        assert len(dataset) == 9
+        assert list(dataset) == expected
+        assert dataset[0] == expected[0]
+        assert quick_sort(dataset.values) == sorted(expected)
+        assert heap_sort(dataset.values) == sorted(expected)
+
+
+def test_write_values_and_errors(tmp_path) -> None:
+    path = tmp_path / "floats.bin"
+    write_values(str(path), [0.5, 1, -2.25])
+    with Dataset(str(path)) as dataset:
+        assert dataset.header["dtype"] == "float64"
+        assert list(dataset.values) == [0.5, 1.0, -2.25]
+
+    broken = tmp_path / "broken.bin"
+    broken.write_bytes(b"not a dataset at all")
+    with pytest.raises(ValueError):
+        open_dataset(str(broken))
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        open_dataset(str(empty))
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        open_dataset(str(truncated))
+
+
+def test_spawn_seeds() -> None:
+    assert spawn_seeds(7, 3) == [chunk_seed(7, 0), chunk_seed(7, 1), chunk_seed(7, 2)]
+    assert len(set(spawn_seeds(7, 100))) == 100
+    assert spawn_seeds(7, 0) == []
+    with pytest.raises(ValueError):
+        spawn_seeds(7, -1)
+
+
+@pytest.mark.parametrize("generator,params", [("rand_int_array", {"lo": -9, "hi": 9}), ("rand_float_array", {})])
+def test_parallel_file_generation_is_bit_identical(tmp_path, generator, params) -> None:
+    serial = tmp_path / "serial.bin"
+    parallel = tmp_path / "parallel.bin"
+    write_dataset(str(serial), generator, 1000, chunk_size=64, seed=11, **params)
+    write_dataset(str(parallel), generator, 1000, chunk_size=64, seed=11, workers=3, **params)
+    assert serial.read_bytes() == parallel.read_bytes()
+
+
+def test_shared_memory_generation_is_independent_of_workers() -> None:
+    expected = [value for chunk in stream_chunks("nearly_sorted", 500, chunk_size=50, seed=2, swaps=40) for value in chunk]
+    with generate_shared("nearly_sorted", 500, chunk_size=50, seed=2, swaps=40) as single:
+        with generate_shared("nearly_sorted", 500, chunk_size=50, seed=2, workers=4, swaps=40) as pooled:
+            assert single.values.tobytes() == pooled.values.tobytes()
+            assert list(pooled.values) == expected
+            assert len(pooled) == 500
+    with generate_shared("reverse_sorted", 0) as empty:
+        assert len(empty) == 0
+    with pytest.raises(ValueError):
+        generate_shared("unknown", 10)
+
+
+def test_generator_params_are_validated_before_writing(tmp_path) -> None:
+    assert generator_params("rand_int_array") == ("lo", "hi")
+    assert generator_params("reverse_sorted") == ()
+    path = tmp_path / "bad.bin"
+    with pytest.raises(ValueError):
+        write_dataset(str(path), "nearly_sorted", 10, k_unique=3)
+    with pytest.raises(ValueError):
+        generate_shared("rand_int_array", 10, foo=1)
+    assert not path.exists()
@@ -1,11 +1,28 @@
+from array import array
+from typing import Callable
+
 import pytest
 
 from src.generators import (
+    bucket_skew,
+    lognormal_floats,
     many_duplicates,
+    many_duplicates_fast,
     nearly_sorted,
+    nearly_sorted_fast,
+    organ_pipe,
+    pareto_floats,
+    quick_sort_killer,
     rand_float_array,
+    rand_float_array_fast,
     rand_int_array,
+    rand_int_array_fast,
     reverse_sorted,
+    reverse_sorted_fast,
+    sawtooth,
+    sorted_with_tail,
+    wide_range_ints,
+    zipf_ints,
 )
 
 
@@ -59,3 +76,122 @@ def test_rand_float_array_ranges_and_seed() -> None:
     assert all(0.0 <= value <= 1.0 for value in result)
     with pytest.raises(ValueError):
         rand_float_array(-1, 0.0, 1.0)
+
+
+def test_fast_generators_python_backend_are_deterministic() -> None:
+    assert rand_int_array_fast(6, -5, 5, seed=4, backend="python") == [-3, -2, -4, 2, -1, 0]
+    assert rand_float_array_fast(3, seed=4, backend="python") == [
+        0.3032985916910804,
+        0.7212169051876212,
+        0.4788783945599706,
+    ]
+    assert nearly_sorted_fast(6, 2, seed=4, backend="python") == [0, 5, 1, 3, 4, 2]
+    assert many_duplicates_fast(6, 3, seed=4, backend="python") == [-24, -12, -12, -16, -16, -16]
+    assert reverse_sorted_fast(4, backend="python") == [4, 3, 2, 1]
+
+
+def test_fast_generators_ranges_and_outputs() -> None:
+    values = rand_int_array_fast(1000, -3, 2**40, seed=1, backend="python", output="array")
+    assert isinstance(values, array) and values.typecode == "q"
+    assert all(-3 <= value <= 2**40 for value in values)
+    extremes = rand_int_array_fast(100, -(2**63), 2**63 - 1, seed=1, backend="python")
+    assert min(extremes) < 0 < max(extremes)
+    floats = rand_float_array_fast(1000, -2.0, 3.0, seed=1, backend="python", output="array")
+    assert floats.typecode == "d"
+    assert all(-2.0 <= value < 3.0 for value in floats)
+    assert sorted(nearly_sorted_fast(50, 10, seed=3, backend="python")) == list(range(50))
+    assert len(set(many_duplicates_fast(100, 4, seed=3, backend="python"))) <= 4
+
+
+def test_fast_generators_validation() -> None:
+    with pytest.raises(ValueError):
+        rand_int_array_fast(-1, 0, 5)
+    with pytest.raises(ValueError):
+        rand_int_array_fast(3, 5, 0)
+    with pytest.raises(ValueError):
+        rand_int_array_fast(3, 0, 2**70)
+    with pytest.raises(ValueError):
+        rand_int_array_fast(3, 0, 2**70, output="array")
+    with pytest.raises(ValueError):
+        rand_int_array_fast(3, 0, 5, backend="cuda")
+    with pytest.raises(ValueError):
+        rand_float_array_fast(3, output="tensor")
+    with pytest.raises(ValueError):
+        nearly_sorted_fast(1, 1)
+    with pytest.raises(ValueError):
+        many_duplicates_fast(3, 0)
+    with pytest.raises(ValueError):
+        reverse_sorted_fast(-1)
+
+
+def test_fast_generators_numpy_matches_python_backend() -> None:
+    pytest.importorskip("numpy")
+    cases: list[tuple[Callable, tuple]] = [
+        (rand_int_array_fast, (500, -5, 5)),
+        (rand_int_array_fast, (500, -(2**63), 2**63 - 1)),
+        (rand_int_array_fast, (500, -3, 2**40)),
+        (rand_float_array_fast, (500, -2.5, 7.0)),
+        (nearly_sorted_fast, (100, 30)),
+        (many_duplicates_fast, (500, 7)),
+    ]
+    for generator, args in cases:
+        expected = generator(*args, seed=9, backend="python")
+        assert generator(*args, seed=9, backend="numpy") == expected
+        assert generator(*args, seed=9, backend="numpy", output="array").tolist() == expected
+        assert generator(*args, seed=9, backend="python", output="numpy").tolist() == expected
+
+
+def test_quick_sort_killer_puts_maximum_in_the_middle() -> None:
+    assert quick_sort_killer(8) == [1, 3, 5, 7, 8, 6, 4, 2]
+    values = quick_sort_killer(50)
+    assert sorted(values) == list(range(1, 51))
+    # Каждый шаг quick_sort отщепляет только максимум: в середине оставшейся части всегда максимум.
+    remaining = values
+    while remaining:
+        pivot = remaining[len(remaining) // 2]
+        assert pivot == max(remaining)
+        remaining = [value for value in remaining if value < pivot]
+    assert quick_sort_killer(0) == []
+
+
+def test_pattern_generators() -> None:
+    assert organ_pipe(7) == [0, 1, 2, 3, 2, 1, 0]
+    assert organ_pipe(6) == [0, 1, 2, 2, 1, 0]
+    assert sawtooth(10, 3) == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+    assert sawtooth(0) == []
+    tail = sorted_with_tail(10, 3, seed=1)
+    assert tail[:7] == list(range(7))
+    assert all(0 <= value < 10 for value in tail[7:])
+
+
+def test_skewed_and_heavy_tailed_generators() -> None:
+    skew = bucket_skew(50, seed=1)
+    assert min(skew) == 0.0 and max(skew) == 1.0
+    assert sum(1 for value in skew if 0.5 <= value < 0.5 + 1e-8) == 48
+    assert bucket_skew(1, seed=1) == [0.0]
+    wide = wide_range_ints(10, span=1000, seed=1)
+    assert min(wide) == 0 and max(wide) == 999
+    zipf = zipf_ints(2000, s=1.5, k=50, seed=1)
+    assert all(1 <= value <= 50 for value in zipf)
+    assert zipf.count(1) > zipf.count(2) > zipf.count(10)
+    assert all(value > 0 for value in lognormal_floats(100, seed=1))
+    assert all(value >= 1.0 for value in pareto_floats(100, seed=1))
+    assert lognormal_floats(3, seed=2) == lognormal_floats(3, seed=2)
+
+
+def test_adversarial_generators_validation() -> None:
+    for generator in (quick_sort_killer, organ_pipe, sawtooth, bucket_skew, wide_range_ints, zipf_ints):
+        with pytest.raises(ValueError):
+            generator(-1)
+    with pytest.raises(ValueError):
+        sawtooth(5, 0)
+    with pytest.raises(ValueError):
+        wide_range_ints(5, span=0)
+    with pytest.raises(ValueError):
+        zipf_ints(5, k=0)
+    with pytest.raises(ValueError):
+        pareto_floats(5, alpha=0)
+    with pytest.raises(ValueError):
+        sorted_with_tail(5, 6)
+    with pytest.raises(ValueError):
+        lognormal_floats(-1)
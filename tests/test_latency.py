@@ -0,0 +1,8 @@
+from src.latency import latency_summary, percentile
+
+
+def test_percentiles() -> None:
+    assert percentile([], 0.5) == 0.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.99) == 4.0
+    assert latency_summary([3.0, 1.0, 2.0])["max"] == 3.0
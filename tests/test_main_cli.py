@@ -1,8 +1,15 @@
+import json
+from contextlib import ExitStack
+
 import pytest
 from typer.testing import CliRunner
 
-from src.main import app
-from src.sorting import bubble_sort
+from src.dataset_cache import DatasetCache
+from src.benchmark import run_benchmark
+from src.generators import quick_sort_killer
+from src.main import app, build_benchmark_inputs, format_benchmark_lines
+from src.number_io import read_numbers
+from src.sorting import bubble_sort, quick_sort
 
 
 runner = CliRunner()
@@ -31,6 +38,11 @@ def test_cli_sequences() -> None:
     assert runner.invoke(app, ["factorial-rec", "5"]).stdout.strip() == "120"
     assert runner.invoke(app, ["fibo", "7"]).stdout.strip() == "13"
     assert runner.invoke(app, ["fibo-rec", "7"]).stdout.strip() == "13"
+    assert runner.invoke(app, ["fibo-fast", "7"]).stdout.strip() == "13"
+    assert runner.invoke(app, ["factorial-fast", "5"]).stdout.strip() == "120"
+    assert runner.invoke(app, ["factorial-fast", "6", "--prime-swing"]).stdout.strip() == "720"
+    assert runner.invoke(app, ["factorial-mod", "6", "7"]).stdout.strip() == "6"
+    assert runner.invoke(app, ["fibo-mod", "10", "7"]).stdout.strip() == "6"
 
 
 def test_cli_stack_and_queue_demos() -> None:
@@ -55,6 +67,95 @@ def test_cli_benchmark_command() -> None:
     assert "среднее" in result.stdout
 
 
+def test_cli_make_dataset_and_benchmark_from_file(tmp_path) -> None:
+    path = tmp_path / "data.bin"
+    created = runner.invoke(
+        app, ["make-dataset", str(path), "rand_int_array", "12", "--param", "lo=-3", "--param", "hi=3"]
+    )
+    assert created.exit_code == 0
+    assert "Записано 12" in created.stdout
+    result = runner.invoke(app, ["benchmark", "--runs", "2", "--dataset", str(path)])
+    assert result.exit_code == 0
+    assert "data.bin (n=12)" in result.stdout
+    assert runner.invoke(app, ["make-dataset", str(path), "unknown", "3"]).exit_code != 0
+    assert runner.invoke(app, ["make-dataset", str(path), "rand_int_array", "3", "--param", "lo"]).exit_code != 0
+
+
+def test_cli_make_dataset_rejects_unknown_params_without_leaving_a_file(tmp_path) -> None:
+    path = tmp_path / "bad.bin"
+    result = runner.invoke(app, ["make-dataset", str(path), "rand_int_array", "10", "--param", "foo=1"])
+    assert result.exit_code == 2
+    assert "foo" in result.output
+    assert not path.exists()
+    failed = runner.invoke(app, ["make-dataset", str(path), "rand_int_array", "10", "--param", "lo=5", "--param", "hi=1"])
+    assert failed.exit_code == 2
+    assert not path.exists()
+
+
+def test_cli_dataset_cache_commands(tmp_path) -> None:
+    cache_dir = str(tmp_path / "cache")
+    prewarm = runner.invoke(app, ["cache", "prewarm", "--size", "8", "--cache-dir", cache_dir])
+    assert prewarm.exit_code == 0
+    assert "rand_float_array (n=8)" in prewarm.stdout
+    listing = runner.invoke(app, ["cache", "list", "--cache-dir", cache_dir])
+    assert "Записей: 5" in listing.stdout
+    result = runner.invoke(app, ["benchmark", "--runs", "1", "--size", "8", "--cache-dir", cache_dir])
+    assert result.exit_code == 0
+    assert "nearly_sorted (n=8)" in result.stdout
+    purge = runner.invoke(app, ["cache", "purge", "--cache-dir", cache_dir])
+    assert "Удалено записей: 5" in purge.stdout
+
+
+def test_cached_benchmark_inputs_match_in_memory(tmp_path) -> None:
+    expected = build_benchmark_inputs(None, 20)
+    cache = DatasetCache(tmp_path)
+    for attempt in range(2):
+        with ExitStack() as stack:
+            cached = build_benchmark_inputs(None, 20, cache, stack)
+            assert {name: list(values) for name, values in cached.items()} == expected
+    assert len(cache.entries()) == len(expected)
+
+
+def test_cli_benchmark_adversarial_suite() -> None:
+    result = runner.invoke(app, ["benchmark", "--runs", "1", "--size", "12", "--suite", "all"])
+    assert result.exit_code == 0
+    for name in ("rand_int_array (n=12)", "quick_sort_killer (n=12)", "bucket_skew (n=12)", "pareto_floats (n=12)"):
+        assert name in result.stdout
+    assert runner.invoke(app, ["benchmark", "--suite", "unknown"]).exit_code != 0
+
+
+@pytest.mark.parametrize("size", ["0", "1"])
+def test_cli_benchmark_tiny_sizes(tmp_path, size: str) -> None:
+    for extra in ([], ["--cache-dir", str(tmp_path)]):
+        result = runner.invoke(app, ["benchmark", "--runs", "1", "--samples", "1", "--size", size, "--suite", "all", *extra])
+        assert result.exit_code == 0, result.output
+        assert f"nearly_sorted (n={size})" in result.stdout
+        assert f"sorted_with_tail (n={size})" in result.stdout
+
+
+def test_cli_benchmark_sweep() -> None:
+    result = runner.invoke(
+        app,
+        ["benchmark-sweep", "--min-exp", "2", "--max-exp", "4", "--budget", "0.5", "--samples", "1", "--target-time", "0"],
+    )
+    assert result.exit_code == 0
+    assert "rand_int_array:" in result.stdout
+    assert "bubble: n=4..16" in result.stdout
+    assert "k≈" in result.stdout
+    bad = runner.invoke(app, ["benchmark-sweep", "--min-exp", "5", "--max-exp", "3"])
+    assert bad.exit_code != 0
+    tiny = runner.invoke(app, ["benchmark-sweep", "--min-exp", "0", "--max-exp", "1", "--samples", "1", "--target-time", "0"])
+    assert tiny.exit_code == 0, tiny.output
+    assert "остановлен на n=1 (ValueError" in tiny.stdout
+
+
+def test_cli_benchmark_factorial() -> None:
+    result = runner.invoke(app, ["benchmark-factorial", "200", "--runs", "1"])
+    assert result.exit_code == 0
+    assert "factorial_prime_swing:" in result.stdout
+    assert "runs=1" in result.stdout
+
+
 def test_interactive_session_help_and_quit() -> None:
     user_input = "help\nquit\n"
     result = runner.invoke(app, ["interactive"], input=user_input)
@@ -122,3 +223,179 @@ def test_benchmark_invalid_runs() -> None:
 
     with pytest.raises(ValueError):
         benchmark_sorts({"a": [1, 2]}, {"bubble": bubble_sort}, runs=0)
+
+
+def test_cli_benchmark_export_compare_and_trend(tmp_path) -> None:
+    history = tmp_path / "history.jsonl"
+    paths = []
+    for name in ("base.json", "new.json"):
+        path = tmp_path / name
+        result = runner.invoke(
+            app,
+            ["benchmark", "--runs", "1", "--size", "8", "--samples", "7", "--format", "json",
+             "--output", str(path), "--history", str(history)],
+        )
+        assert result.exit_code == 0
+        paths.append(path)
+    document = json.loads(paths[0].read_text())
+    assert document["config"]["size"] == 8
+    assert document["config"]["params"]["rand_int_array"] == {"seed": 7, "lo": -50, "hi": 50}
+    for cell in document["cells"]:
+        if "median" in cell:
+            assert len(cell["times"]) == cell["samples"]
+            assert cell["samples"] + cell["outliers"] == 7
+
+    compared = runner.invoke(app, ["compare", str(paths[0]), str(paths[0])])
+    assert compared.exit_code == 0
+    assert "замедлений: 0" in compared.stdout
+    # Фиксированные замеры: исход сравнения не зависит от шума и отброшенных выбросов.
+    for cell in document["cells"]:
+        if "median" in cell:
+            cell["times"] = [cell["median"] * (1 + index / 100) for index in range(7)]
+    paths[0].write_text(json.dumps(document))
+    for cell in document["cells"]:
+        if "median" in cell:
+            cell["median"] *= 10
+            cell["times"] = [value * 10 for value in cell["times"]]
+    paths[1].write_text(json.dumps(document))
+    gated = runner.invoke(app, ["compare", str(paths[0]), str(paths[1])])
+    assert gated.exit_code == 1
+    assert "regression" in gated.stdout
+
+    trend = runner.invoke(app, ["trend", str(history)])
+    assert trend.exit_code == 0
+    assert "bubble/rand_int_array: запусков 2" in trend.stdout
+
+    csv_result = runner.invoke(app, ["benchmark", "--runs", "1", "--size", "8", "--samples", "2", "--format", "csv"])
+    assert csv_result.stdout.startswith("dataset,algorithm,n,median")
+    assert runner.invoke(app, ["benchmark", "--format", "xml"]).exit_code != 0
+
+
+def test_cli_benchmark_isolated() -> None:
+    result = runner.invoke(
+        app, ["benchmark", "--isolated", "--workers", "2", "--timeout", "5", "--runs", "1", "--size", "8", "--samples", "2"]
+    )
+    assert result.exit_code == 0
+    assert "bubble:" in result.stdout
+    assert "среднее время" in result.stdout
+
+
+def test_cli_benchmark_memory_mode() -> None:
+    result = runner.invoke(app, ["benchmark", "--memory", "--runs", "1", "--size", "50", "--samples", "1"])
+    assert result.exit_code == 0
+    assert "память: пик" in result.stdout
+    csv_result = runner.invoke(
+        app, ["benchmark", "--memory", "--runs", "1", "--size", "50", "--samples", "1", "--format", "csv"]
+    )
+    assert "peak_bytes,net_blocks,bytes_per_element" in csv_result.stdout.splitlines()[0]
+
+
+def test_cli_profile_options(tmp_path) -> None:
+    result = runner.invoke(app, ["quick", "3", "1", "2", "--profile", str(tmp_path / "sort")])
+    assert result.exit_code == 0
+    assert "[1, 2, 3]" in result.stdout
+    assert (tmp_path / "sort" / "quick.pstats").exists()
+    assert (tmp_path / "sort" / "quick.collapsed").exists()
+
+    result = runner.invoke(
+        app, ["benchmark", "--runs", "1", "--size", "8", "--samples", "1", "--profile", str(tmp_path / "bench")]
+    )
+    assert result.exit_code == 0
+    assert "в compare()" in result.stdout
+    assert (tmp_path / "bench" / "heap-rand_int_array.pstats").exists()
+
+
+def test_cli_sort_file_input_and_output(tmp_path) -> None:
+    source = tmp_path / "input.csv"
+    source.write_text("5,3\n-1 4\n")
+    target = tmp_path / "sorted.bin"
+    result = runner.invoke(
+        app, ["radix", "--input", str(source), "--output", str(target), "--output-format", "int64"]
+    )
+    assert result.exit_code == 0
+    assert read_numbers(target, "int64") == [-1, 3, 4, 5]
+
+    result = runner.invoke(app, ["heap", "--input", str(target), "--input-format", "int64", "--output", "-"])
+    assert result.stdout.split() == ["-1", "3", "4", "5"]
+    result = runner.invoke(app, ["quick", "--input", "-"], input="0.5 0.25\n")
+    assert "[0.25, 0.5]" in result.stdout
+
+    assert runner.invoke(app, ["bubble"]).exit_code != 0
+    assert runner.invoke(app, ["bubble", "1", "--input", str(source)]).exit_code != 0
+    assert runner.invoke(app, ["bubble", "--input", str(source), "--input-format", "xml"]).exit_code != 0
+    source.write_text("1 2.5")
+    assert runner.invoke(app, ["counting", "--input", str(source)]).exit_code != 0
+    failed = runner.invoke(
+        app, ["heap", "--input", str(source), "--output", str(tmp_path / "o.bin"), "--output-format", "int64"]
+    )
+    assert failed.exit_code != 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["input.csv", "sorted.bin"]
+
+
+def test_cli_startup_budget() -> None:
+    result = runner.invoke(app, ["startup", "fibo 5", "--repeats", "1", "--budget-ms", "10000"])
+    assert result.exit_code == 0
+    assert "fibo 5: запуск" in result.stdout
+    assert "typer" in result.stdout
+    over = runner.invoke(app, ["startup", "fibo 5", "--repeats", "1", "--module-budget-ms", "0"])
+    assert over.exit_code == 1
+    assert "Превышен бюджет" in over.stdout
+
+
+def test_cli_benchmark_serve() -> None:
+    result = runner.invoke(app, ["benchmark-serve", "--requests", "40", "--concurrency", "4", "--size", "10", "--workers", "0"])
+    assert result.exit_code == 0
+    assert "запросов 40 (ошибок 0)" in result.stdout
+    assert "p99" in result.stdout
+    assert runner.invoke(app, ["client", "ping", "--address", "nonsense"]).exit_code != 0
+
+
+def test_cli_benchmark_ds() -> None:
+    args = ["benchmark-ds", "--ops", "200", "--samples", "1", "--target-time", "0", "--structure", "queue"]
+    result = runner.invoke(app, args + ["--trace", "alternating", "--trace", "min_queries"])
+    assert result.exit_code == 0
+    assert "B/элемент" in result.stdout and "оп/с" in result.stdout
+    assert "min_queries: не поддерживается" in result.stdout
+    document = json.loads(runner.invoke(app, args + ["--format", "json"]).stdout)
+    assert document["queue"]["traces"]["burst_drain"]["ops"] == 200
+    assert "error" in document["queue"]["traces"]["min_queries"]
+    assert runner.invoke(app, ["benchmark-ds", "--structure", "tree"]).exit_code != 0
+
+
+def test_cli_k_sorted() -> None:
+    assert runner.invoke(app, ["k-sorted", "2", "1", "3", "5", "4"]).stdout.strip() == "[1, 2, 3, 4, 5]"
+    assert runner.invoke(app, ["k-sorted", "--k", "1", "2", "1", "3", "5", "4"]).stdout.strip() == "[1, 2, 3, 4, 5]"
+    assert runner.invoke(app, ["k-sorted", "--k", "1", "3", "4", "5", "1"]).exit_code != 0
+
+
+def test_cli_unique_and_value_counts() -> None:
+    assert runner.invoke(app, ["unique", "3", "1", "3", "2", "1"]).stdout.strip() == "[1, 2, 3]"
+    result = runner.invoke(app, ["value-counts", "3", "1", "3", "2.5"])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["1: 1", "2.5: 1", "3: 2"]
+
+
+def test_cli_benchmark_sort_cache_flag() -> None:
+    result = runner.invoke(app, ["benchmark", "--size", "20", "--samples", "2", "--sort-cache", "--format", "json"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["config"]["sort_cache"] is True
+    served = runner.invoke(app, ["benchmark-serve", "--requests", "40", "--workers", "0", "--size", "10", "--cache-mib", "1"])
+    assert "кэш: попаданий" in served.stdout
+
+
+def test_cli_benchmark_records_adversarial_params() -> None:
+    result = runner.invoke(app, ["benchmark", "--runs", "1", "--samples", "1", "--size", "30", "--suite", "all", "--format", "json"])
+    config = json.loads(result.stdout)["config"]
+    assert config["seeds"]["bucket_skew"] == 4 and config["seeds"]["rand_int_array"] == 7
+    assert config["params"]["sorted_with_tail"] == {"seed": 10, "tail": 3}
+    assert config["params"]["sawtooth"] == {"teeth": 4}
+    assert set(config["params"]) == set(config["seeds"]) | {"reverse_sorted", "quick_sort_killer", "organ_pipe", "sawtooth"}
+
+
+def test_benchmark_reports_recursion_error_as_stack_overflow() -> None:
+    arrays = {"quick_sort_killer": quick_sort_killer(3000)}
+    results = run_benchmark(arrays, {"quick": quick_sort}, runs=1, samples=1, warmup=0)
+    assert isinstance(results["quick_sort_killer"]["quick"], RecursionError)
+    lines = format_benchmark_lines(arrays, results, 1, 1)
+    assert any(line.startswith("  quick: переполнение стека") for line in lines)
+    assert not any("не поддерживается" in line for line in lines)
@@ -0,0 +1,51 @@
+import pytest
+
+from src.memo import MemoCache, chunked_memo
+
+
+def test_memo_cache_lru_eviction_and_stats() -> None:
+    cache = MemoCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.get("b", "missing") == "missing"
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 1, "entries": 2, "bytes": cache.total_bytes}
+    cache.reset_stats()
+    assert cache.stats()["hits"] == 0
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_memo_cache_byte_limit_keeps_latest_entry() -> None:
+    cache = MemoCache(max_entries=None, max_bytes=100)
+    cache.put(1, 1)
+    cache.put(2, 10**1000)
+    assert list(cache.entries) == [2]
+    cache.resize(max_entries=None, max_bytes=None)
+    cache.put(3, 3)
+    assert len(cache) == 2
+    with pytest.raises(ValueError):
+        MemoCache(max_entries=0)
+    with pytest.raises(ValueError):
+        MemoCache(max_bytes=0)
+
+
+def test_chunked_memo_warms_without_deep_recursion() -> None:
+    cache = MemoCache(max_entries=8)
+
+    @chunked_memo(cache, chunk=16)
+    def triangular(n: int) -> int:
+        return 0 if n == 0 else n + triangular(n - 1)
+
+    assert triangular(20000) == 20000 * 20001 // 2
+    assert len(cache) == 8
+    triangular.cache_clear()
+    assert len(cache) == 0
+    triangular.warm(100)
+    assert 100 in cache
+    with pytest.raises(ValueError):
+        chunked_memo(cache, chunk=1)
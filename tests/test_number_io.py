@@ -0,0 +1,86 @@
+import io
+import struct
+
+import pytest
+
+from src.number_io import (
+    iter_binary_chunks,
+    iter_text_chunks,
+    parse_token,
+    parse_tokens,
+    read_numbers,
+    write_numbers,
+    write_numbers_to,
+)
+
+
+def test_parse_tokens_int_fast_path_and_fallback() -> None:
+    assert parse_token("12345678901234567890") == 12345678901234567890
+    assert parse_token("1e3") == 1000
+    assert parse_token("0.5") == 0.5
+    assert parse_tokens(["1", "-2", "3"]) == [1, -2, 3]
+    assert parse_tokens(["1", "2.5", "3.0"]) == [1, 2.5, 3]
+    with pytest.raises(ValueError):
+        parse_tokens(["1", "abc"])
+
+
+def test_iter_text_chunks_handles_boundaries_and_csv() -> None:
+    text = "10,20\n30 40;50\r\n\n60"
+    for chunk_size in (1, 3, 7, 1000):
+        chunks = list(iter_text_chunks(io.StringIO(text), chunk_size))
+        assert [value for chunk in chunks for value in chunk] == [10, 20, 30, 40, 50, 60]
+    assert list(iter_text_chunks(io.StringIO(""))) == []
+
+
+def test_binary_round_trip(tmp_path) -> None:
+    path = tmp_path / "values.bin"
+    assert write_numbers(path, [3, -1, 2**40], "int64", chunk_size=2) == 3
+    assert path.read_bytes() == struct.pack("<3q", 3, -1, 2**40)
+    assert read_numbers(path, "int64", chunk_size=2) == [3, -1, 2**40]
+
+    write_numbers(path, [0.5, -1.25], "float64")
+    assert read_numbers(path, "float64") == [0.5, -1.25]
+
+    path.write_bytes(b"\x00" * 9)
+    with pytest.raises(ValueError):
+        read_numbers(path, "int64")
+    with pytest.raises(ValueError):
+        write_numbers(path, [2**70], "int64")
+    with pytest.raises(ValueError):
+        read_numbers(path, "int32")
+    assert [list(chunk) for chunk in iter_binary_chunks(io.BytesIO(struct.pack("<3q", 1, 2, 3)), "int64", 2)] == [
+        [1, 2],
+        [3],
+    ]
+
+
+def test_write_text_incrementally() -> None:
+    class CountingStream(io.StringIO):
+        writes = 0
+
+        def write(self, text: str) -> int:
+            self.writes += 1
+            return super().write(text)
+
+    stream = CountingStream()
+    assert write_numbers_to(stream, range(10), "text", chunk_size=4) == 10
+    assert stream.writes == 3
+    assert stream.getvalue().split() == [str(value) for value in range(10)]
+    text_stream = io.StringIO()
+    write_numbers_to(text_stream, [0.1, 2], "text")
+    assert read_numbers_from_text(text_stream.getvalue()) == [0.1, 2]
+
+
+def read_numbers_from_text(text: str) -> list:
+    return [value for chunk in iter_text_chunks(io.StringIO(text)) for value in chunk]
+
+
+def test_write_numbers_keeps_target_on_error(tmp_path) -> None:
+    target = tmp_path / "values.bin"
+    assert write_numbers(target, [1, 2], "int64") == 2
+    with pytest.raises(ValueError):
+        write_numbers(target, [3, 0.5], "int64")
+    assert read_numbers(target, "int64") == [1, 2]
+    assert [path.name for path in tmp_path.iterdir()] == ["values.bin"]
+    assert write_numbers(tmp_path / "fresh.txt", iter([0.5, 7])) == 2
+    assert read_numbers(tmp_path / "fresh.txt") == [0.5, 7]
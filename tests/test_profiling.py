@@ -0,0 +1,38 @@
+import pstats
+
+import pytest
+
+from src.profiling import collapsed_stacks, function_share, hot_functions, profile_call, profile_summary, write_profile
+from src.sorting import bubble_sort, quick_sort
+
+
+def test_profile_call_and_hot_functions() -> None:
+    result, stats = profile_call(bubble_sort, [5, 3, 1, 4, 2], repeat=3)
+    assert result == [1, 2, 3, 4, 5]
+    hot = hot_functions(stats, limit=2)
+    assert len(hot) == 2
+    assert {item["function"].split()[0] for item in hot} == {"bubble_sort", "compare"}
+    assert hot[0]["own"] >= hot[1]["own"]
+    assert 0 < function_share(stats, "compare", "sorting.py") < 1
+    assert function_share(stats, "missing") == 0.0
+    assert "в compare()" in profile_summary(stats)[0]
+    with pytest.raises(ValueError):
+        profile_call(sorted, [], repeat=0)
+
+
+def test_collapsed_stacks_follow_call_graph() -> None:
+    _, stats = profile_call(quick_sort, list(range(200, 0, -1)))
+    stacks = collapsed_stacks(stats)
+    assert any(stack.startswith("quick_sort (sorting.py") and "compare (sorting.py" in stack for stack in stacks)
+    own_total = sum(entry[2] for entry in stats.stats.values())  # type: ignore[attr-defined]
+    assert sum(stacks.values()) <= own_total * 1.01
+
+
+def test_write_profile(tmp_path) -> None:
+    _, stats = profile_call(bubble_sort, [3, 2, 1])
+    stats_path, collapsed_path = write_profile(stats, tmp_path / "out", "bubble/ints")
+    assert stats_path.name == "bubble_ints.pstats"
+    assert pstats.Stats(str(stats_path)).total_calls > 0  # type: ignore[attr-defined]
+    for line in collapsed_path.read_text().splitlines():
+        stack, value = line.rsplit(" ", 1)
+        assert stack and int(value) > 0
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from src.results import (
+    append_history,
+    build_results,
+    compare_results,
+    dumps_csv,
+    dumps_json,
+    history_trends,
+    load_history,
+    load_results,
+    mann_whitney_p,
+)
+
+
+def make_document(times_by_cell: dict[tuple[str, str], list[float]]) -> dict:
+    results: dict[str, dict] = {}
+    for (dataset, algorithm), times in times_by_cell.items():
+        ordered = sorted(times)
+        results.setdefault(dataset, {})[algorithm] = {"median": ordered[len(ordered) // 2], "times": times}
+    return build_results(results, {dataset: 10 for dataset in results}, {"suite": "default"})
+
+
+def test_build_results_and_export(tmp_path) -> None:
+    results: dict[str, dict[str, dict | Exception]] = {
+        "ints": {"bubble": {"median": 1.0, "min": 0.9, "times": [1.0, 0.9]}, "bucket": ValueError("плохо")}
+    }
+    document = build_results(results, {"ints": 3}, {"runs": 1})
+    assert document["environment"]["python"]
+    assert document["config"] == {"runs": 1}
+    assert {"dataset": "ints", "algorithm": "bucket", "n": 3, "error": "плохо"} in document["cells"]
+
+    path = tmp_path / "result.json"
+    path.write_text(dumps_json(document))
+    assert load_results(path)["cells"] == document["cells"]
+    path.write_text(json.dumps({"schema": 999}))
+    with pytest.raises(ValueError):
+        load_results(path)
+
+    lines = dumps_csv(document).splitlines()
+    assert lines[0].startswith("dataset,algorithm,n,median")
+    assert lines[1].startswith("ints,bubble,3,1.0,0.9")
+    assert lines[2].endswith(",плохо")
+
+
+def test_mann_whitney_p() -> None:
+    assert mann_whitney_p([1.0] * 5, [1.0] * 5) == 1.0
+    assert mann_whitney_p([], [1.0]) == 1.0
+    assert mann_whitney_p([1, 2, 3, 4, 5, 6, 7], [11, 12, 13, 14, 15, 16, 17]) < 0.01
+    assert mann_whitney_p([1, 3, 5, 7, 9], [2, 4, 6, 8, 10]) > 0.5
+
+
+def test_compare_results_statuses() -> None:
+    fast = [1.0, 1.01, 0.99, 1.02, 0.98, 1.0, 1.01]
+    slow = [value * 1.5 for value in fast]
+    baseline = make_document({("ints", "bubble"): fast, ("ints", "quick"): slow, ("ints", "heap"): fast})
+    current = make_document({("ints", "bubble"): slow, ("ints", "quick"): fast, ("ints", "heap"): fast})
+    statuses = {item["algorithm"]: item["status"] for item in compare_results(baseline, current)}
+    assert statuses == {"bubble": "regression", "quick": "improvement", "heap": "unchanged"}
+    assert all(item["status"] == "unchanged" for item in compare_results(baseline, current, threshold=0.6))
+
+
+def test_history_append_and_trends(tmp_path) -> None:
+    path = tmp_path / "history.jsonl"
+    for factor in (1.0, 1.1, 1.21):
+        count = append_history(path, make_document({("ints", "bubble"): [factor]}), max_entries=2)
+    assert count == 2
+    history = load_history(path)
+    assert [entry["medians"]["bubble/ints"] for entry in history] == [1.1, 1.21]
+    trend = history_trends(history)["bubble/ints"]
+    assert trend["runs"] == 2 and trend["last"] == 1.21
+    assert trend["change"] == pytest.approx(0.1)
+    assert trend["per_run"] == pytest.approx(0.1)
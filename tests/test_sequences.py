@@ -1,12 +1,32 @@
+import math
+
 import pytest
 
-from src.sequences import factorial, factorial_recursive, fibo, fibo_recursive
+from src.sequences import (
+    SMALL_FACTORIALS,
+    clear_sequence_caches,
+    factorial,
+    factorial_cache,
+    factorial_fast,
+    factorial_mod,
+    factorial_prime_swing,
+    factorial_recursive,
+    fibo,
+    fibo_cache,
+    fibo_fast,
+    fibo_mod,
+    fibo_range,
+    fibo_recursive,
+    pisano_period,
+)
 
 
 @pytest.mark.parametrize("value,expected", [(0, 1), (1, 1), (5, 120), (7, 5040)])
 def test_factorial(value: int, expected: int) -> None:
     assert factorial(value) == expected
     assert factorial_recursive(value) == expected
+    assert factorial_fast(value) == expected
+    assert factorial_prime_swing(value) == expected
 
 
 @pytest.mark.parametrize("value", [-1, -10])
@@ -15,12 +35,19 @@ def test_factorial_negative(value: int) -> None:
         factorial(value)
     with pytest.raises(ValueError):
         factorial_recursive(value)
+    with pytest.raises(ValueError):
+        factorial_fast(value)
+    with pytest.raises(ValueError):
+        factorial_prime_swing(value)
+    with pytest.raises(ValueError):
+        factorial_mod(value, 7)
 
 
 @pytest.mark.parametrize("value,expected", [(0, 0), (1, 1), (2, 1), (10, 55)])
 def test_fibonacci(value: int, expected: int) -> None:
     assert fibo(value) == expected
     assert fibo_recursive(value) == expected
+    assert fibo_fast(value) == expected
 
 
 def test_fibonacci_negative() -> None:
@@ -28,9 +55,66 @@ def test_fibonacci_negative() -> None:
         fibo_recursive(-5)
     with pytest.raises(ValueError):
         fibo(-3)
+    with pytest.raises(ValueError):
+        fibo_fast(-1)
+    with pytest.raises(ValueError):
+        fibo_mod(-1, 10)
+    with pytest.raises(ValueError):
+        fibo_mod(5, 0)
+    with pytest.raises(ValueError):
+        fibo_range(-1, 3)
 
 
 def test_sequences_consistency() -> None:
     for value in range(0, 10):
         assert factorial(value) == factorial_recursive(value)
         assert fibo(value) == fibo_recursive(value)
+
+
+def test_fibo_fast_matches_iterative() -> None:
+    for value in (100, 257, 1000, 4097):
+        assert fibo_fast(value) == fibo(value)
+
+
+def test_fibo_mod_and_pisano() -> None:
+    assert pisano_period(1) == 1
+    assert pisano_period(10) == 60
+    for modulus in (1, 2, 10, 1000, 10**9 + 7):
+        for value in (0, 1, 59, 60, 1234):
+            assert fibo_mod(value, modulus) == fibo(value) % modulus
+    assert fibo_mod(10**18 + 5, 10) == fibo((10**18 + 5) % 60) % 10
+
+
+def test_fibo_range() -> None:
+    assert list(fibo_range(0, 8)) == [0, 1, 1, 2, 3, 5, 8, 13]
+    assert list(fibo_range(300, 305)) == [fibo(value) for value in range(300, 305)]
+    assert list(fibo_range(5, 5)) == []
+
+
+@pytest.mark.parametrize("value", [255, 256, 1000, 4097])
+def test_fast_factorials_match_math(value: int) -> None:
+    assert factorial_fast(value) == math.factorial(value)
+    assert factorial_prime_swing(value) == math.factorial(value)
+    assert SMALL_FACTORIALS[20] == math.factorial(20)
+
+
+def test_factorial_fast_with_workers() -> None:
+    assert factorial_fast(3000, workers=2) == math.factorial(3000)
+
+
+def test_factorial_mod() -> None:
+    assert factorial_mod(10, 7) == 0
+    assert factorial_mod(6, 1000) == 720
+    assert factorial_mod(300, 10**9 + 7) == math.factorial(300) % (10**9 + 7)
+    with pytest.raises(ValueError):
+        factorial_mod(5, 0)
+
+
+def test_recursive_cold_call_for_large_n() -> None:
+    clear_sequence_caches()
+    assert factorial_recursive(5000) == math.factorial(5000)
+    assert fibo_recursive(20000) == fibo(20000)
+    assert factorial_cache.max_entries is not None and len(factorial_cache) <= factorial_cache.max_entries
+    assert fibo_cache.stats()["evictions"] > 0
+    clear_sequence_caches()
+    assert len(fibo_cache) == 0
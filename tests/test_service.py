@@ -0,0 +1,173 @@
+import asyncio
+import math
+import threading
+
+import pytest
+
+from src.service import (
+    FRAME,
+    MAX_BUBBLE_N,
+    MAX_COUNTING_SPAN,
+    MAX_SEQUENCE_N,
+    AsyncServiceClient,
+    ServiceClient,
+    SortService,
+    decode_body,
+    encode_frame,
+    load_benchmark,
+    parse_address,
+)
+from src.sort_cache import SortCache
+
+
+def test_protocol_round_trip() -> None:
+    frame = encode_frame({"id": 1, "op": "sort"}, [3, -1, 2**40])
+    body_length, header_length = FRAME.unpack(frame[: FRAME.size])
+    assert body_length == len(frame) - FRAME.size
+    header, values = decode_body(frame[FRAME.size :], header_length)
+    assert header == {"id": 1, "op": "sort", "dtype": "int64"}
+    assert values == [3, -1, 2**40]
+
+    frame = encode_frame({"id": 2}, [0.5, 1])
+    assert decode_body(frame[FRAME.size :], FRAME.unpack(frame[: FRAME.size])[1]) == (
+        {"id": 2, "dtype": "float64"},
+        [0.5, 1.0],
+    )
+    frame = encode_frame({"id": 3, "result": 10**30})
+    assert decode_body(frame[FRAME.size :], FRAME.unpack(frame[: FRAME.size])[1])[0]["result"] == 10**30
+    with pytest.raises(ValueError):
+        encode_frame({}, [2**70])
+    raw = b"[1, 2]"
+    with pytest.raises(ValueError, match="JSON-объектом"):
+        decode_body(raw, len(raw))
+
+
+def test_parse_address() -> None:
+    assert parse_address("unix:/tmp/sort.sock") == ("unix", "/tmp/sort.sock")
+    assert parse_address("localhost:9000") == ("tcp", ("localhost", 9000))
+    assert parse_address(":9000") == ("tcp", ("127.0.0.1", 9000))
+    with pytest.raises(ValueError):
+        parse_address("localhost")
+
+
+def test_service_operations_over_unix_socket(tmp_path) -> None:
+    address = f"unix:{tmp_path / 'sort.sock'}"
+
+    def use_client(bound: str) -> None:
+        with ServiceClient(bound) as client:
+            assert client.sort([3, 1, 2]) == [1, 2, 3]
+            assert client.sort([0.5, 0.25], "bucket") == [0.25, 0.5]
+            assert client.sort([170, 45, 75], "radix", base=16) == [45, 75, 170]
+            assert client.call("fibo", n=90) == 2880067194370816120
+            assert client.call("factorial_mod", n=10, m=7) == 0
+            assert client.call("stack_push", name="s", value=4) == 1
+            assert client.call("stack_push", name="s", value=2) == 2
+            assert client.call("stack_min", name="s") == 2
+            assert client.call("stack_pop", name="s") == 2
+            assert client.call("queue_len") == 0
+            for op in ("queue_dequeue", "unknown", "fibo"):
+                with pytest.raises(RuntimeError):
+                    client.call(op)
+            with pytest.raises(RuntimeError):
+                client.sort([0.5], "counting")
+            assert client.call("factorial", n=2000) == math.factorial(2000)
+            for values, algorithm in (([2**62, -(2**62)], "counting"), ([0, MAX_COUNTING_SPAN], "counting"), (list(range(MAX_BUBBLE_N + 1)), "bubble")):
+                with pytest.raises(RuntimeError, match="Ошибка:"):
+                    client.sort(values, algorithm)
+            assert client.sort([2, MAX_COUNTING_SPAN - 1, 0], "counting") == [0, 2, MAX_COUNTING_SPAN - 1]
+            bad_calls: list[tuple[str, dict[str, object]]] = [
+                ("factorial", {"n": MAX_SEQUENCE_N + 1}),
+                ("factorial_mod", {"n": 10**9, "m": 10**12}),
+                ("fibo", {"n": "5"}),
+            ]
+            for op, params in bad_calls:
+                with pytest.raises(RuntimeError, match="Ошибка:"):
+                    client.call(op, **params)
+            assert client.call("fibo_mod", n=10**18, m=10) == 5
+            stats = client.stats()
+            assert stats["errors"] == 10
+            assert stats["ops"]["sort"]["count"] == 8
+            assert stats["ops"]["sort"]["p99"] >= stats["ops"]["sort"]["p50"] > 0
+
+    async def scenario() -> None:
+        async with SortService(workers=0) as service:
+            bound = await service.start(address)
+            await asyncio.to_thread(use_client, bound)
+
+    asyncio.run(scenario())
+    assert not (tmp_path / "sort.sock").exists()
+
+
+def test_service_batches_and_backpressure() -> None:
+    async def scenario() -> dict:
+        async with SortService(workers=1, max_pending=4, batch_size=8, batch_delay=0.01) as service:
+            bound = await service.start("127.0.0.1:0")
+            client = await AsyncServiceClient.connect(bound)
+            inputs = [list(range(size, 0, -1)) for size in range(1, 41)]
+            results = await asyncio.gather(*(client.request("sort", values) for values in inputs))
+            await client.close()
+            assert [values for _, values in results] == [sorted(values) for values in inputs]
+            return service.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["requests"] == 40
+    assert stats["peak_in_flight"] <= 4
+    assert stats["batches"] < 40
+
+
+def test_load_benchmark_reports_latency() -> None:
+    report = asyncio.run(load_benchmark(requests=60, concurrency=6, connections=2, size=20, service_options={"workers": 0}))
+    assert report["requests"] == 60 and report["errors"] == 0
+    assert report["throughput"] > 0
+    assert 0 < report["p50"] <= report["p99"] <= report["max"]
+    assert report["server"]["requests"] == 60
+    assert report["server"]["cache"] is None
+    with pytest.raises(ValueError):
+        asyncio.run(load_benchmark(requests=0))
+
+
+def test_service_sort_cache_answers_repeats() -> None:
+    options = {"workers": 0, "cache_bytes": 1 << 20, "batch_delay": 0.0}
+    report = asyncio.run(load_benchmark(requests=40, concurrency=1, connections=1, size=20, service_options=options))
+    assert report["errors"] == 0
+    cache = report["server"]["cache"]
+    assert cache["misses"] == 16 and cache["hits"] == 24
+    assert report["server"]["batches"] == 16
+
+
+def test_async_client_fails_waiting_requests_on_bad_frame() -> None:
+    async def broken_server(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readexactly(FRAME.size)
+        header = b"[1, 2]"
+        writer.write(FRAME.pack(len(header), len(header)) + header)
+        await writer.drain()
+        await reader.read()
+        writer.close()
+
+    async def scenario() -> None:
+        server = await asyncio.start_server(broken_server, "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        async with server:
+            client = await AsyncServiceClient.connect(f"{host}:{port}")
+            with pytest.raises(ConnectionError, match="JSON-объектом"):
+                await asyncio.wait_for(client.request("queue_len"), 5)
+            with pytest.raises(ConnectionError):
+                await client.request("queue_len")
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_service_sort_cache_runs_off_the_event_loop(monkeypatch) -> None:
+    threads = []
+    lookup = SortCache.lookup
+
+    def recording_lookup(self, *args):
+        threads.append(threading.current_thread().name)
+        return lookup(self, *args)
+
+    monkeypatch.setattr(SortCache, "lookup", recording_lookup)
+    options = {"workers": 0, "cache_bytes": 1 << 20, "batch_delay": 0.0}
+    report = asyncio.run(load_benchmark(requests=4, concurrency=1, connections=1, size=20, service_options=options))
+    assert report["errors"] == 0
+    assert len(threads) == 4 and all(name.startswith("sort-cache") for name in threads)
@@ -0,0 +1,101 @@
+import sys
+from array import array
+
+import pytest
+
+from src.benchmark import measure
+from src.sort_cache import SortCache, _Entry, caching_disabled, caching_enabled, fingerprint, set_caching, typed_buffer
+from src.sorting import counting_sort, quick_sort, radix_sort
+
+
+def counted(func):
+    calls = []
+
+    def wrapper(values, **options):
+        calls.append(len(values))
+        return func(values, **options)
+
+    return wrapper, calls
+
+
+def buffer(values: list) -> array:
+    packed = typed_buffer(values)
+    assert packed is not None
+    return packed
+
+
+def test_typed_buffer_and_fingerprint() -> None:
+    assert buffer([3, 1, 2]).typecode == "q"
+    assert buffer([0.5, 1.5]).typecode == "d"
+    assert typed_buffer([1, 2.5]) is None
+    assert typed_buffer([True, False]) is None
+    assert typed_buffer([2**70]) is None
+    assert typed_buffer([]) is None
+    assert fingerprint(buffer([1, 2])) == fingerprint(buffer([1, 2]))
+    assert fingerprint(buffer([1, 2])) != fingerprint(buffer([2, 1]))
+    assert fingerprint(buffer([1, 2]))[:2] == ("q", 2)
+
+
+def test_sort_cache_hits_misses_and_bypass() -> None:
+    cache = SortCache()
+    sort, calls = counted(quick_sort)
+    cached = cache.wrap(sort)
+    first = cached([3, 1, 2])
+    second = cached([3, 1, 2])
+    assert first == second == [1, 2, 3]
+    assert first is not second
+    assert calls == [3]
+    assert cached([3, 1, 2], key=lambda value: -value) == [3, 2, 1]
+    assert cached(["b", "a"]) == ["a", "b"]
+    assert calls == [3, 3, 2]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["bypassed"] == 2
+    radix = cache.wrap(radix_sort)
+    assert radix([10, 5], base=2) == radix([10, 5], base=10) == [5, 10]
+    assert cache.stats()["entries"] == 3
+
+
+def test_sort_cache_validates_on_hit_and_respects_budget() -> None:
+    one_entry = sys.getsizeof(_Entry(buffer([3, 1, 2]), buffer([1, 2, 3])))
+    cache = SortCache(max_bytes=one_entry)
+    cache.sort(counting_sort, [3, 1, 2])
+    cache.sort(counting_sort, [6, 5, 4])
+    assert cache.stats()["entries"] == 1 and cache.stats()["evictions"] == 1
+    cache.sort(counting_sort, [9, 8, 7, 6])
+    assert cache.stats()["oversized"] == 1 and cache.stats()["entries"] == 1
+    assert cache.stats()["bytes"] <= one_entry
+    (cache_key, entry), = cache.memo.entries.items()
+    entry.source = typed_buffer([9, 9, 9])
+    assert cache.sort(counting_sort, [6, 5, 4]) == [4, 5, 6]
+    assert cache.stats()["collisions"] == 1 and cache.stats()["hits"] == 0
+    with pytest.raises(ValueError):
+        SortCache(max_bytes=0)
+
+
+def test_sort_cache_hits_inputs_with_nan() -> None:
+    cache = SortCache()
+    sort, calls = counted(quick_sort)
+    values = [float("nan"), 0.5]
+    assert str(cache.sort(sort, values)) == str(cache.sort(sort, list(values)))
+    assert calls == [2]
+    assert cache.stats()["hits"] == 1 and cache.stats()["collisions"] == 0
+
+
+def test_caching_switch_and_measure_disable_cache() -> None:
+    cache = SortCache()
+    sort, calls = counted(quick_sort)
+    cached = cache.wrap(sort)
+    with caching_disabled():
+        assert not caching_enabled()
+        cached([2, 1])
+        cached([2, 1])
+    assert caching_enabled()
+    assert calls == [2, 2] and cache.stats()["bypassed"] == 2
+    previous = set_caching(False)
+    assert previous is True
+    set_caching(True)
+    measure(cached, [2, 1], runs=3, samples=2, warmup=1)
+    assert len(calls) == 2 + 1 + 3 * 2
+    measure(cached, [2, 1], runs=3, samples=2, warmup=1, sort_cache=True)
+    assert len(calls) == 2 + 1 + 3 * 2 + 1
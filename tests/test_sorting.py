@@ -1,13 +1,23 @@
+import random
+from array import array
+from collections import Counter
 from functools import cmp_to_key
 import pytest
 
 from src.sorting import (
+    adaptive_sort,
     bubble_sort,
     bucket_sort,
     counting_sort,
+    estimate_displacement,
+    group_by_sorted,
     heap_sort,
+    iter_k_sorted,
+    k_sorted_sort,
     quick_sort,
     radix_sort,
+    sorted_unique,
+    value_counts,
 )
 
 
@@ -92,3 +102,71 @@ def test_bucket_sort_non_numeric_raises() -> None:
 def test_counting_sort_validation() -> None:
     with pytest.raises(ValueError):
         counting_sort([1, 2.5, 3])
+
+
+def k_displaced(n: int, k: int, seed: int = 0) -> list[int]:
+    generator = random.Random(seed)
+    return sorted(range(n), key=lambda index: index + generator.random() * k)
+
+
+def test_k_sorted_sort_and_stream() -> None:
+    data = k_displaced(500, 10)
+    assert k_sorted_sort(data, 10) == sorted(data)
+    descending = [-value for value in data]
+    assert k_sorted_sort(descending, 10, key=lambda x: -x) == sorted(descending, reverse=True)
+    by_cmp = k_sorted_sort(data, 10, cmp=lambda left, right: (left > right) - (left < right))
+    assert by_cmp == sorted(data)
+    stream = iter_k_sorted(iter(data), 10)
+    assert next(stream) == 0
+    assert list(stream) == list(range(1, 500))
+    assert k_sorted_sort([], 3) == []
+    assert k_sorted_sort([1, 2, 2, 3], 0) == [1, 2, 2, 3]
+
+
+def test_k_sorted_sort_detects_larger_displacement() -> None:
+    with pytest.raises(ValueError):
+        k_sorted_sort([2, 3, 4, 5, 1], 1)
+    with pytest.raises(ValueError):
+        k_sorted_sort([1, 2], -1)
+
+
+def test_estimate_displacement_and_adaptive_sort() -> None:
+    data = k_displaced(5000, 20, seed=2)
+    estimate = estimate_displacement(data)
+    assert 0 < estimate <= 40
+    assert estimate_displacement(list(range(100))) == 0
+    assert estimate_displacement([3, 2, 1]) == 2
+    assert adaptive_sort(data) == sorted(data)
+    shuffled = list(range(300))
+    random.Random(5).shuffle(shuffled)
+    assert adaptive_sort(shuffled) == list(range(300))
+    assert adaptive_sort(["b", "a", "c"], cmp=lambda left, right: (left > right) - (left < right)) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [3, -1, 3, 0, -1, 3],
+        [10**12, -(10**12), 5, 5, 10**12],
+        [0.5, 0.25, 0.5, 1.5],
+        [],
+    ],
+)
+def test_unique_and_value_counts_match_counter(data) -> None:
+    expected = Counter(data)
+    assert sorted_unique(data) == sorted(expected)
+    distinct, counts = value_counts(data)
+    assert isinstance(counts, array) and counts.typecode == "q"
+    assert distinct == sorted(expected)
+    assert list(counts) == [expected[value] for value in distinct]
+
+
+def test_group_by_sorted_offsets() -> None:
+    words = ["pear", "apple", "fig", "kiwi", "plum"]
+    ordered, offsets = group_by_sorted(words, key=len)
+    assert ordered == ["fig", "pear", "kiwi", "plum", "apple"]
+    assert list(offsets) == [0, 1, 4, 5]
+    by_cmp = group_by_sorted(words, cmp=lambda left, right: (len(left) > len(right)) - (len(left) < len(right)))
+    assert by_cmp == (ordered, offsets)
+    assert value_counts(words, key=len) == (["fig", "pear", "apple"], array("q", [1, 3, 1]))
+    assert group_by_sorted([]) == ([], array("q", [0]))